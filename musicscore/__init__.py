@@ -1,23 +1,60 @@
-from musicscore.accidental import *
-from musicscore.beat import *
-from musicscore.chord import *
-from musicscore.clef import *
-from musicscore.musictree import *
-from musicscore.dynamics import *
-from musicscore.key import *
-from musicscore.layout import *
-from musicscore.lyrics import *
-from musicscore.measure import *
-from musicscore.metronome import *
-from musicscore.midi import *
-from musicscore.note import *
-from musicscore.part import *
-from musicscore.quarterduration import *
-from musicscore.score import *
-from musicscore.staff import *
-from musicscore.time import *
-from musicscore.voice import *
-from musicscore.simpleformat import *
+"""
+The names of all modules below are available in this namespace, for example ``from musicscore import Score``. Modules
+are imported on first access of one of their names, so that ``import musicscore`` does not import musicxml until it is
+needed.
+"""
+import importlib
 
+# module -> names which are exported by ``from musicscore import *``
+_EXPORTS = {
+    'accidental': ['STANDARD', 'FLAT', 'SHARP', 'ENHARMONIC', 'FORCESHARP', 'FORCEFLAT', 'SIGNS', 'Accidental'],
+    'beat': ['Beat', 'beam_chord_group', 'get_chord_group_subdivision', 'get_quantization_cache_info',
+             'clear_quantization_caches'],
+    'chord': ['Chord', 'Rest', 'GraceChord'],
+    'clef': ['Clef', 'TrebleClef', 'BassClef', 'AltoClef', 'TenorClef'],
+    'musictree': ['MusicTree'],
+    'dynamics': ['DYNAMICS', 'Dynamics'],
+    'key': ['Key'],
+    'layout': ['PAGE_MARGINS', 'PAGE_SIZES', 'SYSTEM_MARGINS', 'SYSTEM_LAYOUT', 'STAFF_LAYOUT', 'SCALING', 'Margins',
+               'Scaling', 'PageLayout', 'SystemLayout', 'StaffLayout'],
+    'lyrics': ['LyricsWrongNumberOfChordsError', 'Lyrics'],
+    'measure': ['Measure', 'generate_measures'],
+    'metronome': ['QuarterDurationIsNotWritable', 'MetronomeWrongBeatUnitError', 'XMLWrapper', 'XMLMetronome',
+                  'XMLBeatUnitDot', 'XMLSound', 'Metronome'],
+    'midi': ['Midi', 'MidiNote', 'C', 'D', 'E', 'F', 'G', 'A', 'B', 'midi_to_frequency', 'frequency_to_midi',
+             'get_accidental_mode'],
+    'note': ['Note', 'tie', 'untie'],
+    'part': ['IdRegistry', 'get_current_id_registry', 'Id', 'ScorePart', 'Part'],
+    'quarterduration': ['QuarterDuration', 'QuarterDurationMixin'],
+    'score': ['TITLE', 'SUBTITLE', 'POSSIBLE_SUBDIVISIONS', 'Score'],
+    'staff': ['Staff'],
+    'time': ['Time', 'flatten_times', 'CONVERSION_DICTIONARY'],
+    'voice': ['Voice'],
+    'simpleformat': ['SimpleFormatException', 'dToX', 'xToD', 'SimpleFormat', 'ColumnarSimpleFormat'],
+}
 
+_MODULE_NAMES = {name: module_name for module_name, names in _EXPORTS.items() for name in names}
 
+__all__ = list(_MODULE_NAMES)
+
+
+def __getattr__(name):
+    if name.startswith('__'):
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    module_name = _MODULE_NAMES.get(name)
+    if module_name:
+        value = getattr(importlib.import_module(f'{__name__}.{module_name}'), name)
+    else:
+        # Other names can only be submodules, e.g. musicscore.util
+        try:
+            value = importlib.import_module(f'{__name__}.{name}')
+        except ModuleNotFoundError as err:
+            if err.name != f'{__name__}.{name}':
+                raise
+            raise AttributeError(f"module '{__name__}' has no attribute '{name}'") from None
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -2,8 +2,8 @@ from typing import Optional, Union
 
 from musicxml.xmlelement.xmlelement import XMLAccidental
 
-from musicscore.musictree import MusicTree
-from musicscore.xmlwrapper import XMLWrapper
+from musicscore.musictree import MusicTree, _NodeKind
+from musicscore.xmlwrapper import XMLWrapper, _create_xml_element
 
 __all__ = ['STANDARD', 'FLAT', 'SHARP', 'ENHARMONIC', 'FORCESHARP', 'FORCEFLAT', 'SIGNS', 'Accidental']
 #:
@@ -186,6 +186,32 @@ SIGNS = {-2: 'flat-flat',
          2: 'double-sharp'
          }
 
+_PITCH_PARAMETERS_BY_MODE = {'standard': STANDARD, 'flat': FLAT, 'sharp': SHARP, 'enharmonic': ENHARMONIC,
+                             'force-sharp': FORCESHARP, 'force-flat': FORCEFLAT}
+# Number of quarter tones up to the highest permitted midi value (127.5).
+_NUMBER_OF_QUARTER_TONES = 256
+
+
+def _calculate_pitch_parameters(mode, midi_value):
+    output = _PITCH_PARAMETERS_BY_MODE[mode][midi_value % 12]
+    return output[0], output[1], output[2] + (int(midi_value // 12)) - 1
+
+
+# mode -> tuple of (step, alter, octave) indexed by quarter tones (midi_value * 2).
+_PITCH_PARAMETERS_TABLE = {
+    mode: (None,) + tuple(_calculate_pitch_parameters(mode, index / 2) for index in range(1, _NUMBER_OF_QUARTER_TONES))
+    for mode in _PITCH_PARAMETERS_BY_MODE}
+
+
+def _get_pitch_parameters(mode, midi_value):
+    if midi_value == 0:
+        return None
+    quarter_tones = midi_value * 2
+    index = int(quarter_tones)
+    if index == quarter_tones and 0 < index < _NUMBER_OF_QUARTER_TONES:
+        return _PITCH_PARAMETERS_TABLE[mode][index]
+    return _calculate_pitch_parameters(mode, midi_value)
+
 
 class Accidental(MusicTree, XMLWrapper):
     """
@@ -197,14 +223,20 @@ class Accidental(MusicTree, XMLWrapper):
     The parameter mode ('standard', 'enharmonic', 'flat', 'sharp', 'force-flat', 'force-sharp') can be used to set different enharmonic variants of the same
     pitch.
     """
+    _node_kind = _NodeKind.ACCIDENTAL
     _ATTRIBUTES = {'mode', 'show', 'parent_midi'}
 
     XMLClass = XMLAccidental
 
     def __init__(self, mode='standard', show: Optional[bool] = None, **kwargs):
         super().__init__()
-        self._xml_object = self.XMLClass(value_='natural', **kwargs)
+        if kwargs:
+            self._xml_object = _create_xml_element(self.XMLClass, value_='natural', **kwargs)
+        # Otherwise XMLAccidental is created on first use (see _create_xml_object)
         self._mode = None
+        # Pitch parameters of parent midi and the midi value they were calculated for. Reset if mode changes.
+        self._pitch_parameters = None
+        self._pitch_parameters_midi_value = None
         self._show = None
         self.show = show
         self.mode = mode
@@ -217,9 +249,13 @@ class Accidental(MusicTree, XMLWrapper):
         if self.parent_midi and self.parent_midi.value != 0:
             self.parent_midi._update_pitch_parameters()
 
+    def _create_xml_object(self):
+        return _create_xml_element(self.XMLClass, value_=self.sign or 'natural')
+
     def _update_xml_object(self):
-        if self.sign:
-            self._xml_object.value_ = self.sign
+        xml_object = self.__dict__.get('_xml_object')
+        if xml_object is not None and self.sign:
+            xml_object.value_ = self.sign
 
     @XMLWrapper.xml_object.getter
     def xml_object(self) -> Optional[XMLClass]:
@@ -252,6 +288,7 @@ class Accidental(MusicTree, XMLWrapper):
         if value not in permitted:
             raise TypeError(f'accidental_mode.value {value} must be in {permitted}')
         self._mode = value
+        self._pitch_parameters_midi_value = None
         self._update_xml_object()
         self._update_parent_midi()
 
@@ -289,7 +326,9 @@ class Accidental(MusicTree, XMLWrapper):
         ``self.cautionary`` or ``self.bracket`` is set to yes, the accidental is always shown regardless of this
         property
         """
-        if 'yes' in [self.parentheses, self.editorial, self.cautionary, self.bracket]:
+        xml_object = self.__dict__.get('_xml_object')
+        if xml_object is not None and 'yes' in [xml_object.parentheses, xml_object.editorial, xml_object.cautionary,
+                                                xml_object.bracket]:
             return True
         return self._show
 
@@ -315,34 +354,15 @@ class Accidental(MusicTree, XMLWrapper):
         """
 
         if midi_value is None:
-            if self.parent_midi:
-                midi_value = self.parent_midi.value
-            else:
+            parent_midi = self.parent_midi
+            if not parent_midi:
                 return None
-        if midi_value == 0:
-            return None
-
-        if self.mode == 'standard':
-            output = STANDARD[midi_value % 12]
-
-        elif self.mode == 'enharmonic':
-            output = ENHARMONIC[midi_value % 12]
-
-        elif self.mode == 'force-sharp':
-            output = FORCESHARP[midi_value % 12]
-
-        elif self.mode == 'force-flat':
-            output = FORCEFLAT[midi_value % 12]
-
-        elif self.mode == 'flat':
-            output = FLAT[midi_value % 12]
-
-        elif self.mode == 'sharp':
-            output = SHARP[midi_value % 12]
-
-        else:
-            raise ValueError
-        return output[0], output[1], output[2] + (int(midi_value // 12)) - 1
+            midi_value = parent_midi.value
+            if midi_value != self._pitch_parameters_midi_value:
+                self._pitch_parameters = _get_pitch_parameters(self.mode, midi_value)
+                self._pitch_parameters_midi_value = midi_value
+            return self._pitch_parameters
+        return _get_pitch_parameters(self.mode, midi_value)
 
     def __copy__(self):
         return self.__class__(mode=self.mode, show=self.show)
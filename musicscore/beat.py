@@ -1,22 +1,25 @@
+from functools import lru_cache
 from typing import List
 
 from math import trunc
 from quicktions import Fraction
 
 from musicscore.chord import _split_copy, _group_chords, Chord
-from musicscore.config import SPLITTABLES, GENERALSPLITTABLES, SPLITTEXCEPTIONS
+from musicscore import config
+from musicscore.config import _TableDict
 from musicscore.exceptions import BeatWrongDurationError, BeatIsFullError, BeatHasNoParentError, \
     ChordHasNoQuarterDurationError, \
     ChordHasNoMidisError, AlreadyFinalizedError, BeatNotFullError, AddChordError, QuarterDurationIsNotWritable, \
     BeatUpdateChordTupletsError, ChordTypeNotSetError
 from musicscore.finalize import FinalizeMixin
-from musicscore.musictree import MusicTree
+from musicscore.musictree import MusicTree, _NodeKind
 from musicscore.quantize import QuantizeMixin
 from musicscore.quarterduration import QuarterDuration, QuarterDurationMixin
 from musicscore.tuplet import Tuplet
 from musicscore.util import lcm
 
-__all__ = ['Beat', 'beam_chord_group', 'get_chord_group_subdivision']
+__all__ = ['Beat', 'beam_chord_group', 'get_chord_group_subdivision', 'get_quantization_cache_info',
+           'clear_quantization_caches']
 
 
 def _convert_to_quarter_duration_splittables_dictionary(simple_splittalbes):
@@ -28,13 +31,47 @@ def _convert_to_quarter_duration_splittables_dictionary(simple_splittalbes):
     return output
 
 
-_SPLITTABLE_QUARTER_DURATIONS = _convert_to_quarter_duration_splittables_dictionary(SPLITTABLES)
-
-
-def _find_nearest_quantized_value(quantized_values, values):
+def _get_split_tables_state():
+    # Changing an entry increases the version, replacing a whole table changes its id.
+    return _TableDict.version, id(config.SPLITTABLES), id(config.GENERALSPLITTABLES), id(config.SPLITTEXCEPTIONS)
+
+
+@lru_cache(maxsize=1)
+def _compile_splittables(tables_state):
+    return {(offset.value, duration.value): tuple(qd.value for qd in split) for offset, durations in
+            _convert_to_quarter_duration_splittables_dictionary(config.SPLITTABLES).items() for duration, split in
+            durations.items() if split}
+
+
+@lru_cache(maxsize=4096)
+def _get_split_plan(tables_state, beat_duration, subdivision, offset, duration):
+    # Looks up SPLITTABLES, GENERALSPLITTABLES and SPLITTEXCEPTIONS in this order. Returns a tuple of split durations or
+    # None. Plans are cached per state of tables, so changed tables are compiled anew.
+    split = _compile_splittables(tables_state).get((offset, duration))
+    if split:
+        return split
+    general_split = config.GENERALSPLITTABLES.get(duration.numerator)
+    if general_split:
+        return tuple(Fraction(x, duration.denominator) for x in general_split)
+    try:
+        exception_split = config.SPLITTEXCEPTIONS.get(beat_duration).get(subdivision).get(
+            (duration.numerator, duration.denominator))
+    except AttributeError:
+        return None
+    if exception_split:
+        return tuple(Fraction(*qd) for qd in exception_split)
+    return None
+
+
+def _find_nearest_quantized_value(quantized_locations, values):
+    # quantized_locations are equidistant and start with 0 (see _find_quantized_locations). Only the two locations
+    # around each value have to be compared.
+    step = quantized_locations[1]
+    last_index = len(quantized_locations) - 1
     output = []
     for value in values:
-        nearest_quantized = min(enumerate(quantized_values), key=lambda x: abs(x[1] - value))[1]
+        index = min((value.numerator * step.denominator) // (value.denominator * step.numerator), last_index)
+        nearest_quantized = min(quantized_locations[index:index + 2], key=lambda x: abs(x - value))
         delta = nearest_quantized - value
         output.append((nearest_quantized, delta))
     return output
@@ -48,15 +85,26 @@ def _find_q_delta(quantized_locations, values):
     return d
 
 
+@lru_cache(maxsize=256)
 def _find_quantized_locations(duration, subdivision):
+    # duration is the value (Fraction) of a quarter duration. QuarterDurations can be changed in place and are not used
+    # as keys.
     output = range(subdivision + 1)
-    fr = duration / subdivision
-    output = [x * fr for x in output]
+    fr = QuarterDuration(duration) / subdivision
+    output = tuple(x * fr for x in output)
     return output
 
 
 def get_chord_group_subdivision(chords):
-    qds = [ch.quarter_duration for ch in chords if ch.quarter_duration != 0]
+    return _get_quarter_durations_subdivision(
+        tuple(ch.quarter_duration.value for ch in chords if ch.quarter_duration != 0))
+
+
+@lru_cache(maxsize=4096)
+def _get_quarter_durations_subdivision(qds):
+    # qds are values (Fractions) of quarter durations. QuarterDurations can be changed in place and are not used as keys.
+    # They are created again to calculate with QuarterDuration arithmetic.
+    qds = [QuarterDuration(qd) for qd in qds]
     if len(qds) == 1:
         return qds[0].denominator
     qd_sum = sum(qds)
@@ -82,6 +130,51 @@ def get_chord_group_subdivision(chords):
         return denominators[0]
 
 
+def get_quantization_cache_info() -> dict:
+    """
+    :return: hits, misses, maxsize and currsize of caches used by quantization and subdivision of beats. Quantized
+             locations are cached per beat quarter duration and subdivision, subdivisions per tuple of chord quarter
+             durations.
+    :rtype: dict of :obj:`functools._CacheInfo`
+    """
+    return {'quantized_locations': _find_quantized_locations.cache_info(),
+            'subdivisions': _get_quarter_durations_subdivision.cache_info()}
+
+
+def clear_quantization_caches() -> None:
+    """
+    Clears caches and counters of :obj:`get_quantization_cache_info`
+    """
+    _find_quantized_locations.cache_clear()
+    _get_quarter_durations_subdivision.cache_clear()
+
+
+def _quantize_beats(beats):
+    # Beats with the same quarter duration and the same possible subdivisions share their quantized locations. Children
+    # are changed only after all beats are quantized, since quantization of a beat does not depend on other beats.
+    quantized_locations = {}
+    quantized_beats = []
+    for beat in beats:
+        possible_subdivisions = beat.get_possible_subdivisions()
+        if not possible_subdivisions or not beat.get_children():
+            continue
+        if get_chord_group_subdivision(beat.get_children()) in possible_subdivisions:
+            continue
+        quarter_durations = [chord.quarter_duration for chord in beat.get_children()]
+        if len([d for d in quarter_durations if d != 0]) <= 1:
+            continue
+        key = (beat.quarter_duration, tuple(possible_subdivisions))
+        if key not in quantized_locations:
+            quantized_locations[key] = [(div, beat._get_quantized_locations(subdivision=div)) for div in
+                                        possible_subdivisions]
+        quantized_beats.append(
+            (beat, beat._get_quantized_quarter_durations(quarter_durations, quantized_locations[key])))
+
+    for beat, quantized_quarter_durations in quantized_beats:
+        beat._change_children_quarter_durations(quantized_quarter_durations)
+        beat._remove_zero_quarter_durations()
+
+
 def beam_chord_group(chord_group: List['Chord']) -> None:
     # print('setting beams', [ch.quarter_duration for ch in chord_group])
     """
@@ -267,6 +360,7 @@ class Beat(MusicTree, QuarterDurationMixin, QuantizeMixin, FinalizeMixin):
 
     Beaming and quantization are also further important tasks of a beat.
     """
+    _node_kind = _NodeKind.BEAT
 
     _PERMITTED_DURATIONS = {4, 2, 1, 0.5}
 
@@ -275,16 +369,40 @@ class Beat(MusicTree, QuarterDurationMixin, QuantizeMixin, FinalizeMixin):
         self._filled_quarter_duration = 0
         self.leftover_chord = None
         self._subdivision = None
+        # id(chord) -> offset of each chord child. Reset if chords are added, removed or changed.
+        self._chord_offsets = None
 
     def _add_child(self, child):
         child._parent = self
         self._children.append(child)
+        self._reset_iterators()
         try:
             self.up.up.up.up.set_current_measure(staff_number=self.up.up.number, voice_number=self.up.number,
                                                  measure=self.up.up.up)
         except AttributeError:
             pass
 
+    def _set_quarter_duration(self, val):
+        super()._set_quarter_duration(val)
+        # _parent does not exist yet while __init__ sets the first quarter_duration.
+        parent = getattr(self, '_parent', None)
+        if parent:
+            parent._reset_iterators()
+
+    def _get_chord_offset(self, chord):
+        if self._chord_offsets is None:
+            offsets = {}
+            offset = 0
+            for child in self.get_children():
+                offsets[id(child)] = offset
+                offset = child.quarter_duration + offset
+            self._chord_offsets = offsets
+        return self._chord_offsets.get(id(chord))
+
+    def _reset_iterators(self):
+        self._chord_offsets = None
+        super()._reset_iterators()
+
     def _add_chord(self, chord=None):
         if chord is None:
             chord = Chord(midis=60, quarter_duration=self.quarter_duration)
@@ -297,6 +415,7 @@ class Beat(MusicTree, QuarterDurationMixin, QuantizeMixin, FinalizeMixin):
             raise ValueError
         for qd, ch in zip(quarter_durations, self.get_children()):
             ch._quarter_duration = qd
+        self._reset_iterators()
 
     def _check_permitted_duration(self, val):
         for d in self._PERMITTED_DURATIONS:
@@ -305,9 +424,9 @@ class Beat(MusicTree, QuarterDurationMixin, QuantizeMixin, FinalizeMixin):
         raise BeatWrongDurationError(f"Beat's quarter duration {val} is not allowed.")
 
     def _get_quantized_locations(self, subdivision):
-        return _find_quantized_locations(self.quarter_duration, subdivision)
+        return _find_quantized_locations(self.quarter_duration.value, subdivision)
 
-    def _get_quantized_quarter_durations(self, quarter_durations):
+    def _get_quantized_quarter_durations(self, quarter_durations, quantized_locations=None):
         if sum(quarter_durations) != self.quarter_duration:
             raise ValueError(
                 f"Sum of quarter_durations '{quarter_durations}: {sum(quarter_durations)}' is not equal to beat quarter_duration "
@@ -320,23 +439,23 @@ class Beat(MusicTree, QuarterDurationMixin, QuantizeMixin, FinalizeMixin):
             return output
 
         positions = _get_positions()
-        permitted_divs = self.get_possible_subdivisions()[:]
-        best_div = permitted_divs.pop(0)
-        last_q_delta = _find_q_delta(self._get_quantized_locations(subdivision=best_div), positions)
+        if quantized_locations is None:
+            quantized_locations = [(div, self._get_quantized_locations(subdivision=div)) for div in
+                                   self.get_possible_subdivisions()]
+        best_div, best_locations = quantized_locations[0]
+        last_q_delta = _find_q_delta(best_locations, positions)
 
-        for div in permitted_divs:
-            current_q_delta = _find_q_delta(self._get_quantized_locations(subdivision=div), positions)
+        for div, locations in quantized_locations[1:]:
+            current_q_delta = _find_q_delta(locations, positions)
 
             if current_q_delta < last_q_delta:
-                best_div = div
+                best_div, best_locations = div, locations
                 last_q_delta = current_q_delta
 
             elif (current_q_delta == last_q_delta) and (div < best_div):
-                best_div = div
+                best_div, best_locations = div, locations
 
-        quantized_positions = [f[0] for f in
-                               _find_nearest_quantized_value(self._get_quantized_locations(subdivision=best_div),
-                                                             positions)]
+        quantized_positions = [f[0] for f in _find_nearest_quantized_value(best_locations, positions)]
 
         quantized_durations = []
 
@@ -362,27 +481,12 @@ class Beat(MusicTree, QuarterDurationMixin, QuantizeMixin, FinalizeMixin):
                 midi.accidental.show = False
         return output
 
-    def _split_not_writable(self, chord, offset):
-        if _SPLITTABLE_QUARTER_DURATIONS.get(offset) and _SPLITTABLE_QUARTER_DURATIONS.get(offset).get(
-                chord.quarter_duration):
-            quarter_durations = _SPLITTABLE_QUARTER_DURATIONS.get(offset).get(
-                chord.quarter_duration)
-            if quarter_durations:
-                quarter_durations = [QuarterDuration(qd) for qd in quarter_durations]
-                return self._split_chord(chord, quarter_durations)
-        elif GENERALSPLITTABLES.get(chord.quarter_duration.numerator):
-            quarter_durations = [QuarterDuration(x, chord.quarter_duration.denominator) for x in
-                                 GENERALSPLITTABLES.get(chord.quarter_duration.numerator)]
-            return self._split_chord(chord, quarter_durations)
-        else:
-            try:
-                split_qds = SPLITTEXCEPTIONS.get(self.quarter_duration.value).get(self.get_subdivision()).get(
-                    chord.quarter_duration.as_integer_ratio())
-                if split_qds:
-                    quarter_durations = [QuarterDuration(qd[0], qd[1]) for qd in split_qds]
-                    return self._split_chord(chord, quarter_durations)
-            except AttributeError:
-                pass
+    def _get_split_plan(self, offset, duration, tables_state):
+        beat_duration = self.quarter_duration.value
+        plan = _get_split_plan(tables_state, beat_duration, None, offset, duration)
+        if plan is None and beat_duration in config.SPLITTEXCEPTIONS:
+            plan = _get_split_plan(tables_state, beat_duration, self.get_subdivision(), offset, duration)
+        return plan
 
     def _update_chord_types(self):
         for ch in self.get_chords():
@@ -559,18 +663,35 @@ class Beat(MusicTree, QuarterDurationMixin, QuantizeMixin, FinalizeMixin):
         if needed. Be careful with not writable quarter durations which have to be split (for example 5/6 must be split to 3/6,
         2/6 or some other writable quarter durations).
 
+        If no entry is found ``GENERALSPLITTABLES`` and ``SPLITTEXCEPTIONS`` are looked up. Results of these lookups are
+        cached per beat quarter duration, subdivision, offset and chord quarter duration until one of the tables changes.
+        The children of the beat are replaced by the split chords at once.
+
         :obj:`~musicscore.measure.Measure.finalize()` loops over all its beats calls this method.
         """
-        for chord in self.get_children()[:]:
-            split = self._split_not_writable(chord, chord.offset)
-            if split:
+        children = self.get_children()
+        if not children:
+            return
+        tables_state = _get_split_tables_state()
+        plans = []
+        offset = Fraction(0)
+        for chord in children:
+            duration = chord.quarter_duration.value
+            plans.append(self._get_split_plan(offset, duration, tables_state))
+            offset += duration
+        if not any(plans):
+            return
+        new_children = []
+        for chord, plan in zip(children, plans):
+            if plan:
+                split = self._split_chord(chord, [QuarterDuration(value) for value in plan])
                 for ch in split:
                     ch._parent = self
-                if chord == self.get_children()[-1]:
-                    self._children = self.get_children()[:-1] + split
-                else:
-                    index = self.get_children().index(chord)
-                    self._children = self.get_children()[:index] + split + self.get_children()[index + 1:]
+                new_children.extend(split)
+            else:
+                new_children.append(chord)
+        self._children = new_children
+        self._reset_iterators()
 
     @property
     def is_filled(self) -> bool:
@@ -597,7 +718,7 @@ class Beat(MusicTree, QuarterDurationMixin, QuantizeMixin, FinalizeMixin):
         :return: Beat's number inside its parent's :obj:`musicscore.voice.Voice`
         :rtype: int
         """
-        return self.up.get_children().index(self) + 1
+        return self.up._get_beat_position(self)[0] + 1
 
     @property
     def offset(self) -> QuarterDuration:
@@ -607,10 +728,7 @@ class Beat(MusicTree, QuarterDurationMixin, QuantizeMixin, FinalizeMixin):
         """
         if not self.up:
             return None
-        elif self.previous is None:
-            return 0
-        else:
-            return self.previous.offset + self.previous.quarter_duration
+        return self.up._get_beat_position(self)[1]
 
     def add_child(self, child: Chord) -> List['Chord']:
         """
@@ -670,7 +788,7 @@ class Beat(MusicTree, QuarterDurationMixin, QuantizeMixin, FinalizeMixin):
         If :obj:`~musicscore.beat.Beat` is not filled, it will be filled with rest(s)
         """
         if not self.is_filled:
-            self._add_chord(Chord(0, self.quarter_duration - sum([ch.quarter_duration for ch in self.get_chords()])))
+            self._add_chord(Chord(0, self.quarter_duration - self.filled_quarter_duration))
 
     def finalize(self):
         """
@@ -712,11 +830,4 @@ class Beat(MusicTree, QuarterDurationMixin, QuantizeMixin, FinalizeMixin):
         This method is called by :obj:`~musicscore.measure.Measure`
 
         """
-        if self.get_possible_subdivisions() and self.get_children():
-            if get_chord_group_subdivision(self.get_children()) in self.get_possible_subdivisions():
-                pass
-            else:
-                quarter_durations = [chord.quarter_duration for chord in self.get_children()]
-                if len([d for d in quarter_durations if d != 0]) > 1:
-                    self._change_children_quarter_durations(self._get_quantized_quarter_durations(quarter_durations))
-                    self._remove_zero_quarter_durations()
+        _quantize_beats([self])
@@ -0,0 +1,8 @@
+"""
+Benchmarks of the whole pipeline (building the tree, :obj:`~musicscore.finalize.FinalizeMixin.finalize()` and
+:obj:`~musicscore.finalize.FinalizeMixin.to_string()`) for a set of parameterized scenarios.
+
+Run all scenarios and compare them with the stored baseline: ``python -m musicscore.benchmark``
+"""
+from musicscore.benchmark.runner import *
+from musicscore.benchmark.scenarios import *
@@ -0,0 +1,70 @@
+import argparse
+import sys
+
+from musicscore.benchmark.runner import BASELINE_PATH, DEFAULT_THRESHOLD, MIN_ABSOLUTE_DELTA, IMPORT_MODULES, \
+    run_benchmarks, compare_with_baseline, check_import_time_budgets, load_results, save_results
+from musicscore.benchmark.scenarios import SCENARIOS
+
+
+def _get_parser():
+    parser = argparse.ArgumentParser(prog='python -m musicscore.benchmark',
+                                     description='Times building, finalizing and exporting scores and compares the '
+                                                 'results with a stored baseline.')
+    parser.add_argument('scenarios', nargs='*', metavar='scenario',
+                        help=f"scenarios to run (default: all): {', '.join(SCENARIOS)}")
+    parser.add_argument('--size', type=int, default=8, help='size of each score, mostly number of measures (default: 8)')
+    parser.add_argument('--repeat', type=int, default=3, help='number of runs, the fastest is kept (default: 3)')
+    parser.add_argument('--no-memory', action='store_true', help='do not trace peak memory')
+    parser.add_argument('--no-import', action='store_true',
+                        help=f"do not measure import time of {', '.join(IMPORT_MODULES)}")
+    parser.add_argument('--output', help='path of a json file to save results')
+    parser.add_argument('--baseline', default=str(BASELINE_PATH), help='path of the baseline json file')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'permitted relative increase over baseline (default: {DEFAULT_THRESHOLD})')
+    parser.add_argument('--min-delta', type=float, default=MIN_ABSOLUTE_DELTA,
+                        help=f'permitted increase of times over baseline in seconds (default: {MIN_ABSOLUTE_DELTA})')
+    parser.add_argument('--update-baseline', action='store_true', help='save results as new baseline')
+    return parser
+
+
+def main(args=None):
+    parser = _get_parser()
+    args = parser.parse_args(args)
+    unknown_scenarios = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown_scenarios:
+        parser.error(f"unknown scenarios: {', '.join(unknown_scenarios)}")
+    results = run_benchmarks(args.scenarios or None, size=args.size, repeat=args.repeat,
+                             trace_memory=not args.no_memory, import_modules=[] if args.no_import else None)
+    for name, values in results['scenarios'].items():
+        peak_memory = f"{values['peak_memory'] / 1e6:.1f} MB" if values['peak_memory'] is not None else '-'
+        print(f"{name:<28} build {values['build']:8.3f} s  finalize {values['finalize']:8.3f} s  "
+              f"to_string {values['to_string']:8.3f} s  total {values['total']:8.3f} s  peak {peak_memory}")
+    for module, value in results['import_time'].items():
+        print(f"{'import ' + module:<28} {value:8.3f} s")
+    exceeded_budgets = check_import_time_budgets(results)
+    if exceeded_budgets:
+        print('Exceeded import time budgets:')
+        for exceeded_budget in exceeded_budgets:
+            print(f'  {exceeded_budget}')
+    if args.output:
+        save_results(results, args.output)
+    if args.update_baseline:
+        save_results(results, args.baseline)
+        return 1 if exceeded_budgets else 0
+    try:
+        baseline = load_results(args.baseline)
+    except FileNotFoundError:
+        print(f'No baseline found at {args.baseline}')
+        return 1 if exceeded_budgets else 0
+    regressions = compare_with_baseline(results, baseline, threshold=args.threshold, min_delta=args.min_delta)
+    if regressions:
+        print('Regressions:')
+        for regression in regressions:
+            print(f'  {regression}')
+        return 1
+    print(f'No regressions (threshold {args.threshold:.0%}, minimum delta {args.min_delta:.4g} s).')
+    return 1 if exceeded_budgets else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
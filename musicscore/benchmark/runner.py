@@ -0,0 +1,184 @@
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from musicscore.benchmark.scenarios import SCENARIOS
+
+__all__ = ['BASELINE_PATH', 'DEFAULT_THRESHOLD', 'MIN_ABSOLUTE_DELTA', 'IMPORT_MODULES', 'IMPORT_TIME_BUDGETS',
+           'run_scenario', 'measure_import_time', 'run_benchmarks', 'compare_with_baseline', 'check_import_time_budgets',
+           'load_results', 'save_results']
+
+#: Stored baseline results
+BASELINE_PATH = Path(__file__).parent / 'baseline.json'
+#: Relative increase of a measured value over its baseline which is reported as a regression
+DEFAULT_THRESHOLD = 0.25
+#: Increase of a measured time in seconds over its baseline below which no regression is reported (timer noise)
+MIN_ABSOLUTE_DELTA = 0.1
+
+#: Modules whose import time in a new interpreter is measured by :obj:`run_benchmarks`
+IMPORT_MODULES = ['musicscore', 'musicscore.score']
+#: Maximum import time in seconds of modules. ``import musicscore`` must not import musicxml.
+IMPORT_TIME_BUDGETS = {'musicscore': 0.02}
+
+_MEASURED_KEYS = ['build', 'finalize', 'to_string', 'total', 'peak_memory']
+
+
+def _run_pipeline(scenario, size):
+    start = time.perf_counter()
+    score = scenario(size)
+    built = time.perf_counter()
+    score.finalize()
+    finalized = time.perf_counter()
+    score.to_string()
+    exported = time.perf_counter()
+    return {'build': built - start, 'finalize': finalized - built, 'to_string': exported - finalized,
+            'total': exported - start}
+
+
+def _get_peak_memory(scenario, size):
+    tracemalloc.start()
+    try:
+        _run_pipeline(scenario, size)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_scenario(name: str, size: int = 8, repeat: int = 3, trace_memory: bool = True) -> Dict[str, float]:
+    """
+    Builds, finalizes and exports the score of a scenario ``repeat`` times.
+
+    :param name: key of :obj:`~musicscore.benchmark.scenarios.SCENARIOS`
+    :param size: size of the score (mostly number of measures)
+    :param repeat: number of runs. The fastest run of each step is kept.
+    :param trace_memory: if ``True`` one more run with tracemalloc is done to get the peak memory in bytes.
+    :return: seconds of ``build``, ``finalize``, ``to_string`` and ``total`` and the ``peak_memory`` in bytes (or None)
+    """
+    scenario = SCENARIOS[name]
+    runs = [_run_pipeline(scenario, size) for _ in range(repeat)]
+    output = {key: min(run[key] for run in runs) for key in runs[0]}
+    output['peak_memory'] = _get_peak_memory(scenario, size) if trace_memory else None
+    return output
+
+
+def _parse_import_time(output, module):
+    # Lines of python -X importtime: "import time: self [us] | cumulative | imported package". The module and its
+    # parent packages are imported one after another, their cumulative times are added.
+    names = {'.'.join(module.split('.')[:index + 1]) for index in range(module.count('.') + 1)}
+    microseconds = 0
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line.split('|')
+        if name.strip() in names and cumulative.strip().isdigit():
+            microseconds += int(cumulative)
+    if not microseconds:
+        raise ValueError(f'Import time of {module} not found.')
+    return microseconds / 1e6
+
+
+def measure_import_time(module: str = 'musicscore', repeat: int = 3) -> float:
+    """
+    Imports a module in a new interpreter with ``python -X importtime`` ``repeat`` times.
+
+    :param module: name of module
+    :param repeat: number of runs. The fastest run is kept.
+    :return: seconds needed to import module and its parent packages
+    """
+    # The new interpreter finds the same packages as this one.
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(path for path in sys.path if path))
+    output = []
+    for _ in range(repeat):
+        completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'], capture_output=True,
+                                   text=True, check=True, env=env)
+        output.append(_parse_import_time(completed.stderr, module))
+    return min(output)
+
+
+def run_benchmarks(names: Optional[List[str]] = None, size: int = 8, repeat: int = 3,
+                   trace_memory: bool = True, import_modules: Optional[List[str]] = None) -> dict:
+    """
+    Calls :obj:`run_scenario` for all given scenarios and :obj:`measure_import_time` for all given modules.
+
+    :param names: keys of :obj:`~musicscore.benchmark.scenarios.SCENARIOS`. If ``None`` all scenarios are run.
+    :param import_modules: modules whose import time is measured. If ``None`` :obj:`IMPORT_MODULES` are used.
+    :return: dictionary with settings and results of all scenarios which can be saved with :obj:`save_results`
+    """
+    if names is None:
+        names = list(SCENARIOS)
+    if import_modules is None:
+        import_modules = IMPORT_MODULES
+    return {'size': size, 'repeat': repeat, 'python': platform.python_version(),
+            'scenarios': {name: run_scenario(name, size=size, repeat=repeat, trace_memory=trace_memory) for name in
+                          names},
+            'import_time': {module: measure_import_time(module, repeat=repeat) for module in import_modules}}
+
+
+def compare_with_baseline(results: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD,
+                          min_delta: float = MIN_ABSOLUTE_DELTA) -> List[str]:
+    """
+    :param results: output of :obj:`run_benchmarks`
+    :param baseline: output of :obj:`run_benchmarks` or :obj:`load_results`
+    :param threshold: permitted relative increase of each value
+    :param min_delta: permitted absolute increase of each time in seconds. Peak memory is only compared relatively.
+    :return: a description of each value which exceeds its baseline value by more than threshold and (times only) by
+             more than min_delta. Scenarios and import times which are not in both results are ignored.
+    """
+    if results['size'] != baseline['size']:
+        raise ValueError(f"Results of size {results['size']} cannot be compared with baseline of size "
+                         f"{baseline['size']}.")
+    output = []
+    for name, values in results['scenarios'].items():
+        baseline_values = baseline['scenarios'].get(name)
+        if not baseline_values:
+            continue
+        for key in _MEASURED_KEYS:
+            value, baseline_value = values.get(key), baseline_values.get(key)
+            if value is None or not baseline_value:
+                continue
+            if key != 'peak_memory' and value - baseline_value <= min_delta:
+                continue
+            if value > baseline_value * (1 + threshold):
+                output.append(f'{name} {key}: {value:.4g} > {baseline_value:.4g} (+{value / baseline_value - 1:.0%})')
+    # Import times of a few milliseconds are too noisy to be compared. They are checked by check_import_time_budgets.
+    baseline_import_times = baseline.get('import_time', {})
+    for module, value in results.get('import_time', {}).items():
+        if module in IMPORT_TIME_BUDGETS:
+            continue
+        baseline_value = baseline_import_times.get(module)
+        if baseline_value and value > baseline_value * (1 + threshold) and value - baseline_value > min_delta:
+            output.append(f'import {module}: {value:.4g} > {baseline_value:.4g} (+{value / baseline_value - 1:.0%})')
+    return output
+
+
+def check_import_time_budgets(results: dict, budgets: Optional[Dict[str, float]] = None) -> List[str]:
+    """
+    :param results: output of :obj:`run_benchmarks`
+    :param budgets: maximum import time of modules in seconds. If ``None`` :obj:`IMPORT_TIME_BUDGETS` are used.
+    :return: a description of each import time which exceeds its budget
+    """
+    if budgets is None:
+        budgets = IMPORT_TIME_BUDGETS
+    output = []
+    for module, value in results.get('import_time', {}).items():
+        budget = budgets.get(module)
+        if budget is not None and value > budget:
+            output.append(f'import {module}: {value:.4g} > budget {budget:.4g}')
+    return output
+
+
+def load_results(path: Union[str, Path] = BASELINE_PATH) -> dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_results(results: dict, path: Union[str, Path]) -> None:
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2)
+        f.write('\n')
@@ -0,0 +1,117 @@
+import random
+from typing import Callable, Dict
+
+from musicscore.chord import Chord
+from musicscore.part import Part
+from musicscore.quarterduration import QuarterDuration
+from musicscore.score import Score
+from musicscore.time import Time
+from musicxml.xmlelement.xmlelement import XMLAccent, XMLStaccato, XMLTenuto
+
+__all__ = ['SCENARIOS']
+
+_MIDIS = [60, 62, 64, 65, 67, 69, 71, 72]
+
+
+def _get_midi(index):
+    return _MIDIS[index % len(_MIDIS)]
+
+
+def dense_sixteenths(size: int) -> Score:
+    """
+    One part with ``size`` 4/4 measures of sixteenths.
+    """
+    score = Score()
+    part = score.add_child(Part('p1'))
+    for index in range(16 * size):
+        part.add_chord(Chord(_get_midi(index), 1 / 4))
+    return score
+
+
+def tuplets(size: int) -> Score:
+    """
+    One part with ``size`` 4/4 measures of triplets, quintuplets, sextuplets and septuplets with mixed durations inside
+    each beat.
+    """
+    beats = [[1 / 3] * 3, [1 / 5] * 5, [1 / 6] * 6, [1 / 7] * 7, [2 / 3, 1 / 3], [1 / 5, 2 / 5, 2 / 5],
+             [1 / 6, 1 / 3, 1 / 2], [3 / 7, 4 / 7]]
+    score = Score()
+    part = score.add_child(Part('p1'))
+    index = 0
+    for beat_index in range(4 * size):
+        for quarter_duration in beats[beat_index % len(beats)]:
+            part.add_chord(Chord(_get_midi(index), quarter_duration))
+            index += 1
+    return score
+
+
+def quantized_random_durations(size: int) -> Score:
+    """
+    One part with random durations which must be quantized, filling ``size`` 4/4 measures.
+    """
+    random.seed(11)
+    score = Score()
+    score.set_possible_subdivisions([2, 3, 4, 6, 8])
+    score.get_quantized = True
+    part = score.add_child(Part('p1'))
+    quarter_durations = []
+    while sum(quarter_durations) < 4 * size - 4:
+        quarter_durations.append(QuarterDuration(random.random() + random.randint(0, 3)))
+    quarter_durations.append(4 * size - sum(quarter_durations))
+    for index, quarter_duration in enumerate(quarter_durations):
+        part.add_chord(Chord(_get_midi(index), quarter_duration))
+    return score
+
+
+def many_parts(size: int) -> Score:
+    """
+    Sixteen parts with ``size`` 4/4 measures of eighths.
+    """
+    score = Score()
+    for part_number in range(1, 17):
+        part = score.add_child(Part(f'p{part_number}'))
+        for index in range(8 * size):
+            part.add_chord(Chord(_get_midi(index + part_number), 1 / 2))
+    return score
+
+
+def long_score(size: int) -> Score:
+    """
+    One part with ``size * 10`` measures of quarters and halves in changing time signatures.
+    """
+    score = Score()
+    part = score.add_child(Part('p1'))
+    times = [(4, 4), (3, 4), (2, 4), (6, 8)]
+    for measure_index in range(size * 10):
+        time = Time(*times[measure_index % len(times)])
+        part.add_measure(time)
+        for index, quarter_duration in enumerate(time.get_beats_quarter_durations()):
+            if index % 2:
+                part.add_chord(Chord(_get_midi(measure_index), quarter_duration))
+            else:
+                part.add_chord(Chord(_get_midi(measure_index + index), quarter_duration / 2))
+                part.add_chord(Chord(_get_midi(measure_index + index + 1), quarter_duration / 2))
+    return score
+
+
+def lyrics_and_articulations(size: int) -> Score:
+    """
+    One part with ``size`` 4/4 measures of eighths, each with a lyric, an articulation and words.
+    """
+    score = Score()
+    part = score.add_child(Part('p1'))
+    articulations = [XMLAccent, XMLStaccato, XMLTenuto]
+    for index in range(8 * size):
+        chord = Chord(_get_midi(index), 1 / 2)
+        chord.add_lyric(f'la{index}')
+        chord.add_x(articulations[index % len(articulations)]())
+        if index % 8 == 0:
+            chord.add_words(f'measure {index // 8 + 1}')
+        part.add_chord(chord)
+    return score
+
+
+#: name -> function creating a :obj:`~musicscore.score.Score` for a given size
+SCENARIOS: Dict[str, Callable[[int], Score]] = {function.__name__: function for function in
+                                                [dense_sixteenths, tuplets, quantized_random_durations, many_parts,
+                                                 long_score, lyrics_and_articulations]}
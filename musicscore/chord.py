@@ -4,7 +4,7 @@ from fractions import Fraction
 from typing import Union, List, Optional, Any, Dict
 
 from musicscore.clef import Clef
-from musicscore.config import NUMBEROFBEAMS, TYPEDURATION
+from musicscore.config import NUMBEROFBEAMS
 from musicscore.dynamics import Dynamics
 from musicscore.exceptions import ChordAlreadySplitError, ChordCannotSplitError, ChordHasNoParentBeamError, \
     ChordQuarterDurationAlreadySetError, AlreadyFinalizedError, DeepCopyException, ChordException, NotationException, \
@@ -14,13 +14,14 @@ from musicscore.exceptions import ChordAlreadySplitError, ChordCannotSplitError,
     ChordTypeNotSetError, ChordNumberOfDotsNotSetError, ChordParentBeamError
 from musicscore.finalize import FinalizeMixin
 from musicscore.midi import Midi
-from musicscore.musictree import MusicTree
+from musicscore.musictree import MusicTree, _NodeKind
 from musicscore.note import Note
-from musicscore.quarterduration import QuarterDuration, QuarterDurationMixin
+from musicscore.quarterduration import QuarterDuration, QuarterDurationMixin, _get_printed_quarter_duration
 from musicscore.tuplet import Tuplet
 from musicscore.util import XML_ARTICULATION_CLASSES, XML_TECHNICAL_CLASSES, XML_ORNAMENT_CLASSES, XML_DYNAMIC_CLASSES, \
     XML_OTHER_NOTATIONS, XML_DIRECTION_TYPE_CLASSES, XML_ORNAMENT_AND_OTHER_NOTATIONS, \
     XML_DIRECTION_TYPE_AND_OTHER_NOTATIONS, isinstance_as_string
+from musicscore.xmlwrapper import _is_local_attribute
 from musicxml.xmlelement.xmlelement import *
 
 __all__ = ['Chord', 'Rest', 'GraceChord']
@@ -71,6 +72,7 @@ class Chord(MusicTree, QuarterDurationMixin, FinalizeMixin):
     :param midis: :obj:`~musicscore.midi.Midi`, Midi.value, [Midi, Midi.value], 0 or [0] for a rest.
     :param quarter_duration: int, float, Fraction, :obj:`~musicscore.quarterduration.QuarterDuration` for duration counted in quarters (crotchets). 0 for grace note (or chord).
     """
+    _node_kind = _NodeKind.CHORD
     _ATTRIBUTES = {'midis', 'quarter_duration', 'notes', 'offset', 'split', 'voice', 'clef', 'metronome', 'arpeggio',
                    'type', 'number_of_dots', 'tuplet', 'beams'}
 
@@ -657,10 +659,7 @@ class Chord(MusicTree, QuarterDurationMixin, FinalizeMixin):
         """
         if not self.up:
             return None
-        elif self.previous is None:
-            return 0
-        else:
-            return self.previous.offset + self.previous.quarter_duration
+        return self.up._get_chord_offset(self)
 
     @property
     def tuplet(self) -> Optional['Tuplet']:
@@ -1061,14 +1060,7 @@ class Chord(MusicTree, QuarterDurationMixin, FinalizeMixin):
                     raise ChordTestError(
                         f'Chord has a tuplet ratio of {tuplet_ratio} but its tuplet property has ratio {self.tuplet.ratio}.')
 
-        if tuplet_ratio:
-            ratio = Fraction(tuplet_ratio[1], tuplet_ratio[0])
-        else:
-            ratio = 1
-        printed_duration = QuarterDuration(TYPEDURATION[self.type])
-        for i in range(self.number_of_dots):
-            printed_duration += printed_duration / 2
-        printed_duration *= ratio
+        printed_duration = QuarterDuration(_get_printed_quarter_duration(self.type, self.number_of_dots, tuplet_ratio))
         if printed_duration == self.quarter_duration:
             return True
         else:
@@ -1263,7 +1255,7 @@ class Chord(MusicTree, QuarterDurationMixin, FinalizeMixin):
         self.midis = [0]
 
     def __setattr__(self, key, value):
-        if key[0] != '_' and key not in self._ATTRIBUTES.union(self._TREE_ATTRIBUTES) and key not in self.__dict__:
+        if not _is_local_attribute(self.__class__, key) and key not in self.__dict__:
             if self.notes:
                 if isinstance(value, str) or not hasattr(value, '__iter__'):
                     value = [value] * len(self.notes)
@@ -1,19 +1,25 @@
 from typing import Optional
 
-from musicscore.xmlwrapper import XMLWrapper
+from musicscore.xmlwrapper import XMLWrapper, _create_xml_element
 from musicxml.xmlelement.xmlelement import XMLClef
 
 __all__ = ['Clef', 'TrebleClef', 'BassClef', 'AltoClef', 'TenorClef']
 
 
 class Clef(XMLWrapper):
-    _ATTRIBUTES = {'show', 'sign', 'line', 'octave_change'}
+    _ATTRIBUTES = {'show', 'sign', 'line', 'octave_change', 'number'}
     XMLClass = XMLClef
 
     def __init__(self, sign: str = 'G', line: Optional[int] = 2, octave_change: int = None, show: bool = True,
                  default: bool = False, *args, **kwargs):
         super().__init__()
-        self._xml_object = self.XMLClass(*args, **kwargs)
+        self._sign = None
+        self._line = None
+        self._octave_change = None
+        self._number = None
+        if args or kwargs:
+            self._xml_object = _create_xml_element(self.XMLClass, *args, **kwargs)
+        # Otherwise XMLClef is created on first use (see _create_xml_object). Hidden clefs do not need it.
         self._show = None
         self.show = show
         self.line = line
@@ -22,6 +28,29 @@ class Clef(XMLWrapper):
 
         self._default = default
 
+    def _create_xml_object(self):
+        xml_object = _create_xml_element(self.XMLClass)
+        xml_object.xml_sign = self._sign
+        xml_object.xml_line = self._line
+        xml_object.xml_clef_octave_change = self._octave_change
+        if self._number is not None:
+            xml_object.number = self._number
+        return xml_object
+
+    def _get_xml_child_value(self, name, value):
+        # value of xml_object's child if xml_object already exists, otherwise the stored value
+        xml_object = self.__dict__.get('_xml_object')
+        if xml_object is None:
+            return value
+        child = getattr(xml_object, name)
+        if child:
+            return child.value_
+
+    def _set_xml_child_value(self, name, value):
+        xml_object = self.__dict__.get('_xml_object')
+        if xml_object is not None:
+            setattr(xml_object, name, value)
+
     @property
     def line(self) -> Optional[int]:
         """
@@ -30,12 +59,33 @@ class Clef(XMLWrapper):
         :return: ``self.xml_object.xml_line.value_``
         :rtype: int, None
         """
-        if self.xml_object.xml_line:
-            return self.xml_object.xml_line.value_
+        return self._get_xml_child_value('xml_line', self._line)
 
     @line.setter
     def line(self, val):
-        self.xml_object.xml_line = val
+        self._line = val
+        self._set_xml_child_value('xml_line', val)
+
+    @property
+    def number(self) -> Optional[int]:
+        """
+        Set and get ``number`` attribute of :obj:`~musicxml.xmlelement.xmlelement.XMLClef`. It is needed if a measure has
+        more than one staff.
+
+        :return: ``self.xml_object.number``
+        :rtype: int, None
+        """
+        xml_object = self.__dict__.get('_xml_object')
+        if xml_object is None:
+            return self._number
+        return xml_object.number
+
+    @number.setter
+    def number(self, val):
+        self._number = val
+        xml_object = self.__dict__.get('_xml_object')
+        if xml_object is not None:
+            xml_object.number = val
 
     @property
     def octave_change(self) -> Optional[int]:
@@ -45,12 +95,12 @@ class Clef(XMLWrapper):
         :return: ``self.xml_object.xml_clef_octave_change.value_``
         """
 
-        if self.xml_object.xml_clef_octave_change:
-            return self.xml_object.xml_clef_octave_change.value_
+        return self._get_xml_child_value('xml_clef_octave_change', self._octave_change)
 
     @octave_change.setter
     def octave_change(self, val):
-        self.xml_object.xml_clef_octave_change = val
+        self._octave_change = val
+        self._set_xml_child_value('xml_clef_octave_change', val)
 
     @property
     def sign(self) -> Optional[str]:
@@ -60,12 +110,12 @@ class Clef(XMLWrapper):
         :return: ``self.xml_object.xml_sign.value_``
         :rtype: str, None
         """
-        if self.xml_object.xml_sign:
-            return self.xml_object.xml_sign.value_
+        return self._get_xml_child_value('xml_sign', self._sign)
 
     @sign.setter
     def sign(self, val):
-        self.xml_object.xml_sign = val
+        self._sign = val
+        self._set_xml_child_value('xml_sign', val)
 
     @property
     def show(self) -> bool:
@@ -1,5 +1,70 @@
-#: This dictionary is used to split unwritable chords into two writable ones. A chord may be unwritable because of its position inside the beat and its quarter duration. Sometimes are chords split only because of better readability. The structure of this dictionary is as follows: {position in Beat (or offset): {duration: [split durations]}}
-SPLITTABLES = {
+class _TableDict(dict):
+    """
+    dict which counts changes of all tables in this module. Nested dictionaries are converted to :obj:`_TableDict` too,
+    so that changing an entry at any depth increases :obj:`_TableDict.version`. Caches built from these tables compare
+    the version to know when they have to be rebuilt.
+
+    Lists (e.g. split durations) are stored as tuples. They cannot be changed in place and must be replaced by assignment,
+    which is counted like all other changes.
+    """
+    version = 0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        for key, value in self.items():
+            converted_value = self._convert(value)
+            if converted_value is not value:
+                super().__setitem__(key, converted_value)
+
+    @staticmethod
+    def _convert(value):
+        if isinstance(value, dict) and not isinstance(value, _TableDict):
+            return _TableDict(value)
+        if isinstance(value, list):
+            return tuple(value)
+        return value
+
+    @staticmethod
+    def _changed():
+        _TableDict.version += 1
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, self._convert(value))
+        self._changed()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._changed()
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+        self._changed()
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, *args):
+        self._changed()
+        return super().pop(*args)
+
+    def popitem(self):
+        self._changed()
+        return super().popitem()
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+
+#: This dictionary is used to split unwritable chords into two writable ones. A chord may be unwritable because of its position inside the beat and its quarter duration. Sometimes are chords split only because of better readability. The structure of this dictionary is as follows: {position in Beat (or offset): {duration: [split durations]}}. Split durations are stored as tuples and can only be changed by assigning a new list or tuple.
+SPLITTABLES = _TableDict({
     (0, 1): {
         # (4, 9): [(3, 9), (1, 9)],
 
@@ -77,9 +142,9 @@ SPLITTABLES = {
         # (3, 9): [(1, 9), (2, 9)],
         # (4, 9): [(1, 9), (3, 9)],
     }
-}
+})
 
-GENERALSPLITTABLES = {
+GENERALSPLITTABLES = _TableDict({
     5: (3, 2),
     7: (4, 3),
     9: (8, 1),
@@ -97,10 +162,10 @@ GENERALSPLITTABLES = {
     29: (16, 8, 3, 2),
     30: (16, 8, 6),
     31: (16, 8, 4, 3),
-}
+})
 
 #: {beat_duration: {beat_subdivision: {quarter_duration as integer ratio: [split durations]}}
-SPLITTEXCEPTIONS = {
+SPLITTEXCEPTIONS = _TableDict({
     1: {
         10: {(1, 2): [(3, 10), (2, 10)]},
         12: {(3, 4): [(6, 12), (3, 12)]},
@@ -112,10 +177,10 @@ SPLITTEXCEPTIONS = {
         }
     }
 
-}
+})
 
 #:
-NOTETYPES = {
+NOTETYPES = _TableDict({
     (1, 32): '128th',
     (1, 16): '64th',
     (1, 15): '32nd',
@@ -156,10 +221,10 @@ NOTETYPES = {
     (2, 1): 'half',
     (4, 1): 'whole',
     (8, 1): 'breve',
-}
+})
 
 #:
-TYPEANDDOTEXCEPTIONS = {
+TYPEANDDOTEXCEPTIONS = _TableDict({
     1: {
         6: {(1, 2): ('eighth', 1)},
         9: {
@@ -175,13 +240,13 @@ TYPEANDDOTEXCEPTIONS = {
             (4, 5): ('quarter', 1)
         }
     }
-}
+})
 
 #:
 BEATWISE_EXCEPTIONS = {0: {5: (3, 2), 6: (6,)}}
 
 #:
-DOTEDTUPLETRATIO = {2: 3, 4: 3, 5: 3, 7: 6, 8: 6}
+DOTEDTUPLETRATIO = _TableDict({2: 3, 4: 3, 5: 3, 7: 6, 8: 6})
 
 #:
 NUMBEROFBEAMS = {'eighth': 1, '16th': 2, '32nd': 3, '64th': 4, '128th': 5}
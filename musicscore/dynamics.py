@@ -1,4 +1,4 @@
-from musicscore.xmlwrapper import XMLWrapper
+from musicscore.xmlwrapper import XMLWrapper, _create_xml_element
 from musicxml.xmlelement.xmlelement import XMLF, XMLFf, XMLFff, XMLFfff, XMLFffff, XMLFfffff, XMLFp, XMLFz, XMLMf, \
     XMLMp, XMLP, XMLPf, XMLPp, XMLPpp, XMLPppp, XMLPpppp, XMLPppppp, XMLRf, XMLRfz, XMLSf, XMLSffz, XMLSfp, XMLSfpp, \
     XMLSfz, XMLSfzp
@@ -42,4 +42,4 @@ class Dynamics(XMLWrapper):
     def __init__(self, value: str, *args, **kwargs):
         super().__init__()
         self.XMLClass = DYNAMICS[value]
-        self._xml_object = self.XMLClass(*args, **kwargs)
+        self._xml_object = _create_xml_element(self.XMLClass, *args, **kwargs)
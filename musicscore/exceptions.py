@@ -251,6 +251,10 @@ class ScoreMultiMeasureRestError(ScoreException):
     pass
 
 
+class ScorePartHasAnotherParentError(ScoreException):
+    pass
+
+
 # Staff exceptions
 class StaffException(MusicTreeException):
     pass
@@ -2,7 +2,7 @@ from typing import Optional
 
 from musicxml.xmlelement.xmlelement import XMLKey
 
-from musicscore.xmlwrapper import XMLWrapper
+from musicscore.xmlwrapper import XMLWrapper, _create_xml_element
 
 __all__ = ['Key']
 
@@ -13,11 +13,19 @@ class Key(XMLWrapper):
 
     def __init__(self, fifths: int = 0, show: bool = True, *args, **kwargs):
         super().__init__()
-        self._xml_object = self.XMLClass(*args, **kwargs)
+        self._fifths = None
+        if args or kwargs:
+            self._xml_object = _create_xml_element(self.XMLClass, *args, **kwargs)
+        # Otherwise XMLKey is created on first use (see _create_xml_object). Hidden keys do not need it.
         self.fifths = fifths
         self._show = None
         self.show = show
 
+    def _create_xml_object(self):
+        xml_object = _create_xml_element(self.XMLClass)
+        xml_object.xml_fifths = self._fifths
+        return xml_object
+
     @property
     def fifths(self) -> Optional[int]:
         """
@@ -25,12 +33,18 @@ class Key(XMLWrapper):
 
         :return: ``self.xml_object.xml_fifths.value_``
         """
-        if self.xml_object.xml_fifths:
-            return self.xml_object.xml_fifths.value_
+        xml_object = self.__dict__.get('_xml_object')
+        if xml_object is None:
+            return self._fifths
+        if xml_object.xml_fifths:
+            return xml_object.xml_fifths.value_
 
     @fifths.setter
     def fifths(self, val):
-        self.xml_object.xml_fifths = val
+        self._fifths = val
+        xml_object = self.__dict__.get('_xml_object')
+        if xml_object is not None:
+            xml_object.xml_fifths = val
 
     @property
     def show(self) -> bool:
@@ -1,7 +1,7 @@
 from typing import Union, Optional
 
 from musicscore.util import isinstance_as_string
-from musicscore.xmlwrapper import XMLWrapper
+from musicscore.xmlwrapper import XMLWrapper, _create_xml_element
 from musicxml.xmlelement.xmlelement import XMLPageLayout, XMLPageMargins, XMLScaling, XMLDefaults, XMLSystemLayout, \
     XMLSystemMargins, XMLStaffLayout
 
@@ -175,7 +175,7 @@ class Scaling(XMLWrapper):
     def __init__(self, millimeters: Union[int, float] = SCALING['millimeters'],
                  tenths: Union[int, float] = SCALING['tenths']):
         super().__init__()
-        self._xml_object = self.XMLClass()
+        self._xml_object = _create_xml_element(self.XMLClass)
         self._millimeters = None
         self._tenths = None
         self._score = None
@@ -262,7 +262,7 @@ class PageLayout(XMLWrapper, LayoutMixin):
     def __init__(self, size: str = 'A4', orientation: str = 'portrait'):
 
         super().__init__()
-        self._xml_object = self.XMLClass()
+        self._xml_object = _create_xml_element(self.XMLClass)
         self._xml_object.xml_page_margins = XMLPageMargins(type='both')
 
         self._size = None
@@ -357,7 +357,7 @@ class SystemLayout(XMLWrapper, LayoutMixin):
                  top_system_distance: Union[int, float] = SYSTEM_LAYOUT['top_system_distance']):
         super().__init__()
 
-        self._xml_object = self.XMLClass()
+        self._xml_object = _create_xml_element(self.XMLClass)
         self._xml_object.xml_system_margins = XMLSystemMargins()
 
         self.system_distance = system_distance
@@ -412,7 +412,7 @@ class StaffLayout(XMLWrapper, LayoutMixin):
 
     def __init__(self, staff_distance=STAFF_LAYOUT['staff_distance']):
         super().__init__()
-        self._xml_object = self.XMLClass()
+        self._xml_object = _create_xml_element(self.XMLClass)
         self.staff_distance = staff_distance
 
     @property
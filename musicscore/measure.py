@@ -4,21 +4,32 @@ from typing import List, Optional, Union
 from math import trunc
 
 from musicscore.clef import BassClef, TrebleClef
-from musicscore.musictree import MusicTree
+from musicscore.musictree import MusicTree, _NodeKind
 from musicscore.exceptions import AlreadyFinalizedError, AddChordError
 from musicscore.finalize import FinalizeMixin
 from musicscore.key import Key
 from musicscore.quantize import QuantizeMixin
 from musicscore.staff import Staff
 from musicscore.time import Time, flatten_times
-from musicscore.util import lcm, _chord_is_in_a_repetition, isinstance_as_string
+from musicscore.util import lcm
 from musicscore.voice import Voice
-from musicscore.xmlwrapper import XMLWrapper
+from musicscore.xmlwrapper import XMLWrapper, _create_xml_element
+from musicxml.xmlelement.exceptions import XMLChildContainerWrongElementError
 from musicxml.xmlelement.xmlelement import XMLMeasure, XMLAttributes, XMLClef, XMLBackup, XMLBarline, XMLPrint, \
     XMLRepeat, XMLEnding
 
 __all__ = ['Measure', 'generate_measures']
 
+# Names of all possible XMLMeasure children. Set on first use.
+_XML_MEASURE_CHILDREN_NAMES = None
+
+
+def _get_xml_measure_children_names():
+    global _XML_MEASURE_CHILDREN_NAMES
+    if _XML_MEASURE_CHILDREN_NAMES is None:
+        _XML_MEASURE_CHILDREN_NAMES = frozenset(_create_xml_element(XMLMeasure, number='1').possible_children_names)
+    return _XML_MEASURE_CHILDREN_NAMES
+
 
 class Measure(MusicTree, QuantizeMixin, FinalizeMixin, XMLWrapper):
     """
@@ -26,6 +37,7 @@ class Measure(MusicTree, QuantizeMixin, FinalizeMixin, XMLWrapper):
 
     Child type: :obj:`~musicscore.staff.Staff`
     """
+    _node_kind = _NodeKind.MEASURE
 
     _ATTRIBUTES = {'number', 'time', 'key', 'clefs', 'quarter_duration', 'barline_style', 'new_system'}
     _ATTRIBUTES = _ATTRIBUTES.union(MusicTree._ATTRIBUTES)
@@ -35,7 +47,7 @@ class Measure(MusicTree, QuantizeMixin, FinalizeMixin, XMLWrapper):
     def __init__(self, number, time=None, *args, **kwargs):
         super().__init__()
         self._updated = False
-        self._xml_object = self.XMLClass(*args, **kwargs)
+        self._xml_object = _create_xml_element(self.XMLClass, *args, **kwargs)
         self.number = number
         self._time = None
         self._key = Key()
@@ -45,14 +57,16 @@ class Measure(MusicTree, QuantizeMixin, FinalizeMixin, XMLWrapper):
         self._barlines = {'left': None, 'right': None}
 
     def _add_chord(self, chord, staff_number=None, voice_number=1):
+        return self._add_voice_with_beats(staff_number=staff_number, voice_number=voice_number)._add_chord(chord)
 
+    def _add_voice_with_beats(self, staff_number=None, voice_number=1):
         voice = self.add_voice(staff_number=staff_number, voice_number=voice_number)
         if not voice.get_children():
             voice.update_beats()
-        return voice._add_chord(chord)
+        return voice
 
     def _set_attributes(self):
-        self.xml_object.xml_attributes = XMLAttributes()
+        self.xml_object.xml_attributes = _create_xml_element(XMLAttributes)
         self.xml_object.xml_attributes.xml_divisions = 1
 
     def _set_clefs(self):
@@ -89,37 +103,9 @@ class Measure(MusicTree, QuantizeMixin, FinalizeMixin, XMLWrapper):
             b._split_not_writable_chords()
 
     def _update_accidentals(self):
-
         for staff in self.get_children():
             if staff.show_accidental_signs == 'modern':
-                previous_staff = staff.get_previous_staff()
-                steps_with_accidentals = set()
-                relevant_chords = [ch for ch in staff.get_chords() if not ch.is_rest]
-                relevant_chords_not_tied = [ch for ch in relevant_chords if
-                                            True not in set(m.is_tied_to_previous for m in ch.midis)]
-                for chord in relevant_chords:
-                    for midi in chord.midis:
-                        step = midi.accidental.get_pitch_parameters()[0]
-                        if midi.accidental.show is None:
-                            if midi.accidental.sign == 'natural':
-                                if step in steps_with_accidentals:
-                                    midi.accidental.show = True
-                                    steps_with_accidentals.remove(step)
-                                elif relevant_chords_not_tied and chord == relevant_chords_not_tied[
-                                    0] and previous_staff and step in \
-                                        previous_staff.get_last_pitch_steps_with_accidentals():
-                                    midi.accidental.show = True
-                                else:
-                                    midi.accidental.show = False
-                            else:
-                                if _chord_is_in_a_repetition(chord):
-                                    midi.accidental.show = False
-                                else:
-                                    midi.accidental.show = True
-                                    if step not in steps_with_accidentals:
-                                        steps_with_accidentals.add(step)
-                        elif midi.accidental.sign != 'natural' and step not in steps_with_accidentals:
-                            steps_with_accidentals.add(step)
+                staff._update_accidentals()
             else:
                 raise NotImplementedError(f'{staff.show_accidental_signs} not implemented yet.')
 
@@ -183,7 +169,7 @@ class Measure(MusicTree, QuantizeMixin, FinalizeMixin, XMLWrapper):
                     _set_default_clef(index + 1, BassClef(default=True))
 
     def _update_divisions(self):
-        chord_divisions = {ch.quarter_duration.denominator for ch in self.get_chords()}
+        chord_divisions = {ch.quarter_duration.denominator for ch in self.iter_chords()}
         divisions = lcm(list(chord_divisions))
         self.xml_object.xml_attributes.xml_divisions = divisions
 
@@ -199,7 +185,7 @@ class Measure(MusicTree, QuantizeMixin, FinalizeMixin, XMLWrapper):
 
     def _update_score_encoding(self):
         if self.new_system:
-            if not isinstance_as_string(self.get_root(), "Score"):
+            if self.get_root()._node_kind is not _NodeKind.SCORE:
                 warnings.warn(
                     f"Measure number {self.number} sets new_system to True but hat no Score as root. Score.new_system must be True for measure's new_system to take effect.")
             else:
@@ -212,34 +198,52 @@ class Measure(MusicTree, QuantizeMixin, FinalizeMixin, XMLWrapper):
             for voice in staff.get_children():
                 voice.update_beats()
 
+    def _add_xml_children(self, xml_children):
+        # Measure's content is an unbounded choice (music-data): The document order of its children is the order in which
+        # they are added. Children are attached at once without the child container checks of each add_child() call.
+        # Afterwards the names of the children are checked in one pass (unless Score.validate is False). The xml
+        # measure keeps xsd_check False. Its children keep their own checks.
+        xml_measure = self.xml_object
+        root = self.get_root()
+        if root._node_kind is not _NodeKind.SCORE or root.validate:
+            possible_children_names = _get_xml_measure_children_names()
+            for xml_child in xml_children:
+                if xml_child.name not in possible_children_names:
+                    raise XMLChildContainerWrongElementError(
+                        f'{xml_child.__class__.__name__} cannot be a child of {xml_measure.__class__.__name__}')
+        xml_measure.xsd_check = False
+        for xml_child in xml_children:
+            xml_measure.add_child(xml_child)
+
     def _update_xml_notes_backup_and_more(self):
+        xml_children = []
+
         def add_backup():
             b = XMLBackup()
             d = self.quarter_duration * self.get_divisions()
             if trunc(d) != d:
                 raise ValueError
             b.xml_duration = trunc(d)
-            self.xml_object.add_child(b)
+            xml_children.append(b)
 
         for staff in self.get_children():
             if staff != self.get_children()[0]:
                 add_backup()
             for index, voice in enumerate(staff.get_children()):
-                chords = voice.get_chords()
                 if index != 0:
                     add_backup()
-                for chord in chords:
-                    for xml_direction in chord._xml_directions:
-                        self.xml_object.add_child(xml_direction)
+                for chord in voice.iter_chords():
+                    xml_children.extend(chord._xml_directions)
                     if chord.clef and chord.clef.show is True:
                         if len(self.get_children()) > 1:
                             chord.clef.number = staff.number
-                        attributes = self.xml_object.add_child(XMLAttributes())
+                        attributes = _create_xml_element(XMLAttributes)
                         attributes.add_child(chord.clef.xml_object)
+                        xml_children.append(attributes)
                     for note in chord.notes:
-                        self.xml_object.add_child(note.xml_object)
-                    for xml_object in chord._after_notes_xml_elements:
-                        self.xml_object.add_child(xml_object)
+                        xml_children.append(note.xml_object)
+                    xml_children.extend(chord._after_notes_xml_elements)
+        self._add_xml_children(xml_children)
 
     @property
     def clefs(self) -> List['Clef']:
@@ -348,6 +352,7 @@ class Measure(MusicTree, QuantizeMixin, FinalizeMixin, XMLWrapper):
 
         child._parent = self
         self._children.append(child)
+        self._reset_iterators()
 
         if self.previous is None:
             self._update_default_clefs()
@@ -427,7 +432,7 @@ class Measure(MusicTree, QuantizeMixin, FinalizeMixin, XMLWrapper):
         self._update_attributes()
         self._update_left_barline()
         # self.quantize
-        for beat in self.get_beats():
+        for beat in self.iter_beats():
             # if beat.get_quantized:
             #     beat.quantize_quarter_durations()
             beat._split_not_writable_chords()
@@ -528,7 +533,7 @@ class Measure(MusicTree, QuantizeMixin, FinalizeMixin, XMLWrapper):
         :return: None
         """
         for staff in self.get_children():
-            for chord in staff.get_chords():
+            for chord in staff.iter_chords():
                 if chord.all_midis_are_tied_to_previous:
                     for midi in chord.midis:
                         midi.accidental.show = False
@@ -1,6 +1,6 @@
 from musicscore.quarterduration import QuarterDuration
 from musicscore.exceptions import QuarterDurationIsNotWritable, MetronomeWrongBeatUnitError
-from musicscore.xmlwrapper import XMLWrapper
+from musicscore.xmlwrapper import XMLWrapper, _create_xml_element
 from musicxml.xmlelement.xmlelement import XMLMetronome, XMLBeatUnitDot, XMLSound
 
 
@@ -10,7 +10,7 @@ class Metronome(XMLWrapper):
 
     def __init__(self, per_minute, beat_unit=1, parenthesis=False, *args, **kwargs):
         super().__init__()
-        self._xml_object = self.XMLClass(*args, **kwargs)
+        self._xml_object = _create_xml_element(self.XMLClass, *args, **kwargs)
         self._per_minute = None
         self._beat_unit = None
         self._sound = XMLSound()
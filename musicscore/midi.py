@@ -8,7 +8,8 @@ from musicxml.xmlelement.xmlelement import *  # type: ignore
 from musicxml.xsd.xsdsimpletype import XSDSimpleTypeNoteheadValue  # type: ignore
 
 from musicscore.accidental import Accidental
-from musicscore.musictree import MusicTree
+from musicscore.musictree import MusicTree, _NodeKind
+from musicscore.xmlwrapper import _create_xml_element
 
 __all__ = ['Midi', 'MidiNote', 'C', 'D', 'E', 'F', 'G', 'A', 'B', 'midi_to_frequency', 'frequency_to_midi',
            'get_accidental_mode']
@@ -81,6 +82,7 @@ class Midi(MusicTree):
     Midi is the representation of a Pitch with its midi value, and accidental sign. This object is used to create a Chord
     consisting of one or more pitches. The midi representation of a rest is a Midi object with value 0.
     """
+    _node_kind = _NodeKind.MIDI
 
     def __init__(self, value: Union[float, int], accidental: Optional[Accidental] = None, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -108,39 +110,42 @@ class Midi(MusicTree):
             self.parent_note._update_xml_pitch_or_rest()
             self.parent_note._update_xml_accidental()
 
+    def _create_pitch_or_rest(self):
+        if self.value == 0:
+            return _create_xml_element(XMLRest)
+        pitch = _create_xml_element(XMLPitch)
+        if self.accidental:
+            step, alter, octave = self.accidental.get_pitch_parameters()
+            if alter:
+                pitch.xml_step, pitch.xml_alter, pitch.xml_octave = step, alter, octave
+            else:
+                pitch.xml_step, pitch.xml_octave = step, octave
+        return pitch
+
     def _update_pitch_parameters(self):
-        pitch = self.get_pitch_or_rest()
+        pitch = self._pitch_or_rest
+        if pitch is None:
+            # not created yet: get_pitch_or_rest() will use the current pitch parameters.
+            return
         if isinstance(pitch, XMLPitch):
-            if not self.accidental.get_pitch_parameters()[1]:
+            step, alter, octave = self.accidental.get_pitch_parameters()
+            if not alter:
                 if pitch.xml_alter:
                     pitch.remove(pitch.xml_alter)
-                pitch.xml_step, pitch.xml_octave = self.accidental.get_pitch_parameters()[0], \
-                    self.accidental.get_pitch_parameters()[2]
+                pitch.xml_step, pitch.xml_octave = step, octave
             else:
-                pitch.xml_step, pitch.xml_alter, pitch.xml_octave = self.accidental.get_pitch_parameters()
+                pitch.xml_step, pitch.xml_alter, pitch.xml_octave = step, alter, octave
         else:
             raise TypeError
 
     def _update_pitch_or_rest(self):
-        if self._pitch_or_rest is None:
-            if self.value == 0:
-                self._pitch_or_rest = XMLRest()
-            else:
-                self._pitch_or_rest = XMLPitch()
-        else:
-            if self.value == 0:
-                if not isinstance(self._pitch_or_rest, XMLRest):
-                    self._pitch_or_rest = XMLRest()
-                    self._update_parent_note()
-                else:
-                    pass
-            else:
-                if not isinstance(self._pitch_or_rest, XMLPitch):
-                    self._pitch_or_rest = XMLPitch()
-                    self._update_parent_note()
-                if self.accidental:
-                    self.accidental._update_xml_object()
-                    self._update_pitch_parameters()
+        pitch_or_rest = self._pitch_or_rest
+        if pitch_or_rest is not None and isinstance(pitch_or_rest, XMLRest) != (self.value == 0):
+            self._pitch_or_rest = None
+            self._update_parent_note()
+        if self.value != 0 and self.accidental:
+            self.accidental._update_xml_object()
+            self._update_pitch_parameters()
         if self.up:
             self.up._update_xml_pitch_or_rest()
 
@@ -255,7 +260,7 @@ class Midi(MusicTree):
         if self.value == 0:
             return 'rest'
 
-        pitch_step = self.accidental.get_pitch_parameters()[1]
+        step, pitch_step, _ = self.accidental.get_pitch_parameters()
 
         if not pitch_step:
             accidental = ''
@@ -274,7 +279,7 @@ class Midi(MusicTree):
         else:
             accidental = str(pitch_step)
 
-        return f"{self.accidental.get_pitch_parameters()[0]}{accidental}{self.octave}"
+        return f"{step}{accidental}{self.octave}"
 
     # //public methods
     def add_child(self, child: [Accidental]) -> Accidental:
@@ -307,7 +312,10 @@ class Midi(MusicTree):
     def get_pitch_or_rest(self) -> Union['XMLPitch', 'XMLRest']:
         """
         :return: :obj:`~musicxml.xmlelement.xmlelement.XMLPitch` or :obj:`~musicxml.xmlelement.xmlelement.XMLRest` object associated with this :obj:`~musicscore.midi.Midi`.
+                 It is created on first call.
         """
+        if self._pitch_or_rest is None:
+            self._pitch_or_rest = self._create_pitch_or_rest()
         return self._pitch_or_rest
 
     def get_staff_number(self):
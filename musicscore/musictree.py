@@ -1,12 +1,45 @@
-from typing import List
+from enum import Enum
+from typing import List, Iterator
 
 from musicscore.exceptions import MusicTreeTypeError
-from musicscore.util import isinstance_as_string
 from tree.tree import Tree
 
 __all__ = ['MusicTree']
 
 
+class _NodeKind(Enum):
+    """
+    Type tag of :obj:`MusicTree` classes. Each class sets it as class attribute ``_node_kind``. Subclasses (for example
+    :obj:`~musicscore.chord.Rest` or :obj:`~musicscore.midi.C`) inherit the type tag of their parent class.
+    """
+    SCORE = 'Score'
+    PART = 'Part'
+    MEASURE = 'Measure'
+    STAFF = 'Staff'
+    VOICE = 'Voice'
+    BEAT = 'Beat'
+    CHORD = 'Chord'
+    NOTE = 'Note'
+    MIDI = 'Midi'
+    ACCIDENTAL = 'Accidental'
+
+
+_PERMITTED_CHILD_KINDS = {_NodeKind.SCORE: _NodeKind.PART, _NodeKind.PART: _NodeKind.MEASURE,
+                          _NodeKind.MEASURE: _NodeKind.STAFF, _NodeKind.STAFF: _NodeKind.VOICE,
+                          _NodeKind.VOICE: _NodeKind.BEAT, _NodeKind.BEAT: _NodeKind.CHORD,
+                          _NodeKind.CHORD: _NodeKind.NOTE, _NodeKind.NOTE: _NodeKind.MIDI,
+                          _NodeKind.MIDI: _NodeKind.ACCIDENTAL}
+
+# Node kinds below the node kind whose children are beats (voice) or chords (beat).
+_NO_BEATS_KINDS = frozenset((_NodeKind.BEAT, _NodeKind.CHORD, _NodeKind.NOTE, _NodeKind.MIDI, _NodeKind.ACCIDENTAL))
+_NO_CHORDS_KINDS = frozenset((_NodeKind.CHORD, _NodeKind.NOTE, _NodeKind.MIDI, _NodeKind.ACCIDENTAL))
+
+_COORDINATE_KEYS = ['part_number', 'measure_number', 'staff_number', 'voice_number', 'beat_number', 'chord_number']
+_COORDINATE_CLASS_INDICES = {kind.value: index for index, kind in enumerate(
+    [_NodeKind.SCORE, _NodeKind.PART, _NodeKind.MEASURE, _NodeKind.STAFF, _NodeKind.VOICE, _NodeKind.BEAT,
+     _NodeKind.CHORD])}
+
+
 class MusicTree(Tree):
     """
     MusicTree is the parent class of all music tree objects:
@@ -23,12 +56,16 @@ class MusicTree(Tree):
         - :obj:`~musicscore.accidental.Accidental` (9th layer)
     """
     _ATTRIBUTES = {'show_accidental_signs'}
+    _node_kind = None
 
     default_show_accidental_signs = 'modern'  #: Class attribute of :obj:`~musicscore.musictree.MusicTree`
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._show_accidental_signs = None
+        # Flat lists of descendent beats and chords. Reset by _reset_iterators() after each structural change.
+        self._flat_beats = None
+        self._flat_chords = None
 
     @staticmethod
     def _check_args_kwargs(args, kwargs, class_name, get_class_name=None):
@@ -39,15 +76,9 @@ class MusicTree(Tree):
             if not isinstance(x, int) or x < 1:
                 raise TypeError(f'kwargs values {kwargs} must be positive integers')
 
-        def _get_default_keys():
-            default_keys = ['part_number', 'measure_number', 'staff_number', 'voice_number', 'beat_number',
-                            'chord_number']
-            class_names = ['Score', 'Part', 'Measure', 'Staff', 'Voice', 'Beat', 'Chord']
-            class_index = class_names.index(class_name)
-            get_class_index = -1 if not get_class_name else class_names.index(get_class_name)
-            return default_keys[class_index:get_class_index]
-
-        default_keys = _get_default_keys()
+        class_index = _COORDINATE_CLASS_INDICES[class_name]
+        get_class_index = -1 if not get_class_name else _COORDINATE_CLASS_INDICES[get_class_name]
+        default_keys = _COORDINATE_KEYS[class_index:get_class_index]
         if args and kwargs:
             raise ValueError('Both args and kwargs cannot be set')
         if args:
@@ -62,40 +93,26 @@ class MusicTree(Tree):
         return kwargs
 
     def _check_child_to_be_added(self, child):
-        if not isinstance_as_string(child, 'MusicTree'):
+        if not isinstance(child, MusicTree):
             raise MusicTreeTypeError(f'MusicTree child must be of type MusicTree not {child.__class__}')
-
-        parent_child = {'Score': 'Part', 'Part': 'Measure', 'Measure': 'Staff', 'Staff': 'Voice', 'Voice': 'Beat',
-                        'Beat': 'Chord', 'GraceChord': 'Note', 'Rest': 'Note',
-                        'Chord': 'Note', 'Note': 'Midi', 'Midi': 'Accidental', 'C': 'Accidental', 'D': 'Accidental',
-                        'E': 'Accidental',
-                        'F': 'Accidental', 'G': 'Accidental', 'A': 'Accidental', 'B': 'Accidental'}
-
         try:
-            if not isinstance_as_string(child, parent_child[self.__class__.__name__]):
-                raise MusicTreeTypeError(
-                    f'{self.__class__.__name__} accepts only children of type {parent_child[self.__class__.__name__]} not '
-                    f'{child.__class__.__name__}')
+            permitted_child_kind = _PERMITTED_CHILD_KINDS[self._node_kind]
         except KeyError:
             raise NotImplementedError(f'{self.__class__.__name__} add_child() not implemented.')
+        if child.__class__._node_kind is not permitted_child_kind:
+            raise MusicTreeTypeError(
+                f'{self.__class__.__name__} accepts only children of type {permitted_child_kind.value} not '
+                f'{child.__class__.__name__}')
+
+    def _reset_iterators(self):
+        self._flat_beats = None
+        self._flat_chords = None
+        super()._reset_iterators()
 
     def _get_kwargs(self, args_, kwargs_, get_class_name):
-        if isinstance_as_string(self, 'Score'):
-            return self._check_args_kwargs(args_, kwargs_, 'Score', get_class_name)
-        elif isinstance_as_string(self, 'Part'):
-            return self._check_args_kwargs(args_, kwargs_, 'Part', get_class_name)
-        elif isinstance_as_string(self, 'Measure'):
-            return self._check_args_kwargs(args_, kwargs_, 'Measure', get_class_name)
-        elif isinstance_as_string(self, 'Staff'):
-            return self._check_args_kwargs(args_, kwargs_, 'Staff', get_class_name)
-        elif isinstance_as_string(self, 'Voice'):
-            return self._check_args_kwargs(args_, kwargs_, 'Voice', get_class_name)
-        elif isinstance_as_string(self, 'Beat'):
-            return self._check_args_kwargs(args_, kwargs_, 'Beat', get_class_name)
-        elif isinstance_as_string(self, 'Chord'):
-            return self._check_args_kwargs(args_, kwargs_, 'Chord', get_class_name)
-        else:
+        if self._node_kind is None or self._node_kind.value not in _COORDINATE_CLASS_INDICES:
             raise MusicTreeTypeError(f'MusicTree descendents of type {self.__class__} cannot use this method.')
+        return self._check_args_kwargs(args_, kwargs_, self._node_kind.value, get_class_name)
 
     def _get_music_tree_descendent(self, args, kwargs, get_class_name):
         kwargs = self._get_kwargs(args, kwargs, get_class_name)
@@ -103,19 +120,14 @@ class MusicTree(Tree):
         if not kwargs:
             raise TypeError
 
-        if len(kwargs) == 1:
-            try:
-                return self.get_children()[list(kwargs.values())[0] - 1]
-            except IndexError:
-                return None
-        else:
-            output = self
-            for key in kwargs:
-                string_to_eval = f"output.get_{key.split('_')[0]}(kwargs['{key}'])"
-                output = eval(string_to_eval)
-                if not output:
+        output = self
+        for key in _COORDINATE_KEYS:
+            if key in kwargs:
+                try:
+                    output = output.get_children()[kwargs[key] - 1]
+                except IndexError:
                     return None
-            return output
+        return output
 
     @property
     def show_accidental_signs(self) -> str:
@@ -182,19 +194,16 @@ class MusicTree(Tree):
         This method can be used for :obj:`~musicscore.score.Score` and :obj:`~musicscore.part.Part`, :obj:`~musicscore.measure.Measure`,
         :obj:`~musicscore.staff.Staff` and :obj:`~musicscore.voice.Voice`.
 
+        The flat list is cached until beats are added or removed.
+
         :return: a flat list of all beats.
         :rtype: List[:obj:`~musicscore.beat.Beat`]
         """
-        if isinstance_as_string(self, 'Voice'):
+        if self._node_kind is _NodeKind.VOICE:
             return self.get_children()
-        else:
-            output = [ch for child in self.get_children() for ch in child.get_beats()]
-            if not output:
-                for cls_name in ['Beat', 'Chord', 'Note', 'Midi', 'Accidental']:
-                    if isinstance_as_string(self, cls_name):
-                        raise MusicTreeTypeError(
-                            f'MusicTree descendents of type {self.__class__} cannot use this method.')
-            return output
+        if self._flat_beats is None:
+            self._flat_beats = list(self.iter_beats())
+        return list(self._flat_beats)
 
     def get_chords(self) -> List['Chord']:
         """
@@ -203,19 +212,48 @@ class MusicTree(Tree):
         This method can be used for :obj:`~musicscore.score.Score` and :obj:`~musicscore.part.Part`, :obj:`~musicscore.measure.Measure` and
         :obj:`~musicscore.staff.Staff`, :obj:`~musicscore.voice.Voice` and :obj:`~musicscore.beat.Beat`
 
+        The flat list is cached until chords are added, removed or split.
+
         :return: a flat list of all chords.
         :rtype: List[:obj:`~musicscore.chord.Chord`]
         """
-        if isinstance_as_string(self, 'Beat'):
+        if self._node_kind is _NodeKind.BEAT:
             return self.get_children()
+        if self._flat_chords is None:
+            self._flat_chords = list(self.iter_chords())
+        return list(self._flat_chords)
+
+    def iter_beats(self) -> Iterator['Beat']:
+        """
+        :obj:`~musicscore.musictree.MusicTree` method
+
+        Same as :obj:`get_beats` without creating any lists.
+
+        :return: generator of all beats.
+        """
+        if self._node_kind in _NO_BEATS_KINDS:
+            raise MusicTreeTypeError(f'MusicTree descendents of type {self.__class__} cannot use this method.')
+        if self._node_kind is _NodeKind.VOICE:
+            yield from self.get_children()
+        else:
+            for child in self.get_children():
+                yield from child.iter_beats()
+
+    def iter_chords(self) -> Iterator['Chord']:
+        """
+        :obj:`~musicscore.musictree.MusicTree` method
+
+        Same as :obj:`get_chords` without creating any lists.
+
+        :return: generator of all chords.
+        """
+        if self._node_kind in _NO_CHORDS_KINDS:
+            raise MusicTreeTypeError(f'MusicTree descendents of type {self.__class__} cannot use this method.')
+        if self._node_kind is _NodeKind.BEAT:
+            yield from self.get_children()
         else:
-            output = [ch for child in self.get_children() for ch in child.get_chords()]
-            if not output:
-                for cls_name in ['Chord', 'Note', 'Midi', 'Accidental']:
-                    if isinstance_as_string(self, cls_name):
-                        raise MusicTreeTypeError(
-                            f'MusicTree descendents of type {self.__class__} cannot use this method.')
-            return output
+            for child in self.get_children():
+                yield from child.iter_chords()
 
     def get_measure(self, *args, **kwargs) -> 'Measure':
         """
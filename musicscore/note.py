@@ -1,11 +1,11 @@
 from typing import Optional, List
 
-from musicscore.musictree import MusicTree
+from musicscore.musictree import MusicTree, _NodeKind
 from musicscore.exceptions import NoteTypeError, NoteHasNoParentChordError, NoteMidiHasNoParentChordError
 from musicscore.midi import Midi
 from musicscore.quarterduration import QuarterDurationMixin
 from musicscore.util import note_types
-from musicscore.xmlwrapper import XMLWrapper
+from musicscore.xmlwrapper import XMLWrapper, _create_xml_element
 from musicxml.xmlelement.xmlelement import XMLNote, XMLDot, XMLGrace, XMLRest, XMLTie, XMLNotations, XMLTied, XMLBeam
 
 __all__ = ['Note', 'tie', 'untie']
@@ -45,6 +45,7 @@ class Note(MusicTree, XMLWrapper, QuarterDurationMixin):
 
     Child type: :obj:`~musicscore.midi.Midi`
     """
+    _node_kind = _NodeKind.NOTE
 
     _ATTRIBUTES = {'midi', 'quarter_duration', 'parent_chord', 'is_tied', 'is_tied_to_previous'}
 
@@ -53,7 +54,7 @@ class Note(MusicTree, XMLWrapper, QuarterDurationMixin):
     def __init__(self, midi, quarter_duration=None, *args, **kwargs):
         self._midi = None
         self._parent_chord = midi.parent_chord
-        self._xml_object = self.XMLClass(*args, **kwargs)
+        self._xml_object = _create_xml_element(self.XMLClass, *args, **kwargs)
 
         super().__init__(quarter_duration=quarter_duration)
         self.midi = midi
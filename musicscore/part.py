@@ -1,36 +1,121 @@
-from typing import List, Optional, Union, Tuple
+from contextvars import ContextVar
+from math import ceil
+from typing import List, Optional, Union, Tuple, Iterable
+from weakref import WeakValueDictionary
 
 from musicscore import Chord
-from musicscore.exceptions import IdHasAlreadyParentOfSameTypeError, IdWithSameValueExistsError, VoiceIsFullError, \
+from musicscore.beat import _quantize_beats
+from musicscore.chord import GraceChord
+from musicscore.exceptions import IdHasAlreadyParentOfSameTypeError, IdWithSameValueExistsError, \
     AlreadyFinalizedError
 from musicscore.finalize import FinalizeMixin
 from musicscore.measure import Measure
-from musicscore.musictree import MusicTree
+from musicscore.musictree import MusicTree, _NodeKind
 from musicscore.quantize import QuantizeMixin
+from musicscore.simpleformat import ColumnarSimpleFormat
 from musicscore.time import Time
-from musicscore.xmlwrapper import XMLWrapper
+from musicscore.xmlwrapper import XMLWrapper, _create_xml_element
 from musicxml.xmlelement.xmlelement import XMLPart, XMLScorePart
 
-__all__ = ['Id', 'ScorePart', 'Part']
+__all__ = ['IdRegistry', 'get_current_id_registry', 'Id', 'ScorePart', 'Part']
+
+
+class IdRegistry:
+    """
+    Registry of unique :obj:`Id` values. Ids are held by weak references, so they are removed automatically as soon as
+    they (and their parts) are garbage collected. Each :obj:`~musicscore.score.Score` has its own registry. Ids of parts
+    added to a score are moved to it.
+
+    New Ids are registered in the current registry. Outside any ``with`` block it is a module wide default registry.
+    Using a registry as context manager makes it the current registry of this thread or task:
+
+    .. code-block:: python
+
+        with IdRegistry():
+            part = Part('p1')
+    """
+
+    def __init__(self):
+        self._ids = WeakValueDictionary()
+        self._tokens = []
+
+    def _add(self, id_):
+        self._ids[id_.value] = id_
+
+    def _check_value(self, value, id_=None):
+        existing = self._ids.get(value)
+        if existing is not None and existing is not id_:
+            raise IdWithSameValueExistsError
+
+    def _remove(self, id_):
+        if self._ids.get(id_.value) is id_:
+            del self._ids[id_.value]
+
+    def clear(self) -> None:
+        """
+        Removes all Ids from registry.
+        """
+        self._ids.clear()
+
+    def get(self, value) -> Optional['Id']:
+        """
+        :return: registered :obj:`Id` with this value or ``None``
+        """
+        return self._ids.get(value)
+
+    def __contains__(self, id_):
+        return self._ids.get(id_.value) is id_
+
+    def __iter__(self):
+        return iter(list(self._ids.values()))
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __enter__(self):
+        self._tokens.append(_CURRENT_ID_REGISTRY.set(self))
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _CURRENT_ID_REGISTRY.reset(self._tokens.pop())
+
+
+_DEFAULT_ID_REGISTRY = IdRegistry()
+_CURRENT_ID_REGISTRY = ContextVar('musicscore_id_registry', default=_DEFAULT_ID_REGISTRY)
+
+
+def get_current_id_registry() -> IdRegistry:
+    """
+    :return: :obj:`IdRegistry` in which new :obj:`Id` objects are registered.
+    """
+    return _CURRENT_ID_REGISTRY.get()
+
+
+class _CurrentIdRegistryDescriptor:
+    def __get__(self, instance, owner):
+        return get_current_id_registry()
 
 
 class Id:
     """
-    This class uses the class attribute __refs__ of type list to keep track of all :obj:`~musicscore.part.Part` ids of one score to make sure they are unique.
+    This class uses an :obj:`IdRegistry` to keep track of all :obj:`~musicscore.part.Part` ids of one score to make sure
+    they are unique. The class attribute __refs__ returns the current registry (see :obj:`get_current_id_registry`).
     """
-    __refs__ = []
+    __refs__ = _CurrentIdRegistryDescriptor()
 
     def __init__(self, value):
         self._parents = []
         self._value = None
+        self._registry = get_current_id_registry()
         self.value = value
-        self.__refs__.append(self)
 
-    @classmethod
-    def _check_value(cls, val):
-        for obj in cls.__refs__:
-            if obj.value == val:
-                raise IdWithSameValueExistsError
+    def _move_to_registry(self, registry):
+        if registry is self._registry:
+            return
+        registry._check_value(self.value, self)
+        self._registry._remove(self)
+        self._registry = registry
+        registry._add(self)
 
     @property
     def value(self) -> str:
@@ -42,17 +127,18 @@ class Id:
 
     @value.setter
     def value(self, val):
-        self._check_value(val)
+        self._registry._check_value(val, self)
+        self._registry._remove(self)
         self._value = val
+        self._registry._add(self)
         for parent in self.get_parents():
             self.update_parents_id(parent)
 
     def delete(self) -> None:
         """
-        Removes Id instance from class attribute __refs__ before deleting.
+        Removes Id instance from its registry before deleting.
         """
-        if self in self.__refs__:
-            self.__refs__.remove(self)
+        self._registry._remove(self)
         del self
 
     def update_parents_id(self, parent: XMLWrapper) -> None:
@@ -79,10 +165,6 @@ class Id:
     def __repr__(self):
         return f"{self.__class__}:{self.value} at {id(self)}"
 
-    def __del__(self):
-        if self in self.__refs__:
-            self.__refs__.remove(self)
-
 
 class ScorePart(XMLWrapper):
     _ATTRIBUTES = {'part'}
@@ -91,7 +173,7 @@ class ScorePart(XMLWrapper):
 
     def __init__(self, part, *args, **kwargs):
         super().__init__()
-        self._xml_object = self.XMLClass(*args, **kwargs)
+        self._xml_object = _create_xml_element(self.XMLClass, *args, **kwargs)
         self._part = None
         self.part = part
 
@@ -128,6 +210,7 @@ class Part(MusicTree, QuantizeMixin, FinalizeMixin, XMLWrapper):
 
     Child type: :obj:`~musicscore.measure.Measure`
     """
+    _node_kind = _NodeKind.PART
 
     _ATTRIBUTES = {'id_', 'name', 'abbreviation'}
     _ATTRIBUTES = _ATTRIBUTES.union(MusicTree._ATTRIBUTES)
@@ -136,7 +219,7 @@ class Part(MusicTree, QuantizeMixin, FinalizeMixin, XMLWrapper):
 
     def __init__(self, id, name=None, abbreviation=None, *args, **kwargs):
         super().__init__()
-        self._xml_object = self.XMLClass(*args, **kwargs)
+        self._xml_object = _create_xml_element(self.XMLClass, *args, **kwargs)
         self._id = None
         self.id_ = id
         self._score_part = ScorePart(part=self)
@@ -146,12 +229,77 @@ class Part(MusicTree, QuantizeMixin, FinalizeMixin, XMLWrapper):
         self.abbreviation = abbreviation
         self._current_measures = {}
 
-    def _add_to_next_measure(self, current_measure, chord, staff_number, voice_number):
-        if current_measure.next:
-            current_measure = current_measure.next
-        else:
-            current_measure = self.add_measure()
-        current_measure._add_chord(chord, staff_number=staff_number, voice_number=voice_number)
+    def _add_chord(self, chord, staff_number, voice_number):
+        for gch in chord._grace_chords['before']:
+            self._add_chord(gch, staff_number, voice_number)
+
+        current_measure = self._get_or_add_current_measure(staff_number, voice_number)
+        voice = current_measure._add_voice_with_beats(staff_number=staff_number, voice_number=voice_number)
+        if voice.is_filled and not (isinstance(chord, GraceChord) and chord.position == 'after'):
+            current_measure, voice = self._get_next_voice(current_measure, staff_number, voice_number)
+        voice._add_chord(chord)
+
+        for gch in chord._grace_chords['after']:
+            self._add_chord(gch, staff_number, voice_number)
+
+        leftover_chord = voice.leftover_chord
+        while leftover_chord:
+            current_measure, voice = self._get_next_voice(current_measure, staff_number, voice_number)
+            voice._add_chord(leftover_chord)
+            leftover_chord = voice.leftover_chord
+
+    def _add_measures_for_quarter_duration(self, quarter_duration, staff_number, voice_number):
+        # Adds all measures needed to place chords with a total quarter_duration after the current position of the voice.
+        current_measure = self._get_or_add_current_measure(staff_number, voice_number)
+        voice = current_measure._add_voice_with_beats(staff_number=staff_number, voice_number=voice_number)
+        missing_quarter_duration = quarter_duration - sum(
+            [beat.quarter_duration - beat.filled_quarter_duration for beat in voice.get_children()])
+        next_measure = current_measure.next
+        while next_measure and missing_quarter_duration > 0:
+            missing_quarter_duration -= next_measure.quarter_duration
+            next_measure = next_measure.next
+        if missing_quarter_duration > 0:
+            # New measures copy the time of the last measure.
+            last_measure = self.get_children()[-1]
+            self._add_measures(ceil((missing_quarter_duration / last_measure.quarter_duration).value))
+
+    def _add_measure_after(self, previous_measure, time, number):
+        m = Measure(number=number, time=time)
+        child = self.add_child(m)
+        m.key = previous_measure.key.__copy__()
+        m.key.show = False
+
+        for staff in previous_measure.get_children():
+            st = m.add_staff(staff_number=staff.number)
+            if st.clef:
+                st.clef = staff.clef.__copy__()
+                st.clef.show = False
+            if st:
+                st.add_voice(voice_number=1)
+        return child
+
+    def _add_measures(self, number_of_measures):
+        # Adds number_of_measures measures in one pass like calling add_measure() as many times. All of them copy time,
+        # key and clefs of the last measure, which is looked up only once.
+        last_measure = self.get_children()[-1]
+        for number in range(last_measure.number + 1, last_measure.number + 1 + number_of_measures):
+            time = last_measure.time.__copy__()
+            time.show = False
+            self._add_measure_after(last_measure, time, number)
+
+    def _get_next_voice(self, current_measure, staff_number, voice_number):
+        next_measure = current_measure.next
+        if not next_measure:
+            next_measure = self.add_measure()
+        return next_measure, next_measure._add_voice_with_beats(staff_number=staff_number, voice_number=voice_number)
+
+    def _get_or_add_current_measure(self, staff_number, voice_number):
+        current_measure = self.get_current_measure(staff_number=staff_number, voice_number=voice_number)
+        if not current_measure:
+            if self.get_children():
+                current_measure = self.get_children()[0]
+            else:
+                current_measure = self.add_measure()
         return current_measure
 
     def _set_first_current_measure(self, staff_number, voice_number):
@@ -182,10 +330,17 @@ class Part(MusicTree, QuantizeMixin, FinalizeMixin, XMLWrapper):
 
     @id_.setter
     def id_(self, val):
+        # Ids of parts in a score must be unique in the score's registry.
+        score = self.up
         if isinstance(val, Id):
+            if score:
+                val._move_to_registry(score._id_registry)
             self._id = val
         elif isinstance(self._id, Id):
             self._id.value = val
+        elif score:
+            with score._id_registry:
+                self._id = Id(val)
         else:
             self._id = Id(val)
         if self in self.id_.get_parents():
@@ -256,32 +411,41 @@ class Part(MusicTree, QuantizeMixin, FinalizeMixin, XMLWrapper):
         if self._finalized is True:
             raise AlreadyFinalizedError(self, 'add_chord')
 
-        for gch in chord._grace_chords['before']:
-            self.add_chord(gch, staff_number=staff_number, voice_number=voice_number)
-
         if staff_number is None:
             staff_number = 1
-        current_measure = self.get_current_measure(staff_number=staff_number, voice_number=voice_number)
+        self._add_chord(chord, staff_number, voice_number)
 
-        if not current_measure:
-            if self.get_children():
-                current_measure = self.get_children()[0]
-            else:
-                current_measure = self.add_measure()
-        try:
-            current_measure._add_chord(chord, staff_number=staff_number, voice_number=voice_number)
-        except VoiceIsFullError:
-            current_measure = self._add_to_next_measure(current_measure, chord, staff_number, voice_number)
+    def add_chords(self, chords: Iterable['Chord'], *, staff_number: Optional[int] = None,
+                   voice_number: Optional[int] = 1) -> None:
+        """
+        Adds chords one after another to the specified voice like :obj:`add_chord()`. All measures needed for the total quarter
+        duration of chords are added at once beforehand.
 
-        for gch in chord._grace_chords['after']:
-            self.add_chord(gch, staff_number=staff_number, voice_number=voice_number)
+        If chords is a :obj:`~musicscore.simpleformat.ColumnarSimpleFormat` the total quarter duration is taken from its
+        columns and its chords are created one by one while they are added.
 
-        leftover_chord = current_measure.get_voice(staff_number=staff_number, voice_number=voice_number).leftover_chord
-        while leftover_chord:
-            current_measure = self._add_to_next_measure(current_measure, leftover_chord, staff_number,
-                                                        voice_number)
-            leftover_chord = current_measure.get_voice(staff_number=staff_number,
-                                                       voice_number=voice_number).leftover_chord
+        :param chords: iterable of :obj:`~musicscore.chord.Chord`, :obj:`~musicscore.simpleformat.ColumnarSimpleFormat` required
+        :param staff_number: positive int, None. If None is set to 1.
+        :param voice_number: positive_int
+        :return: None
+        """
+        if isinstance(chords, ColumnarSimpleFormat):
+            quarter_duration = chords.quarter_duration if len(chords) else None
+        else:
+            chords = list(chords)
+            for chord in chords:
+                if not isinstance(chord, Chord):
+                    raise TypeError(f'{chord} must be of type Chord.')
+            quarter_duration = sum([chord.quarter_duration for chord in chords]) if chords else None
+        if self._finalized is True:
+            raise AlreadyFinalizedError(self, 'add_chords')
+        if quarter_duration is None:
+            return
+        if staff_number is None:
+            staff_number = 1
+        self._add_measures_for_quarter_duration(quarter_duration, staff_number, voice_number)
+        for chord in chords:
+            self._add_chord(chord, staff_number, voice_number)
 
     def add_measure(self, time: Optional[Union[Time, List, Tuple]] = None, number: Optional[int] = None) -> Measure:
         """
@@ -315,22 +479,11 @@ class Part(MusicTree, QuantizeMixin, FinalizeMixin, XMLWrapper):
             else:
                 number = 1
 
+        if previous_measure:
+            return self._add_measure_after(previous_measure, time, number)
         m = Measure(number=number, time=time)
         child = self.add_child(m)
-        if previous_measure:
-            m.key = previous_measure.key.__copy__()
-            m.key.show = False
-
-            for staff in previous_measure.get_children():
-                st = m.add_staff(staff_number=staff.number)
-                if st.clef:
-                    st.clef = staff.clef.__copy__()
-                    st.clef.show = False
-                if st:
-                    st.add_voice(voice_number=1)
-        else:
-            m.add_voice(staff_number=None, voice_number=1)
-
+        m.add_voice(staff_number=None, voice_number=1)
         return child
 
     def get_current_measure(self, staff_number: Optional[int] = 1, voice_number: int = 1):
@@ -367,8 +520,9 @@ class Part(MusicTree, QuantizeMixin, FinalizeMixin, XMLWrapper):
         else:
             self._current_measures[staff_number] = {voice_number: measure}
 
+    def _quantize_beats(self):
+        _quantize_beats([beat for beat in self.iter_beats() if beat.get_quantized])
+
     def finalize(self) -> None:
-        for beat in self.get_beats():
-            if beat.get_quantized:
-                beat.quantize_quarter_durations()
+        self._quantize_beats()
         super().finalize()
@@ -0,0 +1,41 @@
+import timeit
+import tracemalloc
+
+from musicscore import QuarterDuration
+
+NUMBER_OF_INSTANCES = 100000
+
+
+def create_quarter_durations():
+    return [QuarterDuration(i % 8 / 4) for i in range(NUMBER_OF_INSTANCES)]
+
+
+def add_quarter_durations():
+    output = QuarterDuration(0)
+    for i in range(NUMBER_OF_INSTANCES):
+        output += QuarterDuration(1, 3) + 0.5
+    return output
+
+
+def compare_quarter_durations():
+    qd = QuarterDuration(1, 3)
+    return [qd == QuarterDuration(1, 3) for _ in range(NUMBER_OF_INSTANCES)]
+
+
+def trace_memory():
+    tracemalloc.start()
+    quarter_durations = create_quarter_durations()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f'memory of {len(quarter_durations)} quarter durations: {current / 1000:.0f} KB (peak {peak / 1000:.0f} KB)')
+    print(f'bytes per quarter duration: {current / len(quarter_durations):.1f}')
+
+
+def time_quarter_durations():
+    for function in [create_quarter_durations, add_quarter_durations, compare_quarter_durations]:
+        print(f'{function.__name__}: {timeit.timeit(function, number=1):.3f} s')
+
+
+if __name__ == '__main__':
+    trace_memory()
+    time_quarter_durations()
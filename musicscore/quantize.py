@@ -1,7 +1,7 @@
 from typing import Optional, List
 
 from musicscore.quarterduration import QuarterDuration
-from musicscore.util import isinstance_as_string
+from musicscore.musictree import _NodeKind
 
 
 class QuantizeMixin:
@@ -14,7 +14,7 @@ class QuantizeMixin:
         self.get_quantized = get_quantized
 
     def _get_beat_quarter_duration(self):
-        if isinstance_as_string(self, 'Beat'):
+        if self._node_kind is _NodeKind.BEAT:
             beat_quarter_duration = self.quarter_duration
         else:
             beat_quarter_duration = QuarterDuration(1)
@@ -88,7 +88,7 @@ class QuantizeMixin:
         """
         if beat_quarter_duration is None:
             beat_quarter_duration = self._get_beat_quarter_duration()
-        elif isinstance_as_string(self, 'Beat') and beat_quarter_duration != self.quarter_duration:
+        elif self._node_kind is _NodeKind.BEAT and beat_quarter_duration != self.quarter_duration:
             raise ValueError(
                 f"beat_quarter_duration '{beat_quarter_duration}' must be None or equal to the beat quarter_duration '{self.quarter_duration}'")
 
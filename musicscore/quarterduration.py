@@ -1,10 +1,12 @@
-from typing import List, Union, Optional
+from functools import lru_cache
+from typing import List, Union, Optional, NamedTuple
 from quicktions import Fraction
 import numbers
 
 __all__ = ['QuarterDuration', 'QuarterDurationMixin']
 
-from musicscore.config import NOTETYPES, BEATWISE_EXCEPTIONS, DOTEDTUPLETRATIO, TYPEANDDOTEXCEPTIONS
+from musicscore.config import NOTETYPES, BEATWISE_EXCEPTIONS, DOTEDTUPLETRATIO, TYPEANDDOTEXCEPTIONS, TYPEDURATION, \
+    _TableDict
 from musicscore.exceptions import QuarterDurationIsNotWritable
 
 
@@ -15,6 +17,7 @@ class QuarterDuration(numbers.Rational):
     value property for more information.
     QuarterDuration has all needed magic methods for numeral comparison and conversion.
     """
+    __slots__ = ('_value', '_beat_subdivision', '_beat_quarter_duration', '_type_and_dots')
 
     def __init__(self, *value):
         self._value = None
@@ -77,33 +80,20 @@ class QuarterDuration(numbers.Rational):
 
         return output
 
+    def _get_classification(self):
+        if not self.beat_subdivision:
+            self.beat_subdivision = self.denominator
+        return _classify_quarter_duration(self._value.numerator, self._value.denominator,
+                                          _convert_other(self.beat_quarter_duration), self.beat_subdivision,
+                                          _TableDict.version)
+
     def _get_type_and_dots(self):
         if self.value == 0:
             return None, 0
-        if not self.beat_subdivision:
-            self.beat_subdivision = self.denominator
-        try:
-            type_and_dots = TYPEANDDOTEXCEPTIONS.get(self.beat_quarter_duration).get(self.beat_subdivision).get(
-                self.as_integer_ratio())
-            if type_and_dots:
-                return type_and_dots
-        except AttributeError:
-            pass
-        type = NOTETYPES.get(self.as_integer_ratio())
-        if type:
-            return type, 0
-        else:
-            qd = QuarterDuration(self.value * 2 / 3)
-            type = NOTETYPES.get(qd.as_integer_ratio())
-            if type:
-                return type, 1
-            else:
-                qd = QuarterDuration(self.value * 4 / 7)
-                type = NOTETYPES.get(qd.as_integer_ratio())
-                if type:
-                    return type, 2
-                else:
-                    raise QuarterDurationIsNotWritable(f'quarter duration {self} is not writable.')
+        classification = self._get_classification()
+        if not classification.is_writable:
+            raise QuarterDurationIsNotWritable(f'quarter duration {self} is not writable.')
+        return classification.type, classification.number_of_dots
 
     @property
     def beat_subdivision(self):
@@ -132,7 +122,7 @@ class QuarterDuration(numbers.Rational):
         >>> QuarterDuration(1, 6).denominator
         6
         """
-        return self.value.denominator
+        return self._value.denominator
 
     @property
     def numerator(self):
@@ -143,7 +133,7 @@ class QuarterDuration(numbers.Rational):
         >>> QuarterDuration(1, 6).numerator
         1
         """
-        return self.value.numerator
+        return self._value.numerator
 
     @property
     def type_and_dots(self):
@@ -178,7 +168,7 @@ class QuarterDuration(numbers.Rational):
             self._value = Fraction(val).limit_denominator(1000)
         elif hasattr(val, '__iter__'):
             if len(val) == 1:
-                self._value = Fraction(val[0]).limit_denominator(1000)
+                self._value = _get_fraction(val[0])
             elif len(val) == 2:
                 self._value = Fraction(*val).limit_denominator(1000)
             else:
@@ -203,31 +193,10 @@ class QuarterDuration(numbers.Rational):
     def get_tuplet_ratio(self) -> Optional[tuple]:
         if self.value == 0:
             return None
-        if not self.beat_subdivision:
-            self.beat_subdivision = self.denominator
-        if self.beat_quarter_duration % 3 == 0:
-            if self.beat_subdivision > 9:
-                raise NotImplementedError('Beats with dotted quarter duration and subdivision > 9')
-            else:
-                tupletratio = DOTEDTUPLETRATIO.get(self.beat_subdivision)
-                if tupletratio:
-                    return self.beat_subdivision, tupletratio
-                else:
-                    return None
-        else:
-            if self.beat_subdivision < 3:
-                return None
-            elif self.beat_subdivision > 64:
-                raise NotImplementedError('Beats subdivision > 64')
-            normal_notes = [2, 4, 8, 16, 32]
-            if self.beat_subdivision in normal_notes:
-                return None
-            else:
-                for normal in reversed(normal_notes):
-                    if self.beat_subdivision > normal:
-                        return self.beat_subdivision, normal
-        raise NotImplementedError(
-            f'Quarter duration {self} in a beat with {self.beat_subdivision} and quarter duration {self.beat_quarter_duration}')
+        classification = self._get_classification()
+        if classification.tuplet_error:
+            raise NotImplementedError(classification.tuplet_error)
+        return classification.tuplet_ratio
 
     def get_type(self) -> Optional[str]:
         """
@@ -236,91 +205,91 @@ class QuarterDuration(numbers.Rational):
         return self.type_and_dots[0]
 
     def __repr__(self):
-        return f'{self.value.numerator}/{self.value.denominator}'
+        return f'{self._value.numerator}/{self._value.denominator}'
 
     def __str__(self):
-        return f'QuarterDuration: {str(self.value)}'
+        return f'QuarterDuration: {str(self._value)}'
 
     def __abs__(self):
-        return QuarterDuration(self.value.__abs__())
+        return QuarterDuration(self._value.__abs__())
 
     def __add__(self, other):
-        return QuarterDuration(self.value.__add__(_convert_other(other)))
+        return QuarterDuration(self._value.__add__(_convert_other(other)))
 
     def __ceil__(self):
-        return QuarterDuration(self.value.__ceil__())
+        return QuarterDuration(self._value.__ceil__())
 
     def __floor__(self):
-        return QuarterDuration(self.value.__floor__())
+        return QuarterDuration(self._value.__floor__())
 
     def __floordiv__(self, other):
-        return QuarterDuration(self.value.__floordiv__(_convert_other(other)))
+        return QuarterDuration(self._value.__floordiv__(_convert_other(other)))
 
     def __gt__(self, other):
-        return self.value.__gt__(_convert_other(other))
+        return self._value.__gt__(_convert_other(other))
 
     def __ge__(self, other):
-        return self.value.__ge__(_convert_other(other))
+        return self._value.__ge__(_convert_other(other))
 
     def __hash__(self):
-        return self.value.__hash__()
+        return self._value.__hash__()
 
     def __le__(self, other):
-        return self.value.__le__(_convert_other(other))
+        return self._value.__le__(_convert_other(other))
 
     def __lt__(self, other):
-        return QuarterDuration(self.value.__lt__(_convert_other(other)))
+        return QuarterDuration(self._value.__lt__(_convert_other(other)))
 
     def __mod__(self, other):
-        return QuarterDuration(self.value.__mod__(_convert_other(other)))
+        return QuarterDuration(self._value.__mod__(_convert_other(other)))
 
     def __mul__(self, other):
-        return QuarterDuration(self.value.__mul__(_convert_other(other)))
+        return QuarterDuration(self._value.__mul__(_convert_other(other)))
 
     def __neg__(self):
-        return self.value.__neg__()
+        return self._value.__neg__()
 
     def __pos__(self):
-        return self.value.__pos__()
+        return self._value.__pos__()
 
     def __pow__(self, power, modulo=None):
-        return QuarterDuration(self.value.__pos__(power, modulo))
+        return QuarterDuration(self._value.__pos__(power, modulo))
 
     def __radd__(self, other):
-        return QuarterDuration(self.value.__radd__(_convert_other(other)))
+        return QuarterDuration(self._value.__radd__(_convert_other(other)))
 
     def __rfloordiv__(self, other):
-        return QuarterDuration(self.value.__rfloordiv__(_convert_other(other)))
+        return QuarterDuration(self._value.__rfloordiv__(_convert_other(other)))
 
     def __rmod__(self, other):
-        return QuarterDuration(self.value.__rmod__(_convert_other(other)))
+        return QuarterDuration(self._value.__rmod__(_convert_other(other)))
 
     def __rmul__(self, other):
-        return QuarterDuration(self.value.__rmul__(_convert_other(other)))
+        return QuarterDuration(self._value.__rmul__(_convert_other(other)))
 
     def __round__(self, n=None):
-        return QuarterDuration(self.value.__round__(n))
+        return QuarterDuration(self._value.__round__(n))
 
     def __rpow__(self, other):
-        return QuarterDuration(self.value.__rpow__(_convert_other(other)))
+        return QuarterDuration(self._value.__rpow__(_convert_other(other)))
 
     def __rtruediv__(self, other):
-        return QuarterDuration(self.value.__rtruediv__(_convert_other(other)))
+        return QuarterDuration(self._value.__rtruediv__(_convert_other(other)))
 
     def __truediv__(self, other):
-        return QuarterDuration(self.value.__truediv__(_convert_other(other)))
+        return QuarterDuration(self._value.__truediv__(_convert_other(other)))
 
     def __trunc__(self):
-        return self.value.__trunc__()
+        return self._value.__trunc__()
 
     def __eq__(self, other):
-        return self.value.__eq__(_convert_other(other))
+        return self._value.__eq__(_convert_other(other))
 
     def __copy__(self):
-        return self.__class__(self.value)
+        return self.__class__(Fraction(self._value))
 
     def __deepcopy__(self, memodict={}):
-        return self.__class__(self.value)
+        return self.__class__(Fraction(self._value))
 
 
 def _is_writable(quarter_duration: Union[float, int, Fraction, 'QuarterDuration']):
@@ -337,37 +306,112 @@ def _is_writable(quarter_duration: Union[float, int, Fraction, 'QuarterDuration'
     >>> _is_writable(3/8)
     True
     """
-    writables = {1 / 64,
-                 1 / 32,
-                 3 / 64,
-                 1 / 16,
-                 3 / 32,
-                 1 / 8,
-                 3 / 16,
-                 1 / 4,
-                 3 / 8,
-                 1 / 2,
-                 3 / 4,
-                 1,
-                 3 / 2,
-                 2,
-                 3,
-                 4,
-                 6,
-                 8,
-                 12}
-
-    if quarter_duration in writables:
-        return True
-    else:
-        return False
+    return quarter_duration in _WRITABLE_QUARTER_DURATIONS
+
+
+_WRITABLE_QUARTER_DURATIONS = frozenset(
+    {1 / 64, 1 / 32, 3 / 64, 1 / 16, 3 / 32, 1 / 8, 3 / 16, 1 / 4, 3 / 8, 1 / 2, 3 / 4, 1, 3 / 2, 2, 3, 4, 6, 8, 12})
+
+
+class _DurationClassification(NamedTuple):
+    type: Optional[str]
+    number_of_dots: int
+    is_writable: bool
+    tuplet_ratio: Optional[tuple]
+    tuplet_error: Optional[str]
+
+
+def _get_type_and_dots(numerator, denominator, beat_quarter_duration, beat_subdivision):
+    try:
+        type_and_dots = TYPEANDDOTEXCEPTIONS.get(beat_quarter_duration).get(beat_subdivision).get(
+            (numerator, denominator))
+        if type_and_dots:
+            return type_and_dots
+    except AttributeError:
+        pass
+    value = Fraction(numerator, denominator)
+    for number_of_dots, factor in enumerate((1, Fraction(2, 3), Fraction(4, 7))):
+        probe = value * factor
+        type = NOTETYPES.get((probe.numerator, probe.denominator))
+        if type:
+            return type, number_of_dots
+    return None
+
+
+def _get_tuplet_ratio(quarter_duration, beat_quarter_duration, beat_subdivision):
+    # returns tuplet ratio and error message
+    if beat_quarter_duration % 3 == 0:
+        if beat_subdivision > 9:
+            return None, 'Beats with dotted quarter duration and subdivision > 9'
+        tupletratio = DOTEDTUPLETRATIO.get(beat_subdivision)
+        if tupletratio:
+            return (beat_subdivision, tupletratio), None
+        return None, None
+    if beat_subdivision < 3:
+        return None, None
+    elif beat_subdivision > 64:
+        return None, 'Beats subdivision > 64'
+    normal_notes = [2, 4, 8, 16, 32]
+    if beat_subdivision in normal_notes:
+        return None, None
+    for normal in reversed(normal_notes):
+        if beat_subdivision > normal:
+            return (beat_subdivision, normal), None
+    return None, f'Quarter duration {quarter_duration} in a beat with {beat_subdivision} and quarter duration ' \
+                 f'{beat_quarter_duration}'
+
+
+@lru_cache(maxsize=4096)
+def _classify_quarter_duration(numerator, denominator, beat_quarter_duration, beat_subdivision, tables_version):
+    # Type, number of dots and tuplet ratio of a quarter duration in a beat. tables_version is the version of config
+    # tables: changing NOTETYPES, TYPEANDDOTEXCEPTIONS or DOTEDTUPLETRATIO invalidates all classifications.
+    type_and_dots = _get_type_and_dots(numerator, denominator, beat_quarter_duration, beat_subdivision)
+    tuplet_ratio, tuplet_error = _get_tuplet_ratio(QuarterDuration(numerator, denominator), beat_quarter_duration,
+                                                   beat_subdivision)
+    if type_and_dots:
+        return _DurationClassification(*type_and_dots, True, tuplet_ratio, tuplet_error)
+    return _DurationClassification(None, 0, False, tuplet_ratio, tuplet_error)
+
+
+@lru_cache(maxsize=256)
+def _get_printed_quarter_duration(type, number_of_dots, tuplet_ratio):
+    printed_duration = _get_fraction(TYPEDURATION[type])
+    for _ in range(number_of_dots):
+        printed_duration += printed_duration / 2
+    if tuplet_ratio:
+        printed_duration *= Fraction(tuplet_ratio[1], tuplet_ratio[0])
+    return printed_duration
+
+
+# Intern table of fractions with a denominator limit of 1000 for frequent int and float values (0, 1/64 ... 12, tuplets
+# etc.). It is completed at runtime with other int and float values up to _MAX_NUMBER_OF_INTERNED_FRACTIONS entries.
+_INTERNED_FRACTIONS = {n / d: Fraction(n, d) for d in [1, 2, 3, 4, 5, 6, 7, 8, 16, 32, 64] for n in range(12 * d + 1)}
+_MAX_NUMBER_OF_INTERNED_FRACTIONS = 10000
+
+
+def _get_fraction(val):
+    # Fraction(val).limit_denominator(1000) with fast paths for already limited Fractions and interned values.
+    val_type = type(val)
+    if val_type is Fraction:
+        if val.denominator <= 1000:
+            return val
+    elif val_type is int or val_type is float:
+        fraction = _INTERNED_FRACTIONS.get(val)
+        if fraction is None:
+            fraction = Fraction(val).limit_denominator(1000)
+            if len(_INTERNED_FRACTIONS) < _MAX_NUMBER_OF_INTERNED_FRACTIONS:
+                _INTERNED_FRACTIONS[val] = fraction
+        return fraction
+    return Fraction(val).limit_denominator(1000)
 
 
 def _convert_other(other):
+    if other.__class__ is QuarterDuration:
+        return other._value
     if isinstance(other, QuarterDuration):
         return other.value
 
-    return Fraction(other).limit_denominator(1000)
+    return _get_fraction(other)
 
 
 class QuarterDurationMixin:
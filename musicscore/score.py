@@ -1,18 +1,23 @@
-from typing import Union, Optional
+import multiprocessing
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from typing import Union, Optional, Iterator, List
 
 from musicscore import Part, Chord
+from musicscore.part import IdRegistry
 from musicscore.chord import Rest
-from musicscore.exceptions import AlreadyFinalizedError, ScoreMultiMeasureRestError
+from musicscore.exceptions import AlreadyFinalizedError, ScoreMultiMeasureRestError, ScorePartHasAnotherParentError
 from musicscore.finalize import FinalizeMixin
 from musicscore.layout import Scaling, PageLayout, SystemLayout, StaffLayout
-from musicscore.musictree import MusicTree
+from musicscore.musictree import MusicTree, _NodeKind
 from musicscore.quantize import QuantizeMixin
 from musicscore.quarterduration import QuarterDuration
-from musicscore.xmlwrapper import XMLWrapper
+from musicscore.serializer import write_xml_element
+from musicscore.xmlwrapper import XMLWrapper, _create_xml_element
 from musicxml.xmlelement.xmlelement import XMLScorePartwise, XMLPartList, XMLCredit, XMLCreditWords, XMLIdentification, \
     XMLEncoding, \
     XMLSupports, XMLScorePart, XMLPartGroup, XMLGroupSymbol, XMLGroupBarline, XMLGroupName, XMLGroupAbbreviation, \
-    XMLMeasureStyle
+    XMLMeasureStyle, XMLPart
 
 __all__ = ['TITLE', 'SUBTITLE', 'POSSIBLE_SUBDIVISIONS', 'Score']
 #:
@@ -28,6 +33,31 @@ SUBTITLE = {'font_size': 18, 'default_x': {'A4': {'portrait': 616}}, 'default_y'
 POSSIBLE_SUBDIVISIONS = {QuarterDuration(1, 4): [2, 3], QuarterDuration(1, 2): [2, 3, 4, 5],
                          QuarterDuration(1): [2, 3, 4, 5, 6, 7, 8]}
 
+_XML_HEADER = """<?xml version="1.0" encoding="UTF-8" standalone="no"?>
+<!DOCTYPE score-partwise PUBLIC
+    "-//Recordare//DTD MusicXML 4.0 Partwise//EN"
+    "http://www.musicxml.org/dtds/partwise.dtd">
+"""
+
+_XML_PLACEHOLDER = 'musicscore-placeholder'
+
+
+def _split_at_placeholders(et_element, level):
+    ET.indent(et_element, space="  ", level=level)
+    return ET.tostring(et_element, encoding='unicode').split(f'<{_XML_PLACEHOLDER} />')
+
+
+_WORKER_SCORE = None
+
+
+def _set_worker_score(score):
+    global _WORKER_SCORE
+    _WORKER_SCORE = score
+
+
+def _finalize_part_to_string_in_worker(part_index, direct):
+    return _WORKER_SCORE._finalize_part_to_string(_WORKER_SCORE.get_children()[part_index], direct)
+
 
 class Score(MusicTree, QuantizeMixin, FinalizeMixin, XMLWrapper):
     """
@@ -35,18 +65,19 @@ class Score(MusicTree, QuantizeMixin, FinalizeMixin, XMLWrapper):
 
     Child type: :obj:`~musicscore.part.Part`
     """
+    _node_kind = _NodeKind.SCORE
     _ATTRIBUTES = {'version', 'title', 'subtitle', 'scaling', 'page_layout', 'system_layout', 'staff_layout',
-                   'new_system'}
+                   'new_system', 'validate'}
     _ATTRIBUTES = _ATTRIBUTES.union(MusicTree._ATTRIBUTES)
     _ATTRIBUTES = _ATTRIBUTES.union(QuantizeMixin._ATTRIBUTES)
 
     XMLClass = XMLScorePartwise
 
-    def __init__(self, version='4.0', title=None, subtitle=None, get_quantized=False, new_system=False, *args,
-                 **kwargs):
+    def __init__(self, version='4.0', title=None, subtitle=None, get_quantized=False, new_system=False, validate=True,
+                 *args, **kwargs):
 
         super().__init__(get_quantized=get_quantized)
-        self._xml_object = self.XMLClass(*args, **kwargs)
+        self._xml_object = _create_xml_element(self.XMLClass, *args, **kwargs)
         self._update_xml_object()
         self._version = None
         self._title = None
@@ -56,6 +87,7 @@ class Score(MusicTree, QuantizeMixin, FinalizeMixin, XMLWrapper):
         self._staff_layout = None
         self._scaling = None
         self._new_system = None
+        self._validate = None
 
         self.scaling = Scaling()
         self.page_layout = PageLayout()
@@ -64,11 +96,20 @@ class Score(MusicTree, QuantizeMixin, FinalizeMixin, XMLWrapper):
         self.title = title
         self.subtitle = subtitle
         self.new_system = new_system
+        self.validate = validate
         self._possible_subdivisions = POSSIBLE_SUBDIVISIONS.copy()
 
         self._measure_numbers_within_multi_measure_rests = set()
+        self._id_registry = IdRegistry()
 
         self._final_updated = False
+        # True as soon as iter_xml_chunks() has started to remove measures.
+        self._consumed = False
+
+    def _complete_parts(self):
+        self._create_missing_measures()
+        self._set_missing_barlines()
+        self._set_last_barline()
 
     def _create_missing_measures(self):
         number_of_measures = max([len(p.get_children()) for p in self.get_children()])
@@ -89,6 +130,49 @@ class Score(MusicTree, QuantizeMixin, FinalizeMixin, XMLWrapper):
         output['default_y'] = SUBTITLE['default_y']['A4']['portrait']
         return output
 
+    def _finalize_part_to_string(self, part: 'Part', direct: bool = False) -> str:
+        part.finalize()
+        for measure_number in self._measure_numbers_within_multi_measure_rests:
+            for ch in part.get_measure(measure_number).iter_chords():
+                ch.notes[0].xml_rest.measure = 'yes'
+        if direct:
+            return write_xml_element(part.xml_object, level=1)
+        if part.xml_object.xsd_check:
+            part.xml_object._final_checks()
+        return ET.tostring(part.xml_object.et_xml_element, encoding='unicode')
+
+    def _get_part_xml_frame(self, part: 'Part') -> List[str]:
+        # [opening tag, closing tag] of part's xml element with the indentation of a complete score
+        et_part = ET.Element(part.xml_object.name, {k: str(v) for k, v in part.xml_object.attributes.items()})
+        et_part.append(ET.Element(_XML_PLACEHOLDER))
+        return _split_at_placeholders(et_part, level=1)
+
+    def _get_xml_frame(self) -> List[str]:
+        # score's xml string split at its parts: [before first part, between first and second part, ..., after last part]
+        et_score = ET.Element(self.xml_object.name, {k: str(v) for k, v in self.xml_object.attributes.items()})
+        for child in self.xml_object.get_children():
+            if isinstance(child, XMLPart):
+                et_score.append(ET.Element(_XML_PLACEHOLDER))
+            else:
+                if child.xsd_check:
+                    child._final_checks()
+                et_score.append(child.et_xml_element)
+        frame = _split_at_placeholders(et_score, level=0)
+        frame[-1] += '\n'
+        return frame
+
+    def _to_string_in_processes(self, workers: int, direct: bool = False) -> str:
+        self._complete_parts()
+        frame = self._get_xml_frame()
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork'),
+                                 initializer=_set_worker_score, initargs=(self,)) as executor:
+            part_strings = list(executor.map(_finalize_part_to_string_in_worker, range(len(self.get_children())),
+                                             [direct] * len(self.get_children())))
+        output = frame[0]
+        for part_string, text_after_part in zip(part_strings, frame[1:]):
+            output += part_string + text_after_part
+        return output
+
     def _set_last_barline(self):
         last_measures = [p.get_children()[-1] for p in self.get_children() if p.get_children()]
         try:
@@ -277,6 +361,23 @@ class Score(MusicTree, QuantizeMixin, FinalizeMixin, XMLWrapper):
                 credit.up.remove(credit)
                 self._title = None
 
+    @property
+    def validate(self) -> bool:
+        """
+        Set or get validate property. If ``True`` (default) the musicxml children of each
+        :obj:`~musicscore.measure.Measure` are checked once after they are attached while finalizing. If ``False`` this
+        check is skipped.
+
+        :type: bool
+        """
+        return self._validate
+
+    @validate.setter
+    def validate(self, val):
+        if not isinstance(val, bool):
+            raise TypeError(f"validate {val} must be of type bool and not {val.__class__}")
+        self._validate = val
+
     @property
     def version(self) -> str:
         """
@@ -296,6 +397,9 @@ class Score(MusicTree, QuantizeMixin, FinalizeMixin, XMLWrapper):
         - Check and add child to list of children. Child's parent is set to self.
         - Part's ``xml_object`` is add to score's ``xml_object`` as child
         - Part's ``score_part.xml_object`` is added to score's ``xml_part_list``
+        - Part's :obj:`~musicscore.part.Id` is moved to score's :obj:`~musicscore.part.IdRegistry`. If another part of
+          score has the same id value :obj:`~musicscore.exceptions.IdWithSameValueExistsError` is raised.
+        - If part belongs to another score :obj:`~musicscore.exceptions.ScorePartHasAnotherParentError` is raised.
 
         :param child: :obj:`~musicscore.part.Part`, required
         :return: child
@@ -303,6 +407,11 @@ class Score(MusicTree, QuantizeMixin, FinalizeMixin, XMLWrapper):
         """
         if self._finalized is True:
             raise AlreadyFinalizedError(self, 'add_child')
+        if isinstance(child, Part):
+            # Other children are rejected by super().add_child()
+            if child.up is not None and child.up is not self:
+                raise ScorePartHasAnotherParentError(f'Part {child.id_.value} belongs already to another score.')
+            child.id_._move_to_registry(self._id_registry)
         super().add_child(child)
         self.xml_object.add_child(child.xml_object)
         if not self.xml_part_list:
@@ -320,33 +429,42 @@ class Score(MusicTree, QuantizeMixin, FinalizeMixin, XMLWrapper):
         """
         if self._finalized is True:
             raise AlreadyFinalizedError(self, 'add_part')
-        p = Part(id)
+        with self._id_registry:
+            p = Part(id)
         return self.add_child(p)
 
-    def export_xml(self, path: 'pathlib.Path') -> None:
+    def export_xml(self, path: 'pathlib.Path', streaming: bool = False, workers: Optional[int] = None,
+                   direct: bool = False) -> None:
         """
         Creates a musicxml file
 
         :param path: Output xml file
+        :param streaming: If ``True`` the file is written chunk by chunk with :obj:`iter_xml_chunks`. Finalized measures
+                          are written to disk and released as soon as possible. The score is consumed and cannot be
+                          exported a second time. If score is already finalized (but not consumed) it is written in
+                          one piece with :obj:`to_string`.
+        :param workers: see :obj:`to_string`. Cannot be combined with streaming.
+        :param direct: see :obj:`to_string`.
         :return: None
         """
+        if streaming and workers:
+            raise ValueError('export_xml: streaming cannot be combined with workers.')
         with open(path, '+w') as f:
-            f.write("""<?xml version="1.0" encoding="UTF-8" standalone="no"?>
-<!DOCTYPE score-partwise PUBLIC
-    "-//Recordare//DTD MusicXML 4.0 Partwise//EN"
-    "http://www.musicxml.org/dtds/partwise.dtd">
-""")
-            f.write(self.to_string())
+            f.write(_XML_HEADER)
+            if streaming and (not self._finalized or self._consumed):
+                # A consumed score is rejected by iter_xml_chunks()
+                for chunk in self.iter_xml_chunks(direct=direct):
+                    f.write(chunk)
+            else:
+                f.write(self.to_string(workers=workers, direct=direct))
 
     def finalize(self) -> None:
-        self._create_missing_measures()
-        self._set_missing_barlines()
-        self._set_last_barline()
+        self._complete_parts()
         super().finalize()
         for measure_number in self._measure_numbers_within_multi_measure_rests:
             for part in self.get_children():
                 measure = part.get_measure(measure_number)
-                for ch in measure.get_chords():
+                for ch in measure.iter_chords():
                     ch.notes[0].xml_rest.measure = 'yes'
 
     def group_parts(self, number: Union[int, str], start_part_number: int, end_part_number: int, symbol: str = 'square',
@@ -388,6 +506,51 @@ class Score(MusicTree, QuantizeMixin, FinalizeMixin, XMLWrapper):
 
         self.xml_part_list = new_xml_part_list
 
+    def iter_xml_chunks(self, direct: bool = False) -> Iterator[str]:
+        """
+        Finalizes the score measure by measure and yields its musicxml string in chunks. Joined together the chunks are
+        identical to :obj:`to_string`.
+
+        MusicXML partwise needs all measures of a part before the next part can begin. Parts are therefore processed one
+        after the other: Each measure is finalized and yielded before the next measure is finalized. After a
+        measure is yielded, its predecessor is removed from its part so that it can be released from memory. Only the
+        last measure of each part stays in the score.
+
+        :param direct: see :obj:`to_string`.
+        :return: generator of strings
+        """
+        if self._finalized:
+            raise AlreadyFinalizedError(self, 'iter_xml_chunks')
+        self._consumed = True
+        self._complete_parts()
+        frame = self._get_xml_frame()
+        yield frame[0]
+        for part, text_after_part in zip(self.get_children(), frame[1:]):
+            part._quantize_beats()
+            part_opening, part_closing = self._get_part_xml_frame(part)
+            yield part_opening
+            previous_measure = None
+            for measure_number, measure in enumerate(part.get_children()[:], 1):
+                measure.finalize()
+                if measure_number in self._measure_numbers_within_multi_measure_rests:
+                    for ch in measure.iter_chords():
+                        ch.notes[0].xml_rest.measure = 'yes'
+                if not direct:
+                    measure.xml_object._final_checks()
+                if previous_measure:
+                    yield '\n    '
+                    part.remove(previous_measure)
+                    part.xml_object.remove(previous_measure.xml_object)
+                if direct:
+                    yield write_xml_element(measure.xml_object, level=2)
+                else:
+                    yield ET.tostring(measure.xml_object.et_xml_element, encoding='unicode')
+                previous_measure = measure
+            part._finalized = True
+            yield part_closing
+            yield text_after_part
+        self._finalized = True
+
     def set_multi_measure_rest(self, first_measure_number: int, last_measure_number: int) -> None:
         """
         Creates a multi measure rest
@@ -411,7 +574,7 @@ class Score(MusicTree, QuantizeMixin, FinalizeMixin, XMLWrapper):
                 part.add_chord(Chord(0, m.quarter_duration))
 
             for measure in part.get_children()[first_measure_number - 1:last_measure_number]:
-                for ch in measure.get_chords():
+                for ch in measure.iter_chords():
                     if not ch.is_rest:
                         raise ScoreMultiMeasureRestError(
                             f'Measures contain not rest chords')
@@ -424,6 +587,30 @@ class Score(MusicTree, QuantizeMixin, FinalizeMixin, XMLWrapper):
                 self._measure_numbers_within_multi_measure_rests.update(
                     {x for x in range(first_measure_number, last_measure_number + 1)})
 
+    def to_string(self, *args, workers: Optional[int] = None, direct: bool = False, **kwargs) -> str:
+        """
+        :obj:`~musicscore.finalize.FinalizeMixin` method
+
+        :param workers: If larger than 1 and the score is not finalized yet, each part is finalized and converted to
+                        string in a separate process (at most ``workers`` processes at the same time). The part strings
+                        are stitched together in the order of parts. Finalization takes place only in the worker
+                        processes, so the score itself stays unfinalized. This needs the ``fork`` start method of
+                        :obj:`multiprocessing`. On platforms without it the score is finalized and converted in the
+                        current process.
+        :param direct: If ``True`` the finalized xml tree is written with
+                       :obj:`~musicscore.serializer.write_xml_element` instead of building and indenting an
+                       :obj:`xml.etree.ElementTree.Element` tree. Common elements like notes, pitches and measures skip
+                       the generic child container checks. The output is identical.
+        """
+        if workers and workers > 1 and not self._finalized and self.get_children() and \
+                'fork' in multiprocessing.get_all_start_methods():
+            return self._to_string_in_processes(workers, direct)
+        if direct:
+            if not self._finalized:
+                self.finalize()
+            return write_xml_element(self.xml_object, level=0) + '\n'
+        return super().to_string(*args, **kwargs)
+
     def write(self, *args, **kwargs):
         """
         Not implemented. Use Score.export_xml instead!
@@ -0,0 +1,202 @@
+"""
+Direct serialization of musicxml elements.
+
+:obj:`~musicxml.xmlelement.xmlelement.XMLElement.to_string` checks the whole tree first, then builds and indents an
+:obj:`xml.etree.ElementTree.Element` tree and converts it to a string. :obj:`write_xml_element` writes the same string in
+a single pass. For common elements (measures, attributes, time signatures, notes, pitches, rests, time modifications,
+notations, articulations and tuplets) the schema order and the required children are known. These elements do not need
+to ask their child container trees, as long as all their children are listed in the tables below. Any other element,
+and any element with unusual children, is checked and ordered by its child container tree as usual.
+"""
+from musicxml.exceptions import XMLElementChildrenRequired
+from musicxml.xmlelement.xmlelement import XMLNote, XMLPitch, XMLRest, XMLTimeModification, XMLMeasure, XMLAttributes, \
+    XMLTime, XMLNotations, XMLArticulations, XMLTuplet
+
+__all__ = ['write_xml_element']
+
+_INDENTATION = '  '
+
+_NOTE_CHILDREN_AFTER_FULL_NOTE = ('instrument', 'footnote', 'level', 'voice', 'type', 'dot', 'accidental',
+                                  'time-modification', 'stem', 'notehead', 'notehead-text', 'staff', 'beam',
+                                  'notations', 'lyric', 'play', 'listen')
+_FULL_NOTE = ('pitch', 'unpitched', 'rest')
+
+# child name -> index in schema order
+_NOTE_CHILDREN_RANKS = {name: index for index, name in
+                        enumerate(('chord',) + _FULL_NOTE + ('duration', 'tie') + _NOTE_CHILDREN_AFTER_FULL_NOTE)}
+_GRACE_NOTE_CHILDREN_RANKS = {name: index for index, name in
+                              enumerate(('grace', 'chord') + _FULL_NOTE + ('tie',) + _NOTE_CHILDREN_AFTER_FULL_NOTE)}
+_PITCH_CHILDREN_RANKS = {'step': 0, 'alter': 1, 'octave': 2}
+_REST_CHILDREN_RANKS = {'display-step': 0, 'display-octave': 1}
+_TIME_MODIFICATION_CHILDREN_RANKS = {'actual-notes': 0, 'normal-notes': 1, 'normal-type': 2, 'normal-dot': 3}
+_ATTRIBUTES_CHILDREN_RANKS = {name: index for index, name in
+                              enumerate(('footnote', 'level', 'divisions', 'key', 'time', 'staves', 'part-symbol',
+                                         'instruments', 'clef', 'staff-details', 'transpose', 'directive',
+                                         'measure-style'))}
+
+# Children of unbounded choices keep the order in which they were added.
+_MEASURE_CHILDREN = frozenset(('note', 'backup', 'forward', 'direction', 'attributes', 'harmony', 'figured-bass', 'print',
+                               'sound', 'listening', 'barline', 'grouping', 'link', 'bookmark'))
+_NOTATIONS_CHILDREN = frozenset(('tied', 'slur', 'tuplet', 'glissando', 'slide', 'ornaments', 'technical',
+                                 'articulations', 'dynamics', 'fermata', 'arpeggiate', 'non-arpeggiate',
+                                 'accidental-mark', 'other-notation'))
+_ARTICULATIONS_CHILDREN = frozenset(('accent', 'strong-accent', 'staccato', 'tenuto', 'detached-legato',
+                                     'staccatissimo', 'spiccato', 'scoop', 'plop', 'doit', 'falloff', 'breath-mark',
+                                     'caesura', 'stress', 'unstress', 'soft-accent', 'other-articulation'))
+
+
+# Escapes of xml.etree.ElementTree.tostring(), which is used by XMLElement.to_string()
+_TEXT_ESCAPES = (('&', '&amp;'), ('<', '&lt;'), ('>', '&gt;'))
+_ATTRIBUTE_ESCAPES = _TEXT_ESCAPES + (('"', '&quot;'), ('\r', '&#13;'), ('\n', '&#10;'), ('\t', '&#09;'))
+
+
+def _escape(text, escapes):
+    for character, entity in escapes:
+        if character in text:
+            text = text.replace(character, entity)
+    return text
+
+
+def _escape_text(text):
+    return _escape(text, _TEXT_ESCAPES)
+
+
+def _escape_attribute(text):
+    return _escape(text, _ATTRIBUTE_ESCAPES)
+
+
+def _sort_children(children, ranks):
+    try:
+        return sorted(children, key=lambda child: ranks[child.name])
+    except KeyError:
+        return None
+
+
+def _keep_order(children, names):
+    for child in children:
+        if child.name not in names:
+            return None
+    return children
+
+
+def _count_names(children):
+    counts = {}
+    for child in children:
+        name = child.name
+        counts[name] = counts.get(name, 0) + 1
+    return counts
+
+
+def _get_note_children(children):
+    counts = _count_names(children)
+    if 'cue' in counts or sum(counts.get(name, 0) for name in _FULL_NOTE) != 1:
+        return None
+    if 'grace' in counts:
+        return _sort_children(children, _GRACE_NOTE_CHILDREN_RANKS)
+    if counts.get('duration') != 1:
+        return None
+    return _sort_children(children, _NOTE_CHILDREN_RANKS)
+
+
+def _get_pitch_children(children):
+    counts = _count_names(children)
+    if counts.get('step') != 1 or counts.get('octave') != 1:
+        return None
+    return _sort_children(children, _PITCH_CHILDREN_RANKS)
+
+
+def _get_rest_children(children):
+    counts = _count_names(children)
+    if counts and counts != {'display-step': 1, 'display-octave': 1}:
+        return None
+    return _sort_children(children, _REST_CHILDREN_RANKS)
+
+
+def _get_time_modification_children(children):
+    counts = _count_names(children)
+    if counts.get('actual-notes') != 1 or counts.get('normal-notes') != 1 or (
+            'normal-dot' in counts and 'normal-type' not in counts):
+        return None
+    return _sort_children(children, _TIME_MODIFICATION_CHILDREN_RANKS)
+
+
+def _get_time_children(children):
+    if [child.name for child in children] != ['beats', 'beat-type']:
+        return None
+    return children
+
+
+# xml class -> function returning its children in schema order if they are complete and common, otherwise None
+_GET_COMMON_CHILDREN = {
+    XMLMeasure: lambda children: _keep_order(children, _MEASURE_CHILDREN),
+    XMLAttributes: lambda children: _sort_children(children, _ATTRIBUTES_CHILDREN_RANKS),
+    XMLTime: _get_time_children,
+    XMLNote: _get_note_children,
+    XMLPitch: _get_pitch_children,
+    XMLRest: _get_rest_children,
+    XMLTimeModification: _get_time_modification_children,
+    XMLNotations: lambda children: _keep_order(children, _NOTATIONS_CHILDREN),
+    XMLArticulations: lambda children: _keep_order(children, _ARTICULATIONS_CHILDREN),
+    XMLTuplet: lambda children: None if children else children,
+}
+
+
+def _get_checked_children(xml_element):
+    # Same checks as XMLElement._final_checks() without checking children.
+    xml_element._check_required_value()
+    get_common_children = _GET_COMMON_CHILDREN.get(xml_element.__class__)
+    children = get_common_children(xml_element._unordered_children) if get_common_children else None
+    if children is None:
+        if xml_element._child_container_tree:
+            required_children = xml_element._child_container_tree.get_required_element_names(intelligent_choice=False)
+            if required_children:
+                raise XMLElementChildrenRequired(
+                    f"{xml_element.__class__.__name__} requires at least following children: {required_children}")
+        children = xml_element.get_children()
+    xml_element._check_required_attributes()
+    return children
+
+
+def _write(xml_element, level, write):
+    if xml_element.xsd_check:
+        children = _get_checked_children(xml_element)
+    else:
+        children = xml_element._unordered_children
+    name = xml_element.name
+    write('<' + name)
+    for key, value in xml_element.attributes.items():
+        write(f' {key}="{_escape_attribute(str(value))}"')
+    text = xml_element.value_
+    if text is not None:
+        text = str(text)
+    if children:
+        write('>')
+        child_indentation = '\n' + _INDENTATION * (level + 1)
+        if text and text.strip():
+            write(_escape_text(text))
+        else:
+            write(child_indentation)
+        last_index = len(children) - 1
+        for index, child in enumerate(children):
+            _write(child, level + 1, write)
+            write(child_indentation if index < last_index else '\n' + _INDENTATION * level)
+        write('</' + name + '>')
+    elif text:
+        write('>' + _escape_text(text) + '</' + name + '>')
+    else:
+        write(' />')
+
+
+def write_xml_element(xml_element: 'XMLElement', level: int = None) -> str:
+    """
+    Writes an xml element and all its descendants in one pass.
+
+    :param xml_element: :obj:`~musicxml.xmlelement.xmlelement.XMLElement`
+    :param level: indentation level. If None the level of xml_element in its tree is used.
+    :return: the same string as ``xml_element.to_string()`` without its final line break
+    """
+    if level is None:
+        level = xml_element.level
+    output = []
+    _write(xml_element, level, output.append)
+    return ''.join(output)
@@ -1,9 +1,20 @@
+import array
 import copy
+import heapq
+import itertools
+import math
+import operator
+from bisect import bisect_right
 
-from musicscore import Midi, Chord
+from quicktions import Fraction
+
+from musicscore import Midi, Chord, QuarterDuration
 from musicscore.exceptions import SimpleFormatException
+from musicscore.quarterduration import _get_fraction
 from musicscore.util import dToX, xToD
 
+__all__ = ['SimpleFormat', 'ColumnarSimpleFormat']
+
 
 class SimpleFormat(object):
     """
@@ -18,6 +29,10 @@ class SimpleFormat(object):
         self._set_quarter_durations(quarter_durations)
         self._set_midis(midis)
         self._chords = None
+        # _version is increased by all methods which change chords or their quarter durations.
+        self._version = 0
+        self._positions_version = None
+        self._positions = None
 
         self.default_midi = default_midi
 
@@ -28,7 +43,11 @@ class SimpleFormat(object):
             if quarter_duration < 0:
                 raise ValueError('SimpleFormat(): wrong duration {}'.format(quarter_duration))
 
+    def _chords_changed(self):
+        self._version += 1
+
     def _generate_chords(self):
+        self._chords_changed()
         self._chords = []
         if self._quarter_durations == [] and self._midis == []:
             pass
@@ -98,6 +117,13 @@ class SimpleFormat(object):
 
         self._quarter_durations = quarter_durations
 
+    def _get_positions(self):
+        # Cumulative quarter positions of chords, rebuilt only if chords have been changed since.
+        if self._positions_version != self._version:
+            self._positions = dToX(self.get_quarter_durations())
+            self._positions_version = self._version
+        return self._positions
+
     # //public properties
     @property
     def chords(self):
@@ -134,18 +160,17 @@ class SimpleFormat(object):
         # generate chords if needed
         self.chords
         self._chords.append(chord)
+        self._chords_changed()
         return chord
 
     # get
 
     def get_chord_at_position(self, position):
-        chord_index = None
-        for index, (qp, qd) in enumerate(zip(self.get_quarter_positions(), self.get_quarter_durations())):
-            if qp <= position < qd + qp:
-                chord_index = index
-        if chord_index is None:
+        positions = self._get_positions()
+        index = bisect_right(positions, position, 0, len(positions) - 1) - 1
+        if index < 0 or not position < positions[index + 1]:
             return None
-        return self.chords[chord_index]
+        return self.chords[index]
 
     def get_midis(self):
         return [chord.midis for chord in self.chords]
@@ -154,7 +179,15 @@ class SimpleFormat(object):
         return [chord.quarter_duration for chord in self.chords]
 
     def get_quarter_positions(self):
-        return dToX(self.get_quarter_durations())
+        return list(self._get_positions())
+
+    def reset_quarter_positions(self):
+        """
+        Quarter positions of chords are cached and updated by all methods of SimpleFormat which change chords. If chords
+        or their quarter durations are changed directly (e.g. ``sf.chords[0].quarter_duration = 2``) this method must be
+        called before :obj:`get_chord_at_position()`, :obj:`get_quarter_positions()` or :obj:`sum()` are used.
+        """
+        self._chords_changed()
 
     # //other
 
@@ -164,6 +197,7 @@ class SimpleFormat(object):
         """
         for chord in self.chords:
             function(chord)
+        self._chords_changed()
 
     def extend(self, simple_format):
         """
@@ -176,6 +210,8 @@ class SimpleFormat(object):
         """
         Chords will be changed to get a mirrored version of the original. Pivot is a midi value that will be used as mirror axis. If not set the first midi will be the axis.
         """
+        if not self.chords:
+            return
         if pivot is None:
             pivot = self.chords[0].midis[0]
         elif not isinstance(pivot, Midi):
@@ -190,6 +226,7 @@ class SimpleFormat(object):
     def multiply_quarter_durations(self, factor):
         for chord in self.chords:
             chord.quarter_duration *= factor
+        self._chords_changed()
 
     @staticmethod
     def sum(*simple_formats, no_duplicates=False):
@@ -202,54 +239,56 @@ class SimpleFormat(object):
                     'SimpleFormat.sum() cannot be used on simple_formats containing tied notes.')
 
         def extract_chord_midis(i):
-            def remove_duplicates(new_midis):
-                def check(m):
-                    for nm in newer_midis:
-                        if m.value == nm.value and m.accidental.mode == nm.accidental.mode:
-                            return False
-                    return True
-
-                newer_midis = []
-                for m in new_midis:
-                    if check(m):
-                        newer_midis.append(m)
-
-                return newer_midis
-
+            # Duplicates are dropped before copying so that only the midis that are kept are deep-copied.
             chords = ordered_chords[i]
             output = []
+            seen = set()
             for chord in chords:
-                new_ms = [m.__deepcopy__() for m in chord.midis if m.value != 0]
-                try:
-                    if chord in ordered_chords[i + 1]:
-                        for m in new_ms:
-                            m.add_tie('start')
-                except IndexError:
-                    pass
-                try:
-                    if chord in ordered_chords[i - 1]:
-                        for m in new_ms:
-                            m.add_tie('stop')
-                except IndexError:
-                    pass
+                midis = [m for m in chord.midis if m.value != 0]
+                if no_duplicates:
+                    unique_midis = []
+                    for m in midis:
+                        key = (m.value, m.accidental.mode)
+                        if key not in seen:
+                            seen.add(key)
+                            unique_midis.append(m)
+                    midis = unique_midis
+                if not midis:
+                    continue
+                new_ms = [m.__deepcopy__() for m in midis]
+                if i + 1 < len(ordered_chords) and chord in ordered_chords[i + 1]:
+                    for m in new_ms:
+                        m.add_tie('start')
+                if chord in ordered_chords[i - 1]:
+                    for m in new_ms:
+                        m.add_tie('stop')
                 output.extend(new_ms)
-            if no_duplicates:
-                output = remove_duplicates(output)
             return output
 
         sf = SimpleFormat()
-        combined_positions_and_chords = {}
-        for simple_format in simple_formats:
-            for qp in simple_format.get_quarter_positions():
-                combined_positions_and_chords[qp] = []
-        for key in combined_positions_and_chords.keys():
-            for simple_format in simple_formats:
-                chord = simple_format.get_chord_at_position(key)
-                if chord is not None:
-                    combined_positions_and_chords[key] += [chord]
-        sum_positions = sorted(combined_positions_and_chords.keys())
+        # k-way merge of sorted positions. At each position every simple_format's pointer is moved forward to the
+        # last chord starting at or before it, which is then taken if it still sounds there.
+        all_positions = [simple_format._get_positions() for simple_format in simple_formats]
+        all_chords = [simple_format.chords for simple_format in simple_formats]
+        pointers = [0] * len(simple_formats)
+        sum_positions = []
+        ordered_chords = []
+        for position in heapq.merge(*all_positions):
+            if sum_positions and position == sum_positions[-1]:
+                continue
+            sum_positions.append(position)
+            chords = []
+            for sf_index, positions in enumerate(all_positions):
+                last_index = len(positions) - 2
+                pointer = pointers[sf_index]
+                while pointer < last_index and positions[pointer + 1] <= position:
+                    pointer += 1
+                pointers[sf_index] = pointer
+                if last_index >= 0 and positions[pointer] <= position < positions[pointer + 1]:
+                    chords.append(all_chords[sf_index][pointer])
+            ordered_chords.append(chords)
+        ordered_chords = ordered_chords[:-1]
         sum_quarter_durations = xToD(sum_positions)
-        ordered_chords = [combined_positions_and_chords[position] for position in sum_positions[:-1]]
         for index, qd in enumerate(sum_quarter_durations):
             midis = extract_chord_midis(index)
             sf.add_chord(Chord(midis, qd))
@@ -257,11 +296,245 @@ class SimpleFormat(object):
 
     def retrograde(self):
         self._chords = list(reversed(self.chords))
+        self._chords_changed()
 
     def transpose(self, interval_midi):
+        if not self.chords:
+            return
         if isinstance(interval_midi, Midi):
             interval = interval_midi.value - self.chords[0].midis[0].value
         else:
             interval = interval_midi
         for ch in self.chords:
             ch.transpose(interval)
+
+
+_TIE_FLAGS = {'start': 1, 'stop': 2}
+
+
+def _get_midi_value(midi):
+    if isinstance(midi, Midi):
+        return midi.value
+    value = float(midi)
+    if value != 0 and (value < 12 or value > 127):
+        raise ValueError(f'Midi.value {midi} can be zero for a rest or must be in a range between 12 and 127 inclusively')
+    return value
+
+
+def _get_number(value):
+    return int(value) if value.is_integer() else value
+
+
+class ColumnarSimpleFormat(object):
+    """
+    A variant of :obj:`SimpleFormat` for very long sequences. Quarter durations (as exact fractions), midi values and tie
+    flags are stored in arrays and all transformations are applied directly to these arrays. :obj:`~musicscore.chord.Chord`
+    objects are only created while iterating, e.g. if ColumnarSimpleFormat is passed to
+    :obj:`~musicscore.part.Part.add_chords()`.
+
+    Midis are stored as values (0 for a rest). Accidental modes and other midi or chord attributes are not kept.
+    """
+
+    def __init__(self, quarter_durations=None, midis=None, default_midi=71):
+        self._numerators = array.array('q')
+        self._denominators = array.array('q')
+        self._midi_values = array.array('d')
+        self._midi_offsets = array.array('q', [0])
+        self._tie_flags = array.array('B')
+        self._default_midi = None
+        self.default_midi = default_midi
+
+        quarter_durations = self._get_list(quarter_durations)
+        midis = self._get_list(midis)
+        midis.extend([self.default_midi] * (len(quarter_durations) - len(midis)))
+        quarter_durations.extend([1] * (len(midis) - len(quarter_durations)))
+        for quarter_duration, midi in zip(quarter_durations, midis):
+            self.append(quarter_duration, midi)
+
+    # //private methods
+    @staticmethod
+    def _get_list(values):
+        if values is None:
+            return []
+        try:
+            return list(values)
+        except TypeError:
+            return [values]
+
+    def _get_fractions(self):
+        return map(Fraction, self._numerators, self._denominators)
+
+    def _get_chord_midi_values(self, index):
+        return [_get_number(value) for value in
+                self._midi_values[self._midi_offsets[index]:self._midi_offsets[index + 1]]]
+
+    # //public properties
+    @property
+    def default_midi(self):
+        """
+        If only quarter_durations are provided the midi value of chords will be set to default_midi. Default value is 71.
+        """
+        return self._default_midi
+
+    @default_midi.setter
+    def default_midi(self, val):
+        self._default_midi = _get_midi_value(val)
+
+    @property
+    def quarter_duration(self):
+        return QuarterDuration(sum(self._get_fractions()))
+
+    # //public methods
+
+    # add
+    def append(self, quarter_duration, midis=None):
+        """
+        Adds a chord with quarter_duration and midis (a value, a Midi or a list of them) at the end. If midis is None
+        default_midi is used.
+        """
+        if isinstance(quarter_duration, QuarterDuration):
+            fraction = quarter_duration.value
+        else:
+            fraction = _get_fraction(quarter_duration)
+        if fraction < 0:
+            raise ValueError('ColumnarSimpleFormat(): wrong duration {}'.format(quarter_duration))
+        if midis is None:
+            midis = [self.default_midi]
+        elif not isinstance(midis, (list, tuple)):
+            midis = [midis]
+        if not midis:
+            raise ValueError('ColumnarSimpleFormat(): midis cannot be empty.')
+        values = [_get_midi_value(midi) for midi in midis]
+        if len(values) > 1 and 0 in values:
+            raise ValueError('ColumnarSimpleFormat(): midis cannot be a mixed list of rests and pitches or a list of '
+                             'more than one rests.')
+        self._midi_values.extend(values)
+        self._midi_offsets.append(len(self._midi_values))
+        self._numerators.append(fraction.numerator)
+        self._denominators.append(fraction.denominator)
+        self._tie_flags.append(0)
+
+    def add_tie(self, index, type):
+        """
+        Adds a tie of type ``start`` or ``stop`` to all midis of chord at index.
+        """
+        try:
+            flag = _TIE_FLAGS[type]
+        except KeyError:
+            raise ValueError(f'ColumnarSimpleFormat.add_tie(): wrong type {type}')
+        self._tie_flags[index] |= flag
+
+    # get
+    def get_midis(self):
+        """
+        :return: list of midi value tuples
+        """
+        return [tuple(self._get_chord_midi_values(index)) for index in range(len(self))]
+
+    def get_quarter_durations(self):
+        return [QuarterDuration(fraction) for fraction in self._get_fractions()]
+
+    def get_quarter_positions(self):
+        return dToX(self.get_quarter_durations())
+
+    def iter_chords(self):
+        """
+        :return: generator of new :obj:`~musicscore.chord.Chord` objects created one by one.
+        """
+        for index, fraction in enumerate(self._get_fractions()):
+            chord = Chord(self._get_chord_midi_values(index), QuarterDuration(fraction))
+            flags = self._tie_flags[index]
+            if flags & _TIE_FLAGS['stop']:
+                chord.add_tie('stop')
+            if flags & _TIE_FLAGS['start']:
+                chord.add_tie('start')
+            yield chord
+
+    # //other
+    def extend(self, simple_format):
+        """
+        Chords of another ColumnarSimpleFormat will be added at the end.
+        """
+        if not isinstance(simple_format, ColumnarSimpleFormat):
+            raise TypeError(f'{simple_format} must be of type ColumnarSimpleFormat.')
+        offset = len(self._midi_values)
+        self._midi_offsets.extend([offset + o for o in simple_format._midi_offsets[1:]])
+        self._midi_values.extend(simple_format._midi_values)
+        self._numerators.extend(simple_format._numerators)
+        self._denominators.extend(simple_format._denominators)
+        self._tie_flags.extend(simple_format._tie_flags)
+
+    def mirror(self, pivot=None):
+        """
+        Midi values will be mirrored around pivot (a midi value). If not set the first midi will be the axis. Rests stay
+        rests.
+        """
+        if not self._midi_values:
+            return
+        if pivot is None:
+            pivot = self._midi_values[0]
+        else:
+            pivot = _get_midi_value(pivot)
+        # (2 * pivot - value) * bool(value) keeps rests (0.0) as they are.
+        values = self._midi_values
+        self._midi_values = array.array('d', map(operator.mul, map(operator.sub, itertools.repeat(2 * pivot), values),
+                                                 map(bool, values)))
+
+    def multiply_quarter_durations(self, factor):
+        factor = _get_fraction(factor)
+        numerators = list(map(operator.mul, self._numerators, itertools.repeat(factor.numerator)))
+        denominators = list(map(operator.mul, self._denominators, itertools.repeat(factor.denominator)))
+        divisors = list(map(math.gcd, numerators, denominators))
+        numerators = array.array('q', map(operator.floordiv, numerators, divisors))
+        denominators = array.array('q', map(operator.floordiv, denominators, divisors))
+        if denominators and max(denominators) > 1000:
+            # Products are limited like the values of QuarterDurations.
+            for index, denominator in enumerate(denominators):
+                if denominator > 1000:
+                    product = _get_fraction(Fraction(numerators[index], denominator))
+                    numerators[index] = product.numerator
+                    denominators[index] = product.denominator
+        self._numerators = numerators
+        self._denominators = denominators
+
+    def retrograde(self):
+        self._numerators.reverse()
+        self._denominators.reverse()
+        self._tie_flags.reverse()
+        if len(self._midi_values) == len(self):
+            self._midi_values.reverse()
+        else:
+            values = array.array('d')
+            offsets = array.array('q', [0])
+            for index in reversed(range(len(self))):
+                values.extend(self._midi_values[self._midi_offsets[index]:self._midi_offsets[index + 1]])
+                offsets.append(len(values))
+            self._midi_values = values
+            self._midi_offsets = offsets
+
+    def to_simple_format(self):
+        """
+        :return: :obj:`SimpleFormat` with chords created by :obj:`iter_chords()`
+        """
+        sf = SimpleFormat()
+        for chord in self.iter_chords():
+            sf.add_chord(chord)
+        return sf
+
+    def transpose(self, interval_midi):
+        if not self._midi_values:
+            return
+        if isinstance(interval_midi, Midi):
+            interval = interval_midi.value - self._midi_values[0]
+        else:
+            interval = interval_midi
+        # value + interval * bool(value) keeps rests (0.0) as they are.
+        values = self._midi_values
+        self._midi_values = array.array('d', map(operator.add, values, map(operator.mul, itertools.repeat(interval),
+                                                                            map(bool, values))))
+
+    def __iter__(self):
+        return self.iter_chords()
+
+    def __len__(self):
+        return len(self._numerators)
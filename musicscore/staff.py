@@ -1,23 +1,32 @@
 from typing import Optional, Set
 
+from musicscore.accidental import SIGNS
 from musicscore.clef import Clef
 from musicscore.exceptions import StaffHasNoParentError, AlreadyFinalizedError, AddChordError
 from musicscore.finalize import FinalizeMixin
-from musicscore.musictree import MusicTree
+from musicscore.musictree import MusicTree, _NodeKind
 from musicscore.quantize import QuantizeMixin
 from musicscore.voice import Voice
-from musicscore.xmlwrapper import XMLWrapper
+from musicscore.xmlwrapper import XMLWrapper, _create_xml_element
 from musicxml.xmlelement.xmlelement import XMLStaff
 
 __all__ = ['Staff']
 
 
+def _chord_repeats_previous_chord(chord, previous_chord, all_previous_chords_are_tied):
+    # Same as util._chord_is_in_a_repetition with the previous chord and tie state of the voice passed in.
+    if previous_chord is None or chord.is_tied_to_previous or all_previous_chords_are_tied or previous_chord.is_rest:
+        return False
+    return chord.has_same_pitches(previous_chord)
+
+
 class Staff(MusicTree, QuantizeMixin, FinalizeMixin, XMLWrapper):
     """
     Parent type: :obj:`~musicscore.measure.Measure`
 
     Child type: :obj:`~musicscore.voice.Voice`
     """
+    _node_kind = _NodeKind.STAFF
     _ATTRIBUTES = {'clef', 'default_clef', 'number'}
     _ATTRIBUTES = _ATTRIBUTES.union(MusicTree._ATTRIBUTES)
     _ATTRIBUTES = _ATTRIBUTES.union(QuantizeMixin._ATTRIBUTES)
@@ -25,11 +34,13 @@ class Staff(MusicTree, QuantizeMixin, FinalizeMixin, XMLWrapper):
 
     def __init__(self, number=None, clef=None, **kwargs):
         super().__init__()
-        self._xml_object = self.XMLClass(value_=1, **kwargs)
+        self._xml_object = _create_xml_element(self.XMLClass, value_=1, **kwargs)
         self._number = None
         self._clef = None
         self.clef = clef
         self.number = number
+        # Set by _update_accidentals() to be read by the staff with the same number in the next measure.
+        self._last_pitch_steps_with_accidentals = None
 
     @property
     def clef(self) -> Clef:
@@ -98,9 +109,67 @@ class Staff(MusicTree, QuantizeMixin, FinalizeMixin, XMLWrapper):
 
         child._parent = self
         self._children.append(child)
+        self._reset_iterators()
 
         return child
 
+    def _get_previous_pitch_steps_with_accidentals(self):
+        previous_staff = self.get_previous_staff()
+        if previous_staff:
+            return previous_staff.get_last_pitch_steps_with_accidentals()
+        return set()
+
+    def _update_accidentals(self):
+        # Decides accidental.show of all midis in one pass over the voices. The previous staff is asked only once.
+        # Its steps with accidentals are cached in _last_pitch_steps_with_accidentals.
+        steps_with_accidentals = set()
+        previous_steps_with_accidentals = None
+        first_not_tied_chord_is_passed = False
+        last_pitch_steps_with_accidentals = set()
+        for voice in self.get_children():
+            previous_chord = None
+            all_previous_chords_are_tied = True
+            for chord in voice.iter_chords():
+                if not chord.is_rest:
+                    is_first_not_tied_chord = False
+                    if not first_not_tied_chord_is_passed and True not in {m.is_tied_to_previous for m in chord.midis}:
+                        is_first_not_tied_chord = first_not_tied_chord_is_passed = True
+                    is_in_a_repetition = None
+                    for midi in chord.midis:
+                        accidental = midi.accidental
+                        step, alter, _ = accidental.get_pitch_parameters()
+                        is_natural = SIGNS[alter] == 'natural'
+                        if accidental.show is None:
+                            if is_natural:
+                                if step in steps_with_accidentals:
+                                    accidental.show = True
+                                    steps_with_accidentals.remove(step)
+                                elif is_first_not_tied_chord:
+                                    if previous_steps_with_accidentals is None:
+                                        previous_steps_with_accidentals = self._get_previous_pitch_steps_with_accidentals()
+                                    accidental.show = step in previous_steps_with_accidentals
+                                else:
+                                    accidental.show = False
+                            else:
+                                if is_in_a_repetition is None:
+                                    is_in_a_repetition = _chord_repeats_previous_chord(chord, previous_chord,
+                                                                                      all_previous_chords_are_tied)
+                                if is_in_a_repetition:
+                                    accidental.show = False
+                                else:
+                                    accidental.show = True
+                                    steps_with_accidentals.add(step)
+                        elif not is_natural:
+                            steps_with_accidentals.add(step)
+                all_previous_chords_are_tied = all_previous_chords_are_tied and chord.is_tied_to_previous
+                previous_chord = chord
+            if previous_chord is not None and not previous_chord.is_rest:
+                for midi in previous_chord.midis:
+                    step, alter, _ = midi.accidental.get_pitch_parameters()
+                    if SIGNS[alter] != 'natural':
+                        last_pitch_steps_with_accidentals.add(step)
+        self._last_pitch_steps_with_accidentals = last_pitch_steps_with_accidentals
+
     def add_chord(self, *args, **kwargs):
         raise AddChordError()
 
@@ -150,10 +219,13 @@ class Staff(MusicTree, QuantizeMixin, FinalizeMixin, XMLWrapper):
                  be shown hidden.
         :rtype:  Set[str]
         """
+        if self._last_pitch_steps_with_accidentals is not None:
+            return set(self._last_pitch_steps_with_accidentals)
         output = set()
         for v in self.get_children():
-            if v.get_chords():
-                last_chord = v.get_chords()[-1]
+            voice_chords = v.get_chords()
+            if voice_chords:
+                last_chord = voice_chords[-1]
                 if not last_chord.is_rest:
                     for m in last_chord.midis:
                         if m.accidental.sign != 'natural':
@@ -26,6 +26,28 @@ class TestAccidental(TestCase):
         assert a.get_pitch_parameters() == ('B', 2, 3)
         assert midi.accidental.get_pitch_parameters() == ('B', 2, 3)
 
+    def test_get_pitch_parameters_quarter_tones(self):
+        a = Accidental()
+        assert a.get_pitch_parameters(midi_value=61.5) == ('C', 1.5, 4)
+        assert a.get_pitch_parameters(midi_value=71.5) == ('C', -0.5, 5)
+        assert a.get_pitch_parameters(midi_value=127.5) == ('A', -1.5, 9)
+        assert a.get_pitch_parameters(midi_value=12.5) == ('C', 0.5, 0)
+        a.mode = 'flat'
+        assert a.get_pitch_parameters(midi_value=61.5) == ('D', -0.5, 4)
+
+    def test_pitch_parameters_are_updated(self):
+        midi = Midi(61.5)
+        assert midi.accidental.get_pitch_parameters() == ('C', 1.5, 4)
+        midi.value = 63
+        assert midi.accidental.get_pitch_parameters() == ('E', -1, 4)
+        assert midi.get_pitch_or_rest().xml_step.value_ == 'E'
+        midi.accidental.mode = 'sharp'
+        assert midi.accidental.get_pitch_parameters() == ('D', 1, 4)
+        assert midi.get_pitch_or_rest().xml_step.value_ == 'D'
+        other_midi = Midi(72)
+        other_midi.accidental = midi.accidental
+        assert other_midi.accidental.get_pitch_parameters() == ('C', 0, 5)
+
     def test_accidental_sign(self):
         a = Accidental()
         assert a.sign is None
@@ -139,3 +161,27 @@ class TestAccidental(TestCase):
             a.get_beats()
         with self.assertRaises(MusicTreeTypeError):
             a.get_chords()
+
+    def test_attribute_routing(self):
+        a = Accidental()
+        a.mode = 'flat'
+        a.parentheses = 'yes'
+        assert a.mode == 'flat'
+        assert a.__dict__['_mode'] == 'flat'
+        assert a.parentheses == a.xml_object.parentheses == 'yes'
+        assert a.editorial is None
+        assert a.xml_object.to_string() == '<accidental parentheses="yes">natural</accidental>\n'
+        with self.assertRaises(AttributeError):
+            a.wrong_attribute = 1
+        with self.assertRaises(AttributeError):
+            a.wrong_attribute
+
+    def test_xml_object_is_created_on_first_use(self):
+        m = Midi(63)
+        a = m.accidental
+        a.show = True
+        assert a.__dict__.get('_xml_object') is None
+        assert a.xml_object.value_ == 'flat'
+        m.value = 61
+        assert a.xml_object.value_ == 'sharp'
+        assert Accidental(parentheses='yes').show is True
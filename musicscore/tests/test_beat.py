@@ -2,7 +2,8 @@ import uuid
 from unittest import TestCase
 
 from musicscore import Part
-from musicscore.beat import Beat, _convert_to_quarter_duration_splittables_dictionary, get_chord_group_subdivision
+from musicscore.beat import Beat, _convert_to_quarter_duration_splittables_dictionary, get_chord_group_subdivision, \
+    get_quantization_cache_info, clear_quantization_caches
 from musicscore.chord import Chord
 from musicscore.config import SPLITTABLES
 from musicscore.exceptions import AddChordError, VoiceIsFullError, BeatNotFullError, QuarterDurationIsNotWritable
@@ -62,6 +63,45 @@ class TestBeat(TestCase):
         assert v.get_children()[2].offset == 1 / 4 + 1 / 8
         assert v.get_children()[3].offset == 1 / 4 + 1 / 8 + 1 / 2
 
+    def test_beat_offset_after_changes(self):
+        v = create_voice()
+        v.update_beats(1, 1, 1)
+        assert [b.offset for b in v.get_children()] == [0, 1, 2]
+        assert [b.number for b in v.get_children()] == [1, 2, 3]
+        v.get_children()[0].quarter_duration = 1 / 2
+        assert [b.offset for b in v.get_children()] == [0, 1 / 2, 3 / 2]
+        v.remove(v.get_children()[1])
+        assert [b.offset for b in v.get_children()] == [0, 1 / 2]
+        assert [b.number for b in v.get_children()] == [1, 2]
+        v.add_child(Beat(1 / 4))
+        assert [b.offset for b in v.get_children()] == [0, 1 / 2, 3 / 2]
+        v.update_beats(1 / 3, 1 / 3, 1 / 3)
+        assert [b.offset for b in v.get_children()] == [0, 1 / 3, 2 / 3]
+
+    def test_beat_offset_after_replace_child(self):
+        v = create_voice()
+        v.update_beats(1, 1, 1)
+        assert [b.offset for b in v.get_children()] == [0, 1, 2]
+        new_beat = Beat(1 / 2)
+        v.replace_child(v.get_children()[1], new_beat)
+        assert new_beat.offset == 1
+        assert new_beat.number == 2
+        assert [b.offset for b in v.get_children()] == [0, 1, 3 / 2]
+
+    def test_chord_offset_after_changes(self):
+        v = create_voice()
+        v.update_beats(1)
+        beat = v.get_beat(1)
+        chords = [Chord(60, qd) for qd in [1 / 4, 1 / 4, 1 / 2]]
+        for chord in chords:
+            beat.add_child(chord)
+        assert [ch.offset for ch in chords] == [0, 1 / 4, 1 / 2]
+        beat._change_children_quarter_durations([QuarterDuration(1, 2), QuarterDuration(1, 4), QuarterDuration(1, 4)])
+        assert [ch.offset for ch in chords] == [0, 1 / 2, 3 / 4]
+        beat.remove(chords[0])
+        assert chords[0].offset is None
+        assert [ch.offset for ch in chords[1:]] == [0, 1 / 4]
+
     def test_beat_fill_with_rest(self):
         b = Beat()
         b._parent = Voice()
@@ -77,6 +117,39 @@ class TestBeat(TestCase):
             [Chord(60, qd) for qd in [1 / 6, 1 / 6, 1 / 6, 1 / 10, 3 / 10, 1 / 10]]) is None
 
 
+class TestQuantizationCaches(TestCase):
+    def setUp(self):
+        clear_quantization_caches()
+
+    def tearDown(self):
+        clear_quantization_caches()
+
+    def test_quantization_cache_info(self):
+        assert get_quantization_cache_info()['subdivisions'].misses == 0
+        for _ in range(3):
+            assert get_chord_group_subdivision([Chord(60, qd) for qd in [1 / 3, 2 / 3]]) == 3
+        info = get_quantization_cache_info()['subdivisions']
+        assert (info.hits, info.misses) == (2, 1)
+        b = Beat()
+        b._get_quantized_locations(4)
+        b._get_quantized_locations(4)
+        info = get_quantization_cache_info()['quantized_locations']
+        assert (info.hits, info.misses) == (1, 1)
+        clear_quantization_caches()
+        assert get_quantization_cache_info()['quantized_locations'].currsize == 0
+
+    def test_quarter_durations_changed_in_place(self):
+        chords = [Chord(60, qd) for qd in [1 / 3, 2 / 3]]
+        assert get_chord_group_subdivision(chords) == 3
+        chords[0].quarter_duration.value = QuarterDuration(1, 4).value
+        chords[1].quarter_duration.value = QuarterDuration(3, 4).value
+        assert get_chord_group_subdivision(chords) == 4
+        b = Beat()
+        assert b._get_quantized_locations(4) == (0, 0.25, 0.5, 0.75, 1)
+        b.quarter_duration.value = QuarterDuration(2).value
+        assert b._get_quantized_locations(4) == (0, 0.5, 1, 1.5, 2)
+
+
 class TestBeatUpdateChords(IdTestCase):
     def test_beat_update_chord_types(self):
         p = Part('p1')
@@ -237,6 +310,39 @@ class TestBeatSplitChord(TestCase):
         v.get_beat(1)._split_not_writable_chords()
         assert [ch.quarter_duration for ch in v.get_chords()] == [1 / 2, 1 / 3, 1 / 6]
 
+    def test_split_not_writable_chords_several(self):
+        v = create_voice()
+        v.update_beats(1)
+        for qd in [1 / 8, 5 / 8, 1 / 8, 1 / 8]:
+            v._add_chord(Chord(60, qd))
+        beat = v.get_beat(1)
+        beat._split_not_writable_chords()
+        assert [ch.quarter_duration for ch in beat.get_children()] == [1 / 8, 3 / 8, 1 / 4, 1 / 8, 1 / 8]
+        assert [ch.up for ch in beat.get_children()] == [beat] * 5
+        assert [ch.offset for ch in beat.get_children()] == [0, 1 / 8, 1 / 2, 3 / 4, 7 / 8]
+        assert beat.get_chords() == beat.get_children()
+
+    def test_split_not_writable_chords_changed_splittables(self):
+        def split(qds):
+            v = create_voice()
+            v.update_beats(1)
+            for qd in qds:
+                v._add_chord(Chord(60, qd))
+            v.get_beat(1)._split_not_writable_chords()
+            return [ch.quarter_duration for ch in v.get_chords()]
+
+        assert split([5 / 6, 1 / 6]) == [1 / 2, 1 / 3, 1 / 6]
+        SPLITTABLES[(0, 1)][(5, 6)] = [(4, 6), (1, 6)]
+        try:
+            assert split([5 / 6, 1 / 6]) == [2 / 3, 1 / 6, 1 / 6]
+        finally:
+            SPLITTABLES[(0, 1)][(5, 6)] = [(3, 6), (2, 6)]
+        assert split([5 / 6, 1 / 6]) == [1 / 2, 1 / 3, 1 / 6]
+        # split durations are stored as tuples and cannot be changed in place without being tracked
+        assert SPLITTABLES[(0, 1)][(5, 6)] == ((3, 6), (2, 6))
+        with self.assertRaises(AttributeError):
+            SPLITTABLES[(0, 1)][(5, 6)].append((1, 6))
+
     def test_add_child_5_leftover(self):
         v = create_voice()
         beats = v.update_beats(1, 1, 1, 1)
@@ -0,0 +1,104 @@
+import json
+import tempfile
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+from unittest import TestCase
+
+from musicscore.benchmark import SCENARIOS, run_scenario, run_benchmarks, compare_with_baseline, load_results, \
+    save_results, BASELINE_PATH, measure_import_time, check_import_time_budgets, IMPORT_MODULES, IMPORT_TIME_BUDGETS
+from musicscore.benchmark.runner import _parse_import_time
+from musicscore.benchmark.__main__ import main
+from musicscore.part import Id
+
+
+class TestBenchmark(TestCase):
+    def tearDown(self):
+        Id.__refs__.clear()
+
+    def test_scenarios(self):
+        for name in SCENARIOS:
+            values = run_scenario(name, size=1, repeat=1, trace_memory=False)
+            assert set(values) == {'build', 'finalize', 'to_string', 'total', 'peak_memory'}
+            assert values['total'] >= values['build'] + values['finalize']
+            assert values['peak_memory'] is None
+
+    def test_peak_memory(self):
+        assert run_scenario('dense_sixteenths', size=1, repeat=1)['peak_memory'] > 0
+
+    def test_compare_with_baseline(self):
+        baseline = {'size': 1, 'scenarios': {'a': {'build': 1, 'finalize': 2, 'to_string': 1, 'total': 4,
+                                                   'peak_memory': 100}}}
+        results = {'size': 1, 'scenarios': {'a': {'build': 1.2, 'finalize': 3, 'to_string': 1, 'total': 5.2,
+                                                  'peak_memory': None},
+                                            'b': {'build': 10, 'finalize': 10, 'to_string': 10, 'total': 30,
+                                                  'peak_memory': 100}}}
+        regressions = compare_with_baseline(results, baseline, threshold=0.25)
+        assert [regression.split(':')[0] for regression in regressions] == ['a finalize', 'a total']
+        assert compare_with_baseline(results, baseline, threshold=0.5) == []
+        with self.assertRaises(ValueError):
+            compare_with_baseline(dict(results, size=2), baseline)
+
+    def test_compare_with_baseline_min_delta(self):
+        # Small times are noisy: increases of a few milliseconds are not reported however large they are relatively.
+        baseline = {'size': 1, 'scenarios': {'a': {'build': 0.01, 'finalize': 0.02, 'to_string': 1, 'total': 1.03,
+                                                   'peak_memory': 100}},
+                    'import_time': {'musicscore.score': 0.01}}
+        results = {'size': 1, 'scenarios': {'a': {'build': 0.05, 'finalize': 0.2, 'to_string': 1, 'total': 1.25,
+                                                  'peak_memory': 200}},
+                   'import_time': {'musicscore.score': 0.03}}
+        regressions = compare_with_baseline(results, baseline)
+        assert [regression.split(':')[0] for regression in regressions] == ['a finalize', 'a peak_memory']
+        regressions = compare_with_baseline(results, baseline, min_delta=0)
+        assert [regression.split(':')[0] for regression in regressions] == ['a build', 'a finalize', 'a peak_memory',
+                                                                          'import musicscore.score']
+        assert compare_with_baseline(results, baseline, min_delta=0.5) == ['a peak_memory: 200 > 100 (+100%)']
+
+    def test_baseline(self):
+        baseline = load_results(BASELINE_PATH)
+        assert set(baseline['scenarios']) == set(SCENARIOS)
+        assert set(baseline['import_time']) == set(IMPORT_MODULES)
+
+    def test_parse_import_time(self):
+        output = '\n'.join(['import time: self [us] | cumulative | imported package',
+                            'import time:       100 |        150 |   musicscore.config',
+                            'import time:       200 |        350 | musicscore',
+                            'import time:      1000 |       5000 | musicscore.score'])
+        assert _parse_import_time(output, 'musicscore') == 350e-6
+        assert _parse_import_time(output, 'musicscore.score') == 5350e-6
+        with self.assertRaises(ValueError):
+            _parse_import_time(output, 'musicxml')
+
+    def test_import_time(self):
+        # Wall-clock budgets are checked by python -m musicscore.benchmark. That import musicscore does not import
+        # musicxml is tested in test_init.
+        assert 0 < measure_import_time('musicscore', repeat=1)
+        assert check_import_time_budgets({'import_time': {'musicscore': IMPORT_TIME_BUDGETS['musicscore'] / 2}}) == []
+        assert check_import_time_budgets({'import_time': {'musicscore': 1}}) == [
+            f"import musicscore: 1 > budget {IMPORT_TIME_BUDGETS['musicscore']:.4g}"]
+
+    def test_compare_import_time_with_baseline(self):
+        baseline = {'size': 1, 'scenarios': {}, 'import_time': {'musicscore': 0.001, 'musicscore.score': 0.1}}
+        results = {'size': 1, 'scenarios': {}, 'import_time': {'musicscore': 0.01, 'musicscore.score': 0.3}}
+        regressions = compare_with_baseline(results, baseline)
+        assert [regression.split(':')[0] for regression in regressions] == ['import musicscore.score']
+
+    def test_main(self):
+        def get_baseline(value):
+            return {'size': 1, 'scenarios': {'dense_sixteenths': {key: value for key in
+                                                                  ['build', 'finalize', 'to_string', 'total']}}}
+
+        args = ['dense_sixteenths', '--size', '1', '--repeat', '1', '--no-memory']
+        with tempfile.TemporaryDirectory() as directory:
+            output = Path(directory) / 'results.json'
+            baseline = Path(directory) / 'baseline.json'
+            with redirect_stdout(StringIO()):
+                assert main(args + ['--baseline', str(baseline), '--update-baseline']) == 0
+                assert list(load_results(baseline)['scenarios']) == ['dense_sixteenths']
+                save_results(get_baseline(1000), baseline)
+                assert main(args + ['--baseline', str(baseline), '--output', str(output)]) == 0
+                save_results(get_baseline(1e-9), baseline)
+                assert main(args + ['--baseline', str(baseline), '--min-delta', '0']) == 1
+            with open(output) as f:
+                assert list(json.load(f)['scenarios']) == ['dense_sixteenths']
+            assert run_benchmarks(['tuplets'], size=1, repeat=1, trace_memory=False)['size'] == 1
@@ -64,3 +64,20 @@ class TestClef(IdTestCase):
             if c:
                 assert m.clefs == [c]
         part.finalize()
+
+    def test_xml_object_is_created_on_first_use(self):
+        c = BassClef(show=False, octave_change=-1)
+        c.number = 2
+        assert c.__dict__.get('_xml_object') is None
+        assert (c.sign, c.line, c.octave_change, c.number) == ('F', 4, -1, 2)
+        expected = """<clef number="2">
+  <sign>F</sign>
+  <line>4</line>
+  <clef-octave-change>-1</clef-octave-change>
+</clef>
+"""
+        assert c.to_string() == expected
+        c.line = 3
+        c.number = None
+        assert c.xml_object.xml_line.value_ == 3
+        assert c.number is None
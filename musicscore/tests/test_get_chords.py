@@ -115,3 +115,23 @@ class TestGetChords(IdTestCase):
     def test_score_get_chords(self):
         assert [ch.midis[0].value for ch in self.score.get_chords()] == [60, 61, 63, 63, 64, 64, 62, 48, 48]
         assert [ch.quarter_duration for ch in self.score.get_chords()] == [1, 3, 2, 0.5, 0.5, 1, 4, 4, 4]
+
+    def test_iter_chords(self):
+        for node in [self.score, self.score.get_part(1), self.score.get_part(1).get_measure(1),
+                     self.score.get_part(2).get_measure(1).get_staff(2)]:
+            assert list(node.iter_chords()) == node.get_chords()
+            assert list(node.iter_beats()) == node.get_beats()
+
+    def test_get_chords_cache_is_reset(self):
+        p1 = self.score.get_part(1)
+        chords = p1.get_chords()
+        chords.pop()
+        assert len(p1.get_chords()) == 7
+        p1.add_chord(Chord(65, 4))
+        assert [ch.midis[0].value for ch in p1.get_chords()][-1] == 65
+        assert [ch.midis[0].value for ch in self.score.get_chords()][-3:] == [65, 48, 48]
+        number_of_beats = len(self.score.get_beats())
+        p1.get_measure(1).get_staff(1).add_voice()
+        assert len(self.score.get_beats()) == number_of_beats + 4
+        self.score.finalize()
+        assert self.score.get_chords() == list(self.score.iter_chords())
@@ -58,6 +58,8 @@ class TestGetMeasure(IdTestCase):
         assert s.get_measure(1, 1) == m
         assert s.get_measure(1, 2) is None
         assert s.get_measure(2, 2) is None
+        assert s.get_measure(part_number=1, measure_number=1) == m
+        assert s.get_measure(measure_number=1, part_number=1) == m
 
     def test_part_get_measure(self):
         p = Part('p1')
@@ -0,0 +1,48 @@
+import importlib
+import os
+import subprocess
+import sys
+import types
+from unittest import TestCase
+
+import musicscore
+
+
+def _run_in_new_interpreter(code):
+    return subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True,
+                          env=dict(os.environ, PYTHONPATH=os.pathsep.join(path for path in sys.path if path))).stdout.strip()
+
+
+class TestLazyPackage(TestCase):
+    def test_import_does_not_import_modules(self):
+        assert _run_in_new_interpreter(
+            "import sys; import musicscore; print('musicxml' in sys.modules, 'musicscore.score' in sys.modules)"
+        ) == 'False False'
+        assert _run_in_new_interpreter(
+            "import sys; from musicscore import Midi; print('musicscore.score' in sys.modules)") == 'False'
+
+    def test_exports(self):
+        for module_name, names in musicscore._EXPORTS.items():
+            module = importlib.import_module(f'musicscore.{module_name}')
+            for name in names:
+                assert getattr(musicscore, name) is getattr(module, name)
+            module_all = getattr(module, '__all__', None)
+            if module_all is None:
+                module_all = [name for name, value in vars(module).items() if
+                              not name.startswith('_') and not isinstance(value, types.ModuleType)]
+            assert set(module_all) <= set(musicscore.__all__)
+
+    def test_star_import(self):
+        namespace = {}
+        exec('from musicscore import *', namespace)
+        assert namespace['Score'] is musicscore.Score
+        assert set(musicscore.__all__) <= set(namespace)
+
+    def test_submodules_and_unknown_names(self):
+        assert musicscore.util.lcm([2, 3]) == 6
+        assert 'Score' in dir(musicscore)
+        with self.assertRaises(AttributeError):
+            musicscore.NotExistingName
+        assert _run_in_new_interpreter(
+            "import sys; import musicscore; print(hasattr(musicscore, 'NotExistingName'), 'musicscore.score' in "
+            "sys.modules, type(musicscore.util).__name__, 'musicxml' in sys.modules)") == 'False False module False'
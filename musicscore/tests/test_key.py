@@ -21,3 +21,12 @@ class TestStaff(TestCase):
         assert copied.xml_object != k.xml_object
         assert copied.fifths == k.fifths
         assert copied.show == k.show
+
+    def test_xml_object_is_created_on_first_use(self):
+        k = Key(fifths=2, show=False)
+        k.fifths = -1
+        assert k.__dict__.get('_xml_object') is None
+        assert k.fifths == -1
+        assert k.xml_object.xml_fifths.value_ == -1
+        k.fifths = 4
+        assert k.xml_object.xml_fifths.value_ == 4
@@ -10,6 +10,7 @@ from musicscore.staff import Staff
 from musicscore.tests.util import IdTestCase
 from musicscore.time import Time
 from musicscore.voice import Voice
+from musicxml.xmlelement.exceptions import XMLChildContainerWrongElementError
 from musicxml.xmlelement.xmlelement import *
 
 
@@ -861,3 +862,35 @@ class TestMeasureBeatGrouping(TestCase):
         measure = part.add_measure()
         st = measure.add_staff()
         assert st == measure.get_children()[-1]
+
+    def test_xml_children_are_added_at_once(self):
+        score = Score()
+        part = score.add_part('p1')
+        for midi in [60, 62, 64, 65]:
+            part.add_chord(Chord(midi, 1))
+        part.add_chord(Chord(48, 4), staff_number=2)
+        backup = part.get_chords()[1].add_xml_element_after_notes(XMLBackup())
+        backup.xml_duration = 1
+        score.finalize()
+        measure = part.get_measure(1)
+        assert not measure.xml_object.xsd_check
+        assert [ch.name for ch in measure.xml_object.get_children()] == ['attributes', 'note', 'note', 'backup', 'note',
+                                                                         'note', 'backup', 'note', 'barline']
+        assert all(ch.xsd_check for ch in measure.xml_object.get_children())
+
+    def test_xml_children_validation(self):
+        def create_score(validate):
+            score = Score(validate=validate)
+            part = score.add_part('p1')
+            part.add_chord(Chord(60, 4))
+            part.get_chords()[0].add_xml_element_after_notes(XMLPitch())
+            return score
+
+        with self.assertRaises(XMLChildContainerWrongElementError):
+            create_score(validate=True).finalize()
+        score = create_score(validate=False)
+        score.finalize()
+        assert [ch.name for ch in score.get_children()[0].get_measure(1).xml_object.get_children()] == [
+            'attributes', 'note', 'pitch', 'barline']
+        with self.assertRaises(TypeError):
+            Score(validate=None)
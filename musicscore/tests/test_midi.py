@@ -190,6 +190,23 @@ class TestMidi(TestCase):
         midi.set_staff_number(2)
         assert midi.get_staff_number() == 2
 
+    def test_pitch_or_rest_is_created_on_first_use(self):
+        midi = Midi(61)
+        midi.transpose(2)
+        midi.accidental.mode = 'flat'
+        assert midi._pitch_or_rest is None
+        assert midi.accidental.__dict__.get('_xml_object') is None
+        pitch = midi.get_pitch_or_rest()
+        assert (pitch.xml_step.value_, pitch.xml_alter.value_, pitch.xml_octave.value_) == ('E', -1, 4)
+        assert midi.get_pitch_or_rest() is pitch
+        midi.value = 64
+        assert (pitch.xml_step.value_, pitch.xml_alter, pitch.xml_octave.value_) == ('E', None, 4)
+        midi.value = 0
+        assert isinstance(midi.get_pitch_or_rest(), XMLRest)
+        midi.value = 70
+        assert isinstance(midi.get_pitch_or_rest(), XMLPitch)
+        assert midi.get_pitch_or_rest().xml_alter.value_ == -1
+
 class TestMidiNoteHead(IdTestCase):
     def test_notehead_property(self):
         m = Midi(60)
@@ -2,10 +2,10 @@ from unittest.mock import patch, Mock
 
 from musicscore.accidental import Accidental
 from musicscore.beat import Beat
-from musicscore.chord import Chord
+from musicscore.chord import Chord, GraceChord, Rest
 from musicscore.measure import Measure
-from musicscore.midi import Midi
-from musicscore.musictree import MusicTree
+from musicscore.midi import Midi, C, B
+from musicscore.musictree import MusicTree, _NodeKind
 from musicscore.note import Note
 from musicscore.part import Part
 from musicscore.score import Score
@@ -57,6 +57,32 @@ class TestMusicTree(IdTestCase):
             with self.assertRaises(NotImplementedError):
                 acc.add_child(child)
 
+    def test_node_kinds(self):
+        for cls, kind in [(Score, _NodeKind.SCORE), (Part, _NodeKind.PART), (Measure, _NodeKind.MEASURE),
+                          (Staff, _NodeKind.STAFF), (Voice, _NodeKind.VOICE), (Beat, _NodeKind.BEAT),
+                          (Chord, _NodeKind.CHORD), (GraceChord, _NodeKind.CHORD), (Rest, _NodeKind.CHORD),
+                          (Note, _NodeKind.NOTE), (Midi, _NodeKind.MIDI), (C, _NodeKind.MIDI), (B, _NodeKind.MIDI),
+                          (Accidental, _NodeKind.ACCIDENTAL)]:
+            assert cls._node_kind == kind
+        assert MusicTree._node_kind is None
+
+    def test_add_child_to_subclasses(self):
+        midi = C(4)
+        acc = Accidental()
+        assert midi.add_child(acc) == acc
+        with self.assertRaises(TypeError):
+            midi.add_child(Midi(60))
+        b = Beat()
+        b._check_child_to_be_added(GraceChord(61))
+        b._check_child_to_be_added(Rest(1))
+        b._check_child_to_be_added(Mock(spec=Chord))
+        with self.assertRaises(TypeError):
+            Rest(1).add_child(Beat())
+        with self.assertRaises(TypeError):
+            b._check_child_to_be_added(Mock(spec=Note))
+        with self.assertRaises(TypeError):
+            b._check_child_to_be_added(60)
+
     def test_check_args_kwargs(self):
         with self.assertRaises(ValueError):
             MusicTree()._check_args_kwargs(args=[1, 2, 3], kwargs={'part_number': 2}, class_name='Score')
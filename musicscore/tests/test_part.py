@@ -1,3 +1,4 @@
+import gc
 import xml.etree.ElementTree as ET
 from pathlib import Path
 
@@ -5,11 +6,12 @@ import math
 import xmltodict
 
 from musicscore import Time, SimpleFormat, BassClef, TrebleClef
-from musicscore.chord import Chord
-from musicscore.exceptions import IdHasAlreadyParentOfSameTypeError, IdWithSameValueExistsError
+from musicscore.chord import Chord, GraceChord
+from musicscore.exceptions import IdHasAlreadyParentOfSameTypeError, IdWithSameValueExistsError, \
+    ScorePartHasAnotherParentError
 from musicscore.key import Key
 from musicscore.measure import Measure
-from musicscore.part import Part, ScorePart, Id
+from musicscore.part import Part, ScorePart, Id, IdRegistry, get_current_id_registry
 from musicscore.quarterduration import QuarterDuration
 from musicscore.score import Score
 from musicscore.tests.test_metronome import TestCase
@@ -22,15 +24,15 @@ class TestId(TestCase):
     def test_id_refs(self):
         id1 = Id('p1')
         id2 = Id('p2')
-        assert Id.__refs__ == [id1, id2]
+        assert list(Id.__refs__) == [id1, id2]
         id3 = Id('p3')
-        assert Id.__refs__ == [id1, id2, id3]
+        assert list(Id.__refs__) == [id1, id2, id3]
         id3.delete()
-        assert Id.__refs__ == [id1, id2]
+        assert list(Id.__refs__) == [id1, id2]
         Id('p3')
 
     def test_id_unique(self):
-        Id('p1')
+        id1 = Id('p1')
         id2 = Id('p2')
         with self.assertRaises(IdWithSameValueExistsError):
             Id('p1')
@@ -44,6 +46,70 @@ class TestId(TestCase):
         id3.value = 'p2'
         assert id3.value == 'p2'
 
+    def test_id_is_removed_after_garbage_collection(self):
+        id_ = Id('p1')
+        assert id_ in Id.__refs__
+        del id_
+        assert Id.__refs__.get('p1') is None
+        Id('p1')
+        part = Part('p2')
+        del part
+        gc.collect()
+        assert Id.__refs__.get('p2') is None
+        Part('p2')
+
+    def test_id_registry_context(self):
+        id1 = Id('p1')
+        with IdRegistry() as registry:
+            assert get_current_id_registry() is registry
+            id2 = Id('p1')
+            assert list(registry) == [id2]
+            with self.assertRaises(IdWithSameValueExistsError):
+                Id('p1')
+        assert get_current_id_registry() is not registry
+        assert list(Id.__refs__) == [id1]
+
+    def test_score_id_registry(self):
+        scores = [Score(), Score()]
+        parts = [score.add_child(Part('p1')) for score in scores]
+        assert parts[0].id_ in scores[0]._id_registry
+        assert parts[1].id_ in scores[1]._id_registry
+        assert Id.__refs__.get('p1') is None
+        assert [score.add_part('p2').id_.value for score in scores] == ['p2', 'p2']
+        with self.assertRaises(IdWithSameValueExistsError):
+            scores[0].add_part('p1')
+        p3 = Part('p1')
+        with self.assertRaises(IdWithSameValueExistsError):
+            scores[0].add_child(p3)
+        assert p3 not in scores[0].get_children()
+        with self.assertRaises(IdWithSameValueExistsError):
+            parts[0].id_ = 'p2'
+
+    def test_add_part_of_another_score(self):
+        s1 = Score()
+        s2 = Score()
+        p = s1.add_child(Part('p1'))
+        with self.assertRaises(ScorePartHasAnotherParentError):
+            s2.add_child(p)
+        assert p.up is s1
+        assert p.id_ in s1._id_registry
+        assert p.id_ not in s2._id_registry
+        assert s2.get_children() == []
+        s2.add_part('p1')
+
+    def test_set_id_of_part_in_score(self):
+        s = Score()
+        s.add_part('p1')
+        p2 = s.add_part('p2')
+        with self.assertRaises(IdWithSameValueExistsError):
+            p2.id_ = Id('p1')
+        assert [p.id_.value for p in s.get_children()] == ['p1', 'p2']
+        p2.id_ = Id('p3')
+        assert p2.id_ in s._id_registry
+        assert [p.id_.value for p in s.get_children()] == ['p1', 'p3']
+        with self.assertRaises(IdWithSameValueExistsError):
+            s.add_child(Part('p3'))
+
     def test_id_parents(self):
         id_ = Id('p1')
         assert id_.get_parents() == []
@@ -459,6 +525,62 @@ class TestAddChordToPart(TestCase):
         p.add_chord(Chord(60, 5))
         assert p.get_current_measure() == m2
 
+    def test_add_chords(self):
+        def get_chords():
+            chords = []
+            for index, quarter_duration in enumerate([1 / 2, 3, 1 / 2, 1, 5, 3 / 4, 1 / 4, 13, 1, 1 / 2, 3 / 2, 7]):
+                chord = Chord(60 + index, quarter_duration)
+                chords.append(chord)
+                if index == 0:
+                    chord.add_grace_chord(GraceChord(72))
+                    chord.add_grace_chord(GraceChord(74, position='after'))
+            return chords
+
+        def get_xml_string(part, add_chords):
+            part.add_measure(Time(3, 4))
+            part.add_measure(Time(5, 8))
+            add_chords(part, get_chords(), staff_number=None, voice_number=1)
+            add_chords(part, get_chords(), staff_number=2, voice_number=2)
+            score = Score()
+            score.add_child(part)
+            return score.to_string().replace(part.id_.value, 'part')
+
+        def add_chords_one_by_one(part, chords, **kwargs):
+            for chord in chords:
+                part.add_chord(chord, **kwargs)
+
+        p1 = Part('p1')
+        p2 = Part('p2')
+        assert get_xml_string(p1, add_chords_one_by_one) == get_xml_string(p2, Part.add_chords)
+        assert len(p1.get_children()) == len(p2.get_children())
+
+        p = Part('p3')
+        p.add_chords([])
+        assert not p.get_children()
+        with self.assertRaises(TypeError):
+            p.add_chords([Chord(60, 1), 60])
+        assert not p.get_children()
+
+    def test_add_measures(self):
+        def get_xml_string(part, add_measures):
+            part.add_measure(Time(3, 4))
+            part.get_children()[0].get_staff(1).clef = BassClef()
+            part.get_children()[0].add_staff(2)
+            part.get_children()[0].key.fifths = 2
+            add_measures(part)
+            score = Score()
+            score.add_child(part)
+            return score.to_string().replace(part.id_.value, 'part')
+
+        def add_measures_one_by_one(part):
+            for _ in range(4):
+                part.add_measure()
+
+        p1 = Part('p1')
+        p2 = Part('p2')
+        assert get_xml_string(p1, add_measures_one_by_one) == get_xml_string(p2, lambda part: part._add_measures(4))
+        assert [m.number for m in p2.get_children()] == [1, 2, 3, 4, 5]
+
     def test_add_chord_with_staff_number(self):
         p = Part('P1')
         ch1 = Chord(60, 1)
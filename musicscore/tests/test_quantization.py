@@ -2,6 +2,7 @@ import random
 from pathlib import Path
 
 from musicscore import SimpleFormat
+from musicscore.beat import _quantize_beats
 from musicscore.chord import Chord
 from musicscore.part import Part
 from musicscore.quarterduration import QuarterDuration
@@ -135,3 +136,23 @@ class TestQuantization(IdTestCase):
         assert [ch.quarter_duration for ch in p.get_chords()] == [2, 1 / 4, 3 / 4, 1 / 4, 3 / 4]
         assert p.get_measure(1).get_divisions() == 4
         assert [ch.notes[0].xml_duration.value_ for ch in p.get_chords()] == [8, 1, 3, 1, 3]
+
+    def test_quantize_beats_is_equal_to_beatwise_quantization(self):
+        def create_part(id_):
+            p = Part(id_)
+            p.set_possible_subdivisions([2, 3, 4, 6, 8])
+            random.seed(13)
+            quarter_durations = []
+            while sum(quarter_durations) < 40:
+                quarter_durations.append(QuarterDuration(random.random() + random.randint(0, 3)))
+            quarter_durations.append(44 - sum(quarter_durations))
+            for qd in quarter_durations:
+                p.add_chord(Chord(midis=60, quarter_duration=qd))
+            return p
+
+        p1 = create_part('p1')
+        p2 = create_part('p2')
+        for beat in p1.get_beats():
+            beat.quantize_quarter_durations()
+        _quantize_beats(p2.get_beats())
+        assert [ch.quarter_duration for ch in p1.get_chords()] == [ch.quarter_duration for ch in p2.get_chords()]
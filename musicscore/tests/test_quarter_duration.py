@@ -3,7 +3,8 @@ from unittest import TestCase
 
 from musicscore.beat import Beat
 from musicscore.exceptions import QuarterDurationIsNotWritable
-from musicscore.quarterduration import QuarterDuration, _check_quarter_duration_value
+from musicscore.config import NOTETYPES
+from musicscore.quarterduration import QuarterDuration, _check_quarter_duration_value, _classify_quarter_duration
 
 
 class TestQuarterDuration(TestCase):
@@ -89,6 +90,22 @@ class TestQuarterDuration(TestCase):
         assert id(qd.value) != id(copied.value)
         assert qd.value == copied.value
 
+    def test_quarter_duration_slots(self):
+        qd = QuarterDuration(1, 3)
+        assert not hasattr(qd, '__dict__')
+        with self.assertRaises(AttributeError):
+            qd.some_attribute = 1
+
+    def test_interned_fractions(self):
+        values = [0, 1, 1 / 3, 0.2, 1 / 7, 2 / 3, 0.123456, 7.7, 13 / 11, 999.5]
+        for value in values:
+            for _ in range(2):
+                assert QuarterDuration(value).value == Fraction(value).limit_denominator(1000)
+        for value in values:
+            assert (QuarterDuration(1, 3) + value).value == (Fraction(1, 3) + Fraction(value).limit_denominator(1000))
+        big_denominator = Fraction(1, 999) + Fraction(1, 998)
+        assert (QuarterDuration(1, 999) + Fraction(1, 998)).value == big_denominator.limit_denominator(1000)
+
     def test_check_quarter_duration(self):
         assert _check_quarter_duration_value(1)
         assert _check_quarter_duration_value(1.2)
@@ -134,3 +151,31 @@ class TestQuarterDuration(TestCase):
                 QuarterDuration(value).get_type()
             with self.assertRaises(QuarterDurationIsNotWritable):
                 QuarterDuration(value).get_number_of_dots()
+
+    def test_get_tuplet_ratio(self):
+        qd = QuarterDuration(1, 5)
+        assert qd.get_tuplet_ratio() == (5, 4)
+        qd.beat_subdivision = 10
+        assert qd.get_tuplet_ratio() == (10, 8)
+        qd.beat_quarter_duration = 3
+        with self.assertRaises(NotImplementedError):
+            qd.get_tuplet_ratio()
+        assert QuarterDuration(1, 4).get_tuplet_ratio() is None
+        assert QuarterDuration(0).get_tuplet_ratio() is None
+
+    def test_classification_is_cached(self):
+        _classify_quarter_duration.cache_clear()
+        for _ in range(3):
+            qd = QuarterDuration(1, 3)
+            assert qd.type_and_dots == ('eighth', 0)
+            assert qd.get_tuplet_ratio() == (3, 2)
+        assert _classify_quarter_duration.cache_info().misses == 1
+
+    def test_classification_follows_config(self):
+        assert QuarterDuration(1, 5).get_type() == '16th'
+        NOTETYPES[(1, 5)] = '32nd'
+        try:
+            assert QuarterDuration(1, 5).get_type() == '32nd'
+        finally:
+            NOTETYPES[(1, 5)] = '16th'
+        assert QuarterDuration(1, 5).get_type() == '16th'
@@ -1,13 +1,16 @@
+import tempfile
+from pathlib import Path
 from unittest import skip
 
 from musicscore.chord import Chord
-from musicscore.exceptions import ScoreMultiMeasureRestError
+from musicscore.exceptions import ScoreMultiMeasureRestError, AlreadyFinalizedError
 from musicscore.layout import StaffLayout
 from musicscore.measure import Measure
-from musicscore.part import Part
+from musicscore.part import Part, Id
 from musicscore.score import Score, TITLE, SUBTITLE
 from musicscore.tests.util import IdTestCase
-from musicxml import XMLNote
+from musicxml import XMLNote, XMLAccent, XMLTrillMark, XMLUpBow
+from musicxml.exceptions import XMLElementChildrenRequired
 
 
 class TestScore(IdTestCase):
@@ -345,3 +348,108 @@ class TestScore(IdTestCase):
         for p in parts:
             assert p.get_children()[-1].xml_barline.location == 'right'
             assert p.get_children()[-1].xml_barline.xml_bar_style.value_ == 'light-light'
+
+    def test_iter_xml_chunks(self):
+        def create_score():
+            Id.__refs__.clear()
+            score = Score(title='Streaming')
+            parts = [score.add_part(f'p-{i}') for i in range(1, 3)]
+            for p in parts:
+                for qd in [1, 1 / 3, 1 / 3, 1 / 3, 2.5, 0.5, 3, 1.5, 0.5]:
+                    p.add_chord(Chord(61, qd))
+                p.add_chord(Chord([60, 63], 4), staff_number=2)
+            score.set_multi_measure_rest(4, 5)
+            return score
+
+        expected = create_score().to_string()
+        score = create_score()
+        assert ''.join(score.iter_xml_chunks()) == expected
+        assert score._finalized
+        for p in score.get_children():
+            assert p._finalized
+            assert len(p.get_children()) == 1
+        with self.assertRaises(AlreadyFinalizedError):
+            list(score.iter_xml_chunks())
+
+    def test_export_xml_streaming(self):
+        score = Score()
+        p = score.add_part('p-1')
+        for midi in range(60, 72):
+            p.add_chord(Chord(midi, 2))
+        expected = score.to_string()
+        Id.__refs__.clear()
+        score = Score()
+        p = score.add_part('p-1')
+        for midi in range(60, 72):
+            p.add_chord(Chord(midi, 2))
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / (Path(__file__).stem + '_export_xml_streaming.xml')
+            score.export_xml(path, streaming=True)
+            with open(path) as f:
+                assert f.read().endswith(expected)
+
+    def test_export_xml_streaming_finalized_score(self):
+        score = Score()
+        p = score.add_part('p-1')
+        for midi in range(60, 72):
+            p.add_chord(Chord(midi, 2))
+        score.finalize()
+        expected = score.to_string()
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / (Path(__file__).stem + '_export_xml_streaming_finalized_score.xml')
+            score.export_xml(path, streaming=True)
+            with open(path) as f:
+                assert f.read().endswith(expected)
+            # Streamed scores are consumed and cannot be exported again.
+            score = Score()
+            score.add_part('p-2').add_chord(Chord(60, 4))
+            score.export_xml(path, streaming=True)
+            with self.assertRaises(AlreadyFinalizedError):
+                score.export_xml(path, streaming=True)
+
+    def test_to_string_with_workers(self):
+        score = Score(title='Parallel')
+        parts = [score.add_part(f'p-{i}') for i in range(1, 4)]
+        for index, p in enumerate(parts):
+            for qd in [1, 1 / 3, 1 / 3, 1 / 3, 2.5, 0.5, 3, 1.5, 0.5][index:]:
+                p.add_chord(Chord(61 + index, qd))
+        score.set_multi_measure_rest(4, 5)
+        output = score.to_string(workers=2)
+        assert not score._finalized
+        assert output == score.to_string()
+
+    def test_to_string_direct(self):
+        def create_score():
+            Id.__refs__.clear()
+            score = Score(title='Direct', subtitle='Serializer')
+            parts = [score.add_part(f'p-{i}') for i in range(1, 3)]
+            for index, p in enumerate(parts):
+                chords = [Chord([61, 63.5], qd) for qd in [1, 1 / 3, 1 / 3, 1 / 3, 2.5, 0.5, 3, 1.5, 0.5]]
+                if index == 0:
+                    chords[0].add_x(XMLAccent())
+                    chords[0].add_x(XMLTrillMark())
+                    chords[1].add_x(XMLUpBow())
+                    chords[2].add_lyric('la')
+                    chords[3].add_words('words')
+                    chords[4].add_dynamics('ff')
+                    chords[5].add_grace_chord(72)
+                p.add_chords(chords)
+                p.add_chord(Chord(0, 4), staff_number=2)
+            score.set_multi_measure_rest(5, 6)
+            return score
+
+        expected = create_score().to_string()
+        assert create_score().to_string(direct=True) == expected
+        assert ''.join(create_score().iter_xml_chunks(direct=True)) == expected
+        score = create_score()
+        assert score.to_string(workers=2, direct=True) == expected
+        assert not score._finalized
+
+    def test_to_string_direct_checks(self):
+        score = Score()
+        p = score.add_part('p-1')
+        p.add_chord(Chord(60, 4))
+        score.finalize()
+        p.get_chords()[0].notes[0].xml_pitch.xml_step = None
+        with self.assertRaises(XMLElementChildrenRequired):
+            score.to_string(direct=True)
@@ -0,0 +1,83 @@
+import importlib
+import unittest
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from musicscore.chord import Chord
+from musicscore.score import Score
+from musicscore.serializer import _escape_attribute, _escape_text
+from musicscore.tests.util import IdTestCase
+
+_PACKAGE_PATH = Path(__file__).parent.parent
+
+# directories with test modules which export scores
+_CORPORA = ['tests', 'LilyPondUnofficialXMLTestSuite', 'MyXMLTestSuite']
+
+
+def _get_corpus_modules(directory):
+    modules = []
+    for path in sorted((_PACKAGE_PATH / directory).glob('test*.py')):
+        if path.stem == Path(__file__).stem:
+            continue
+        text = path.read_text()
+        if 'export_xml' in text or 'generate_xml_file' in text:
+            modules.append(importlib.import_module(f'musicscore.{directory}.{path.stem}'))
+    return modules
+
+
+def _get_exported_scores_outputs(module):
+    # Runs all tests of module. export_xml collects both string outputs of each score before writing its file as usual.
+    outputs = []
+    original_export_xml = Score.export_xml
+
+    def export_xml(score, path, streaming=False, workers=None, direct=False):
+        if not streaming:
+            outputs.append((Path(path).name, score.to_string(), score.to_string(direct=True)))
+        original_export_xml(score, path, streaming=streaming, workers=workers, direct=direct)
+
+    with patch.object(Score, 'export_xml', export_xml):
+        unittest.defaultTestLoader.loadTestsFromModule(module).run(unittest.TestResult())
+    return outputs
+
+
+class TestEscape(TestCase):
+    values = ['1', 'a & b', '<a>', '"a"', "l'a", 'a\tb\r\nc', '&amp;']
+
+    def test_escape_text(self):
+        assert _escape_text('a & b < c > d "e"\t') == 'a &amp; b &lt; c &gt; d "e"\t'
+        for value in self.values:
+            element = ET.Element('a')
+            element.text = value
+            assert f'<a>{_escape_text(value)}</a>' == ET.tostring(element, encoding='unicode')
+
+    def test_escape_attribute(self):
+        assert _escape_attribute('a & b < c > d "e"\r\n\t') == 'a &amp; b &lt; c &gt; d &quot;e&quot;&#13;&#10;&#09;'
+        for value in self.values:
+            assert f'<a b="{_escape_attribute(value)}" />' == ET.tostring(ET.Element('a', b=value), encoding='unicode')
+
+
+class TestDirectSerialization(IdTestCase):
+    def test_escaped_values(self):
+        def create_score():
+            score = Score(title='Title & "Subtitle"', subtitle='<a>\tb')
+            part = score.add_part('p1')
+            part.name = 'Violin & Viola'
+            chord = Chord(60, 4)
+            chord.add_words('piu <forte> & "dolce"')
+            chord.add_lyric('l\'a&b')
+            part.add_chord(chord)
+            return score
+
+        assert create_score().to_string(direct=True) == create_score().to_string()
+
+    def test_corpora(self):
+        for directory in _CORPORA:
+            number_of_scores = 0
+            for module in _get_corpus_modules(directory):
+                for name, expected, direct_output in _get_exported_scores_outputs(module):
+                    with self.subTest(module=module.__name__, score=name):
+                        assert direct_output == expected
+                    number_of_scores += 1
+            assert number_of_scores > 0
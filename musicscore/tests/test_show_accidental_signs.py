@@ -74,3 +74,25 @@ class TestShowAccidentalSigns(IdTestCase):
                 assert chord.midis[0].accidental.show is True
             else:
                 assert chord.midis[0].accidental.show is False
+
+    def test_show_accidental_signs_repetition_after_rest(self):
+        s = Score()
+        p = s.add_part('p2')
+        p.add_measure(Time(3, 4))
+        for midi in [0, C(5, '#'), C(5, '#')]:
+            p.add_chord(Chord(midi, 1))
+        s.finalize()
+        assert [_chord_is_in_a_repetition(chord) for chord in p.get_chords()] == [False, False, True]
+        assert [chord.midis[0].accidental.show for chord in p.get_chords()[1:]] == [True, False]
+
+    def test_show_accidental_signs_from_previous_measure(self):
+        s = Score()
+        p = s.add_part('p3')
+        p.add_measure(Time(2, 4))
+        for midi in [C(5, '#'), C(5, '#'), C(5), C(5)]:
+            p.add_chord(Chord(midi, 1))
+        s.finalize()
+        m1, m2 = p.get_children()
+        assert m1.get_staff(1)._last_pitch_steps_with_accidentals == {'C'}
+        assert m2.get_staff(1)._last_pitch_steps_with_accidentals == set()
+        assert [chord.midis[0].accidental.show for chord in p.get_chords()] == [True, False, True, False]
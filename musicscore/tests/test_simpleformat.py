@@ -1,9 +1,12 @@
 from pathlib import Path
 from unittest import skip
+from unittest.mock import patch
 
 from deepdiff import DeepDiff
+from quicktions import Fraction
 
-from musicscore import Score, Midi, QuarterDuration, Chord, SimpleFormat, TrebleClef, SimpleFormatException
+from musicscore import Score, Midi, QuarterDuration, Chord, SimpleFormat, TrebleClef, SimpleFormatException, \
+    ColumnarSimpleFormat
 from musicscore.tests.util import IdTestCase, get_xml_diff_part, generate_xml_file
 import xml.etree.ElementTree as ET
 
@@ -188,6 +191,56 @@ class TestSimpleFormat(IdTestCase):
         assert sf.get_chord_at_position(10) is None
         assert sf.get_chord_at_position(14) is None
 
+    def test_get_chord_at_position_after_changes(self):
+        sf = SimpleFormat(quarter_durations=[1, 2, 3])
+        assert sf.get_chord_at_position(2) == sf.chords[1]
+        sf.multiply_quarter_durations(2)
+        assert sf.get_quarter_positions() == [0, 2, 6, 12]
+        assert sf.get_chord_at_position(2) == sf.chords[1]
+        assert sf.get_chord_at_position(6) == sf.chords[2]
+        chord = sf.add_chord(Chord(60, 0.5))
+        assert sf.get_chord_at_position(12.25) == chord
+        assert sf.get_chord_at_position(12.5) is None
+        sf.retrograde()
+        assert sf.get_chord_at_position(0) == chord
+        assert sf.get_chord_at_position(0.5) == sf.chords[1]
+
+    def test_get_chord_at_position_after_quarter_duration_changed_in_place(self):
+        sf = SimpleFormat(quarter_durations=[1, 2, 3], midis=[60, 61, 62])
+        assert sf.get_chord_at_position(1) == sf.chords[1]
+        sf.chords[0].quarter_duration.value = Fraction(5, 2)
+        sf.reset_quarter_positions()
+        assert sf.get_quarter_positions() == [0, 2.5, 4.5, 7.5]
+        assert sf.get_chord_at_position(1) == sf.chords[0]
+        assert sf.get_chord_at_position(2.5) == sf.chords[1]
+        assert sf.get_chord_at_position(7) == sf.chords[2]
+        other = SimpleFormat(quarter_durations=[4, 3.5], midis=[70, 71])
+        summed = SimpleFormat.sum(sf, other)
+        assert summed.get_quarter_positions() == [0, 2.5, 4, 4.5, 7.5]
+        assert [[m.value for m in chord.midis] for chord in summed.chords] == [[60, 70], [61, 70], [61, 71],
+                                                                                [62, 71]]
+
+    def test_get_chord_at_position_uses_cached_positions(self):
+        sf = SimpleFormat(quarter_durations=[1, 2, 3])
+        assert sf.get_chord_at_position(1) == sf.chords[1]
+        with patch.object(SimpleFormat, 'get_quarter_durations') as get_quarter_durations:
+            assert sf.get_chord_at_position(3) == sf.chords[2]
+            assert sf.get_chord_at_position(0) == sf.chords[0]
+            get_quarter_durations.assert_not_called()
+        chord = sf.add_chord(Chord(60, 1))
+        assert sf.get_chord_at_position(6) == chord
+
+    def test_sum_chords_at_positions(self):
+        sf1 = SimpleFormat(quarter_durations=[1, 0.5, 1.5, 1, 2], midis=[60, 61, 62, 63, 64])
+        sf2 = SimpleFormat(quarter_durations=[0.5, 2.5, 3], midis=[70, 71, 72])
+        sf3 = SimpleFormat(quarter_durations=[4, 1, 1], midis=[80, 81, 82])
+        sf = SimpleFormat.sum(sf1, sf2, sf3)
+        assert sf.get_quarter_positions() == [0, 0.5, 1, 1.5, 3, 4, 5, 6]
+        for position in sf.get_quarter_positions()[:-1]:
+            expected = [m.value for simple_format in (sf1, sf2, sf3) for m in
+                        simple_format.get_chord_at_position(position).midis]
+            assert [m.value for m in sf.get_chord_at_position(position).midis] == expected
+
     @skip
     def test_auto_clef(self):
         self.fail()
@@ -308,3 +361,92 @@ class TestSimpleFormat(IdTestCase):
         sf2 = SimpleFormat(quarter_durations=[3, 2, 1], midis=[63, 64, 65])
         with self.assertRaises(SimpleFormatException):
             SimpleFormat.sum(sf1, sf2)
+
+
+class TestColumnarSimpleFormat(IdTestCase):
+    def test_init(self):
+        sf = ColumnarSimpleFormat(quarter_durations=[1, 0.5, 1 / 3], midis=[60, (61, 64.5)])
+        assert len(sf) == 3
+        assert sf.get_quarter_durations() == [1, 0.5, QuarterDuration(1, 3)]
+        assert sf.get_midis() == [(60,), (61, 64.5), (71,)]
+        assert sf.quarter_duration == QuarterDuration(11, 6)
+        with self.assertRaises(ValueError):
+            ColumnarSimpleFormat(quarter_durations=[-1])
+        with self.assertRaises(ValueError):
+            ColumnarSimpleFormat(midis=[130])
+
+    def test_transformations_like_simple_format(self):
+        quarter_durations = [1, 2, 0.5, 0.5]
+        midis = [60, 61, 62, (64, 67)]
+        sf = SimpleFormat(quarter_durations=quarter_durations, midis=midis)
+        csf = ColumnarSimpleFormat(quarter_durations=quarter_durations, midis=midis)
+        for simple_format in [sf, csf]:
+            simple_format.mirror(pivot=63)
+            simple_format.multiply_quarter_durations(QuarterDuration(2, 3))
+            simple_format.retrograde()
+        assert csf.get_quarter_durations() == sf.get_quarter_durations()
+        assert csf.get_quarter_positions() == sf.get_quarter_positions()
+        assert csf.get_midis() == [tuple(midi.value for midi in midis) for midis in sf.get_midis()]
+        csf.transpose(-2)
+        assert csf.get_midis() == [(60, 57), (62,), (63,), (64,)]
+
+    def test_rests_and_ties(self):
+        csf = ColumnarSimpleFormat(quarter_durations=[1, 1, 1], midis=[0, 60, 60])
+        csf.add_tie(1, 'start')
+        csf.add_tie(2, 'stop')
+        csf.mirror(70)
+        csf.extend(ColumnarSimpleFormat(quarter_durations=[2], midis=[(60, 67)]))
+        assert csf.get_midis() == [(0,), (80,), (80,), (60, 67)]
+        chords = list(csf.iter_chords())
+        assert chords[0].is_rest
+        assert [[midi._ties for midi in chord.midis] for chord in chords[:3]] == [[set()], [{'start'}], [{'stop'}]]
+        with self.assertRaises(ValueError):
+            csf.add_tie(0, 'continue')
+        with self.assertRaises(ValueError):
+            csf.append(1, [60, 0])
+
+    def test_add_to_part(self):
+        csf = ColumnarSimpleFormat(quarter_durations=[1.5, 1.5, 2, 3], midis=[60, 62, (64, 67), 0])
+        score = Score()
+        part = score.add_part('columnar')
+        part.add_chords(csf)
+        assert sum(chord.quarter_duration for chord in part.get_chords()) == 8
+        assert [midi.value for midi in part.get_chords()[0].midis] == [60]
+        assert csf.to_simple_format().get_quarter_durations() == csf.get_quarter_durations()
+
+    def test_add_to_part_creates_chords_lazily(self):
+        class RecordingColumnarSimpleFormat(ColumnarSimpleFormat):
+            def iter_chords(self):
+                for chord in super().iter_chords():
+                    numbers_of_measures.append(len(part.get_children()))
+                    yield chord
+
+        numbers_of_measures = []
+        csf = RecordingColumnarSimpleFormat(quarter_durations=[3] * 8, midis=[60] * 8)
+        score = Score()
+        part = score.add_part('columnar')
+        part.add_chords(csf)
+        # all six measures are added before the first chord is created
+        assert numbers_of_measures == [6] * 8
+        assert len(part.get_children()) == 6
+
+    def test_transformations_of_empty_sequence(self):
+        for simple_format in [SimpleFormat(), ColumnarSimpleFormat()]:
+            simple_format.mirror()
+            simple_format.transpose(Midi(60))
+            simple_format.transpose(2)
+            simple_format.multiply_quarter_durations(2)
+            assert simple_format.get_quarter_durations() == []
+        score = Score()
+        part = score.add_part('columnar')
+        part.add_chords(ColumnarSimpleFormat())
+        assert part.get_children() == []
+
+    def test_multiply_quarter_durations_limits_denominators(self):
+        quarter_durations = [QuarterDuration(1, 3), QuarterDuration(999, 1000), 2]
+        sf = SimpleFormat(quarter_durations=[QuarterDuration(qd) for qd in quarter_durations])
+        csf = ColumnarSimpleFormat(quarter_durations=quarter_durations)
+        for simple_format in [sf, csf]:
+            simple_format.multiply_quarter_durations(QuarterDuration(3, 7))
+        assert csf.get_quarter_durations() == sf.get_quarter_durations()
+        assert max(qd.value.denominator for qd in csf.get_quarter_durations()) <= 1000
@@ -160,6 +160,23 @@ class TestTime(TestCase):
         assert copied.actual_signatures == t.actual_signatures
         assert copied.show == t.show
 
+    def test_xml_object_is_created_on_first_use(self):
+        t = Time(3, 4, show=False)
+        t.signatures = [5, 8]
+        assert t.__dict__.get('_xml_object') is None
+        assert [ch.value_ for ch in t.xml_object.get_children()] == ['5', '8']
+        t.signatures = [2, 4, 3, 8]
+        assert [ch.value_ for ch in t.xml_object.get_children()] == ['2', '4', '3', '8']
+
+    def test_beats_quarter_durations_are_not_shared(self):
+        t1 = Time(3, 4)
+        t2 = Time(3, 4)
+        qds_1 = t1.get_beats_quarter_durations()
+        qds_2 = t2.get_beats_quarter_durations()
+        assert qds_1 == qds_2
+        assert qds_1[0] is not qds_2[0]
+        assert qds_1[0] is not t1.get_beats_quarter_durations()[0]
+
 
 class TestActualTime(IdTestCase):
 
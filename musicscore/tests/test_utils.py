@@ -30,6 +30,15 @@ class TestUtils(TestCase):
         assert isinstance_as_string(C(4), 'C')
         assert not isinstance_as_string(C(4), 'str')
 
+    def test_xml_class_tables_are_created_lazily(self):
+        import musicscore.util as util
+        from musicxml.xmlelement.xmlelement import XMLAccent, XMLSlur
+        assert XML_ARTICULATION_CLASSES[0] is XMLAccent
+        assert util.XML_ARTICULATION_CLASSES is XML_ARTICULATION_CLASSES
+        assert util.XMLSlur is XMLSlur
+        with self.assertRaises(AttributeError):
+            util.XML_NOT_EXISTING_CLASSES
+
     def test_create_expected_path(self):
         path = Path(__file__).parent / 'test_util_diff_xml.xml'
         expected_path = _create_expected_path(path)
@@ -58,6 +58,15 @@ class TestVoice(TestCase):
         with self.assertRaises(VoiceIsFullError):
             assert v.get_current_beat() is None
 
+    @patch('musicscore.voice.Voice.up', new=Mock())
+    def test_fill_with_rests_after_partially_filled_beats(self):
+        v = Voice()
+        v.update_beats(1, 1, 1)
+        v._add_chord(Chord(60, 1.5))
+        v.fill_with_rests()
+        assert v.is_filled
+        assert [ch.quarter_duration for ch in v.get_chords()] == [1.5, 0.5, 1]
+
     @patch('musicscore.staff.Staff')
     def test_add_chord(self, mock_staff):
         v = Voice()
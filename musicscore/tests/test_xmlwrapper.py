@@ -0,0 +1,99 @@
+import copy
+from unittest import TestCase
+
+from musicxml.exceptions import XMLElementChildrenRequired
+from musicxml.xmlelement.containers import containers
+from musicxml.xmlelement.xmlelement import XMLNote, XMLPitch, XMLMeasure, XMLAttributes, XMLRest, XMLAccidental, XMLStaff
+
+import musicscore
+from musicscore.dynamics import DYNAMICS
+from musicscore.xmlwrapper import _clone_child_container, _create_xml_element, XMLWrapper
+
+
+# xml classes which cannot be created without a value
+_VALUES = {XMLAccidental: 'sharp', XMLStaff: 1}
+
+
+def _get_used_xml_classes():
+    # all wrapper classes must be imported to be found as subclasses
+    for name in musicscore.__all__:
+        getattr(musicscore, name)
+    xml_classes = {XMLAttributes, XMLMeasure, XMLPitch, XMLRest, *DYNAMICS.values()}
+    wrapper_classes = [XMLWrapper]
+    while wrapper_classes:
+        wrapper_class = wrapper_classes.pop()
+        wrapper_classes.extend(wrapper_class.__subclasses__())
+        if isinstance(wrapper_class.XMLClass, type):
+            xml_classes.add(wrapper_class.XMLClass)
+    return sorted(xml_classes, key=lambda xml_class: xml_class.__name__)
+
+
+def _get_state(obj, nodes):
+    # Attributes of obj with references to the element, its containers and their contents replaced by their positions.
+    def get_value(value):
+        if id(value) in nodes:
+            return 'node', nodes[id(value)]
+        if isinstance(value, (list, tuple)):
+            return [get_value(v) for v in value]
+        if isinstance(value, dict):
+            return {key: get_value(v) for key, v in value.items()}
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
+        return value.__class__, getattr(value, 'name', None)
+
+    return {key: get_value(value) for key, value in obj.__dict__.items()}
+
+
+def _get_element_states(element):
+    objects = [element]
+    if element._child_container_tree:
+        for container in element._child_container_tree.traverse():
+            objects.extend([container, container.content])
+    nodes = {id(obj): index for index, obj in enumerate(objects)}
+    return [_get_state(obj, nodes) for obj in objects]
+
+
+class TestCreateXMLElement(TestCase):
+    def test_clone_child_container(self):
+        for template in containers.values():
+            copied = copy.copy(template)
+            cloned = _clone_child_container(template)
+            assert cloned.tree_representation() == copied.tree_representation()
+            for copied_node, cloned_node in zip(copied.traverse(), cloned.traverse()):
+                assert cloned_node.__dict__.keys() == copied_node.__dict__.keys()
+                assert cloned_node.content.__class__ == copied_node.content.__class__
+                assert cloned_node.content.parent_container is cloned_node
+                assert cloned_node.content is not template.content
+
+    def test_created_elements_equal_freshly_built_elements(self):
+        xml_classes = _get_used_xml_classes()
+        assert XMLNote in xml_classes and DYNAMICS['f'] in xml_classes
+        for xml_class in xml_classes:
+            with self.subTest(xml_class=xml_class.__name__):
+                kwargs = {'value_': _VALUES[xml_class]} if xml_class in _VALUES else {}
+                assert _get_element_states(_create_xml_element(xml_class, **kwargs)) == _get_element_states(
+                    xml_class(**kwargs))
+
+    def test_created_elements_are_independent(self):
+        note_1 = _create_xml_element(XMLNote)
+        note_2 = _create_xml_element(XMLNote)
+        assert note_1.child_container_tree.get_parent_xml_element() is note_1
+        pitch = note_1.xml_pitch = _create_xml_element(XMLPitch)
+        pitch.xml_step = 'C'
+        pitch.xml_octave = 4
+        note_1.xml_duration = 1
+        assert note_2.xml_pitch is None
+        assert note_2.get_children() == []
+        note_2.xml_rest = None
+        expected = XMLNote()
+        expected_pitch = expected.xml_pitch = XMLPitch()
+        expected_pitch.xml_step = 'C'
+        expected_pitch.xml_octave = 4
+        expected.xml_duration = 1
+        assert note_1.to_string() == expected.to_string()
+
+    def test_missing_children(self):
+        with self.assertRaises(XMLElementChildrenRequired):
+            _create_xml_element(XMLPitch).to_string()
+        measure = _create_xml_element(XMLMeasure, number='1')
+        assert measure.to_string() == XMLMeasure(number='1').to_string()
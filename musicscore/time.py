@@ -4,13 +4,17 @@ from musicscore.exceptions import TimeActualSignaturesNotValidError
 from musicscore.quarterduration import QuarterDuration
 from musicscore.util import isinstance_as_string
 from musicxml.xmlelement.xmlelement import XMLTime, XMLBeats, XMLBeatType
-from musicscore.xmlwrapper import XMLWrapper
+from musicscore.xmlwrapper import XMLWrapper, _create_xml_element
 
 __all__ = ['Time', 'flatten_times', 'CONVERSION_DICTIONARY']
 
 #: If :obj:`Time.actual_signatures` is not set manually first this dictionary is used to create actual signature.
 CONVERSION_DICTIONARY = {'2/8': [2, 8], '4/8': [2, 8, 2, 8], '5/8': [3, 8, 2, 8], '7/8': [4, 8, 3, 8]}
 
+# actual signatures as tuple -> tuple of beats' quarter duration values (Fractions). Each call creates new QuarterDuration
+# objects from these values, since QuarterDurations store beat subdivision etc.
+_BEATS_QUARTER_DURATION_VALUES = {}
+
 
 def _convert_signatures_to_ints(signatures):
     output = []
@@ -34,6 +38,17 @@ def _convert_signatures_to_ints(signatures):
     return output
 
 
+def _get_beats_quarter_durations(actual_signatures):
+    key = tuple(actual_signatures)
+    try:
+        values = _BEATS_QUARTER_DURATION_VALUES[key]
+    except KeyError:
+        values = _BEATS_QUARTER_DURATION_VALUES[key] = tuple(
+            (QuarterDuration(numerator, denominator) * 4).value for numerator, denominator in
+            [actual_signatures[i:i + 2] for i in range(0, len(actual_signatures), 2)])
+    return [QuarterDuration(value) for value in values]
+
+
 def _get_quarter_durations_from_ints(signatures):
     output = 0
     for i in range(int(len(signatures) / 2)):
@@ -49,7 +64,9 @@ class Time(XMLWrapper):
 
     def __init__(self, *signatures, show=True, **kwargs):
         super().__init__()
-        self._xml_object = self.XMLClass(**kwargs)
+        if kwargs:
+            self._xml_object = _create_xml_element(self.XMLClass, **kwargs)
+        # Otherwise XMLTime is created on first use (see _create_xml_object). Hidden times do not need it.
         self._parent_measure = None
 
         self._signatures = None
@@ -81,10 +98,20 @@ class Time(XMLWrapper):
         self._actual_signatures = None
         self._intern_actual_signatures = None
 
+    def _create_xml_object(self):
+        xml_object = _create_xml_element(self.XMLClass)
+        for i in range(0, len(self.signatures), 2):
+            xml_object.add_child(XMLBeats(str(self.signatures[i])))
+            xml_object.add_child(XMLBeatType(str(self.signatures[i + 1])))
+        return xml_object
+
     def _update_signature_objects(self):
+        xml_object = self.__dict__.get('_xml_object')
+        if xml_object is None:
+            return
         signatures = [self.signatures[i:i + 2] for i in range(0, len(self.signatures), 2)]
-        for beats, beat_type in zip(self._xml_object.find_children('XMLBeats'),
-                                    self._xml_object.find_children('XMLBeatType')):
+        for beats, beat_type in zip(xml_object.find_children('XMLBeats'),
+                                    xml_object.find_children('XMLBeatType')):
             if signatures:
                 signature = signatures.pop(0)
                 beats.value_ = str(signature[0])
@@ -93,8 +120,8 @@ class Time(XMLWrapper):
                 beats.up.remove(beats)
                 beat_type.up.remove(beat_type)
         for beats, beat_type in signatures:
-            self._xml_object.add_child(XMLBeats(str(beats)))
-            self._xml_object.add_child(XMLBeatType(str(beat_type)))
+            xml_object.add_child(XMLBeats(str(beats)))
+            xml_object.add_child(XMLBeatType(str(beat_type)))
 
     @property
     def actual_signatures(self) -> List[int]:
@@ -176,8 +203,7 @@ class Time(XMLWrapper):
         """
         :return: List of quarter durations according to :obj:`actual_signatures`
         """
-        return [QuarterDuration(numerator, denominator) * 4 for numerator, denominator in
-                [self.actual_signatures[i:i + 2] for i in range(0, len(self.actual_signatures), 2)]]
+        return _get_beats_quarter_durations(self.actual_signatures)
 
     def __copy__(self):
         cp = self.__class__(*self.signatures, show=self.show)
@@ -2,7 +2,6 @@ import math
 from typing import Union, List
 
 from musicscore.exceptions import WrongNumberOfChordsError, LyricSyllabicOrExtensionError
-from musicxml.xmlelement.xmlelement import *
 
 note_types = {(1, 12): '32nd',
               (1, 11): '32nd',
@@ -50,50 +49,51 @@ note_types = {(1, 12): '32nd',
               (12, 1): 'breve'
               }
 
-#:
-XML_ARTICULATION_CLASSES = [XMLAccent, XMLStrongAccent, XMLStaccato, XMLTenuto, XMLDetachedLegato, XMLStaccatissimo,
-                            XMLSpiccato, XMLScoop, XMLPlop, XMLDoit, XMLFalloff, XMLBreathMark, XMLCaesura, XMLStress,
-                            XMLUnstress]
-
-#:
-XML_TECHNICAL_CLASSES = [XMLUpBow, XMLDownBow, XMLHarmonic, XMLOpenString, XMLThumbPosition, XMLFingering, XMLPluck,
-                         XMLDoubleTongue,
-                         XMLTripleTongue, XMLStopped, XMLSnapPizzicato, XMLFret, XMLString, XMLHammerOn, XMLPullOff,
-                         XMLBend, XMLTap,
-                         XMLHeel, XMLToe, XMLFingernails, XMLHole, XMLArrow, XMLHandbell, XMLBrassBend, XMLFlip,
-                         XMLSmear, XMLOpen,
-                         XMLHalfMuted, XMLHarmonMute, XMLGolpe, XMLOtherTechnical]
-
-#:
-XML_ORNAMENT_CLASSES = [XMLDelayedInvertedTurn, XMLDelayedTurn, XMLHaydn, XMLInvertedMordent,
-                        XMLInvertedTurn,
-                        XMLInvertedVerticalTurn, XMLMordent, XMLOtherOrnament, XMLSchleifer, XMLShake, XMLTremolo,
-                        XMLTrillMark, XMLTurn,
-                        XMLVerticalTurn, XMLWavyLine]
-
-#:
-XML_DYNAMIC_CLASSES = [XMLF, XMLFf, XMLFff, XMLFfff, XMLFffff, XMLFfffff, XMLFp, XMLFz, XMLMf, XMLMp, XMLP, XMLPf,
-                       XMLPp, XMLPpp, XMLPppp,
-                       XMLPpppp, XMLPppppp, XMLRf, XMLRfz, XMLSf, XMLSffz, XMLSfp, XMLSfpp, XMLSfz, XMLSfzp,
-                       XMLOtherDynamics]
-
-#:
-XML_OTHER_NOTATIONS = [XMLArpeggiate, XMLFermata, XMLFootnote, XMLGlissando, XMLLevel, XMLNonArpeggiate,
-                       XMLOtherNotation, XMLSlide,
-                       XMLSlur]
-
-#:
-XML_DIRECTION_TYPE_CLASSES = [
-    XMLRehearsal, XMLSegno, XMLCoda, XMLWords, XMLSymbol, XMLWedge, XMLDashes, XMLBracket, XMLPedal,
-    XMLMetronome, XMLOctaveShift, XMLHarpPedals, XMLDamp, XMLDampAll, XMLEyeglasses, XMLStringMute, XMLScordatura,
-    XMLPrincipalVoice, XMLPercussion, XMLAccordionRegistration, XMLStaffDivide, XMLOtherDirection
-]
-
-#:
-XML_ORNAMENT_AND_OTHER_NOTATIONS = [XMLAccidentalMark]
-
-#:
-XML_DIRECTION_TYPE_AND_OTHER_NOTATIONS = [XMLDynamics]
+# name of table -> names of musicxml classes. Tables are created on first access (see __getattr__), so that importing
+# this module does not import musicxml.
+_XML_CLASS_TABLES = {
+    'XML_ARTICULATION_CLASSES': ['XMLAccent', 'XMLStrongAccent', 'XMLStaccato', 'XMLTenuto', 'XMLDetachedLegato',
+                                 'XMLStaccatissimo', 'XMLSpiccato', 'XMLScoop', 'XMLPlop', 'XMLDoit', 'XMLFalloff',
+                                 'XMLBreathMark', 'XMLCaesura', 'XMLStress', 'XMLUnstress'],
+    'XML_TECHNICAL_CLASSES': ['XMLUpBow', 'XMLDownBow', 'XMLHarmonic', 'XMLOpenString', 'XMLThumbPosition',
+                              'XMLFingering', 'XMLPluck', 'XMLDoubleTongue', 'XMLTripleTongue', 'XMLStopped',
+                              'XMLSnapPizzicato', 'XMLFret', 'XMLString', 'XMLHammerOn', 'XMLPullOff', 'XMLBend',
+                              'XMLTap', 'XMLHeel', 'XMLToe', 'XMLFingernails', 'XMLHole', 'XMLArrow', 'XMLHandbell',
+                              'XMLBrassBend', 'XMLFlip', 'XMLSmear', 'XMLOpen', 'XMLHalfMuted', 'XMLHarmonMute',
+                              'XMLGolpe', 'XMLOtherTechnical'],
+    'XML_ORNAMENT_CLASSES': ['XMLDelayedInvertedTurn', 'XMLDelayedTurn', 'XMLHaydn', 'XMLInvertedMordent',
+                             'XMLInvertedTurn', 'XMLInvertedVerticalTurn', 'XMLMordent', 'XMLOtherOrnament',
+                             'XMLSchleifer', 'XMLShake', 'XMLTremolo', 'XMLTrillMark', 'XMLTurn', 'XMLVerticalTurn',
+                             'XMLWavyLine'],
+    'XML_DYNAMIC_CLASSES': ['XMLF', 'XMLFf', 'XMLFff', 'XMLFfff', 'XMLFffff', 'XMLFfffff', 'XMLFp', 'XMLFz', 'XMLMf',
+                            'XMLMp', 'XMLP', 'XMLPf', 'XMLPp', 'XMLPpp', 'XMLPppp', 'XMLPpppp', 'XMLPppppp', 'XMLRf',
+                            'XMLRfz', 'XMLSf', 'XMLSffz', 'XMLSfp', 'XMLSfpp', 'XMLSfz', 'XMLSfzp', 'XMLOtherDynamics'],
+    'XML_OTHER_NOTATIONS': ['XMLArpeggiate', 'XMLFermata', 'XMLFootnote', 'XMLGlissando', 'XMLLevel',
+                            'XMLNonArpeggiate', 'XMLOtherNotation', 'XMLSlide', 'XMLSlur'],
+    'XML_DIRECTION_TYPE_CLASSES': ['XMLRehearsal', 'XMLSegno', 'XMLCoda', 'XMLWords', 'XMLSymbol', 'XMLWedge',
+                                   'XMLDashes', 'XMLBracket', 'XMLPedal', 'XMLMetronome', 'XMLOctaveShift',
+                                   'XMLHarpPedals', 'XMLDamp', 'XMLDampAll', 'XMLEyeglasses', 'XMLStringMute',
+                                   'XMLScordatura', 'XMLPrincipalVoice', 'XMLPercussion', 'XMLAccordionRegistration',
+                                   'XMLStaffDivide', 'XMLOtherDirection'],
+    'XML_ORNAMENT_AND_OTHER_NOTATIONS': ['XMLAccidentalMark'],
+    'XML_DIRECTION_TYPE_AND_OTHER_NOTATIONS': ['XMLDynamics'],
+}
+
+
+def __getattr__(name):
+    if name.startswith('__'):
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    from musicxml.xmlelement import xmlelement
+    class_names = _XML_CLASS_TABLES.get(name)
+    if class_names is not None:
+        value = [getattr(xmlelement, class_name) for class_name in class_names]
+    elif name.startswith('XML') and hasattr(xmlelement, name):
+        # musicxml classes were formerly star imported into this module.
+        value = getattr(xmlelement, name)
+    else:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    globals()[name] = value
+    return value
 
 
 def lcm(l):
@@ -117,6 +117,10 @@ def xToD(input_list):
     return result
 
 
+# class -> frozenset of class names in its __mro__. Filled on first use of each class.
+_MRO_CLASS_NAMES = {}
+
+
 def isinstance_as_string(child: object, parent_class_names: Union[str, List[str]]) -> bool:
     """
     This function can be used to check if some class names (parent_class_names) can be found in another class's __mro__.
@@ -125,28 +129,33 @@ def isinstance_as_string(child: object, parent_class_names: Union[str, List[str]
     :param str/[str] parent_class_names:
     :return: bool
     """
+    child_class = child.__class__
+    try:
+        class_names = _MRO_CLASS_NAMES[child_class]
+    except KeyError:
+        class_names = _MRO_CLASS_NAMES[child_class] = frozenset(cls.__name__ for cls in child_class.__mro__)
+    except TypeError:
+        class_names = frozenset(cls.__name__ for cls in child_class.__mro__)
     if isinstance(parent_class_names, str):
-        parent_class_names = [parent_class_names]
-
-    for parent_class_name in parent_class_names:
-        if parent_class_name not in [cls.__name__ for cls in child.__class__.__mro__]:
-            return False
-    return True
+        return parent_class_names in class_names
+    return all(parent_class_name in class_names for parent_class_name in parent_class_names)
 
 
 def _chord_is_in_a_repetition(chord):
-    my_index = chord.up.up.get_chords().index(chord)
+    voice_chords = chord.up.up.get_chords()
+    my_index = voice_chords.index(chord)
     if my_index > 0 and not chord.is_tied_to_previous:
-        all_previous_chords = [chord.up.up.get_chords()[my_index - i] for i in range(1, my_index + 1)]
+        all_previous_chords = voice_chords[my_index - 1::-1]
         if set([ch.is_tied_to_previous for ch in all_previous_chords]) == {True}:
             return False
         previous_chord = all_previous_chords[0]
-        if chord.has_same_pitches(previous_chord):
+        if not previous_chord.is_rest and chord.has_same_pitches(previous_chord):
             return True
     return False
 
 
 def slur_chords(chords, number=1, **kwargs):
+    from musicxml.xmlelement.xmlelement import XMLSlur
     if len(chords) < 2:
         raise WrongNumberOfChordsError('util.slur_chords needs at list two chords.')
 
@@ -157,6 +166,7 @@ def slur_chords(chords, number=1, **kwargs):
 
 
 def trill_chords(chords, number=1, placement='above', **kwargs):
+    from musicxml.xmlelement.xmlelement import XMLTrillMark, XMLWavyLine
     if len(chords) < 2:
         raise WrongNumberOfChordsError('util.trill_chords needs at list two chords.')
     chords[0].add_x(XMLTrillMark(placement=placement, **kwargs))
@@ -167,6 +177,7 @@ def trill_chords(chords, number=1, placement='above', **kwargs):
 
 
 def wedge_chords(chords, wedge_type, number=1, placement='below', **kwargs):
+    from musicxml.xmlelement.xmlelement import XMLWedge
     if len(chords) < 2:
         raise WrongNumberOfChordsError('util.wedge_chords needs at list two chords.')
 
@@ -177,6 +188,7 @@ def wedge_chords(chords, wedge_type, number=1, placement='below', **kwargs):
 
 
 def bracket_chords(chords, line_type='solid', start_line_end='down', end_line_end='down', placement='above', number=1):
+    from musicxml.xmlelement.xmlelement import XMLBracket
     if len(chords) < 2:
         raise WrongNumberOfChordsError('util.bracket_chords needs at list two chords.')
 
@@ -189,6 +201,7 @@ def bracket_chords(chords, line_type='solid', start_line_end='down', end_line_en
 
 
 def octave_chords(chords, type='down', size=8, number=1):
+    from musicxml.xmlelement.xmlelement import XMLOctaveShift
     try:
         len(chords)
     except TypeError:
@@ -205,6 +218,7 @@ def octave_chords(chords, type='down', size=8, number=1):
 
 
 def _generate_lyrics(lyrics, number=1, show_number=False, mode='list', **kwargs):
+    from musicxml.xmlelement.xmlelement import XMLLyric, XMLExtend, XMLSyllabic, XMLText, XMLElision
     def _get_syllables_extensions_from_group(syllabic_group):
         if syllabic_group[0] is None:
             raise LyricSyllabicOrExtensionError(
@@ -4,10 +4,10 @@ from musicscore.beat import Beat
 from musicscore.chord import GraceChord, Chord
 from musicscore.exceptions import VoiceHasNoBeatsError, VoiceHasNoParentError, VoiceIsFullError, \
     AddChordError, AlreadyFinalizedError
-from musicscore.musictree import MusicTree
+from musicscore.musictree import MusicTree, _NodeKind
 from musicscore.finalize import FinalizeMixin
 from musicscore.quantize import QuantizeMixin
-from musicscore.xmlwrapper import XMLWrapper
+from musicscore.xmlwrapper import XMLWrapper, _create_xml_element
 from musicxml.xmlelement.xmlelement import XMLVoice
 
 __all__ = ['Voice']
@@ -19,6 +19,7 @@ class Voice(MusicTree, QuantizeMixin, FinalizeMixin, XMLWrapper):
 
     Child type: :obj:`~musicscore.beat.Beat`
     """
+    _node_kind = _NodeKind.VOICE
     _ATTRIBUTES = {'number', 'leftover_chord', 'is_filled'}
     _ATTRIBUTES = _ATTRIBUTES.union(MusicTree._ATTRIBUTES)
     _ATTRIBUTES = _ATTRIBUTES.union(QuantizeMixin._ATTRIBUTES)
@@ -26,12 +27,14 @@ class Voice(MusicTree, QuantizeMixin, FinalizeMixin, XMLWrapper):
 
     def __init__(self, number=None, *args, **kwargs):
         super().__init__()
-        self._xml_object = self.XMLClass(value_='1', *args, **kwargs)
+        self._xml_object = _create_xml_element(self.XMLClass, value_='1', *args, **kwargs)
         self._number = None
         self.number = number
         self._current_beat_index = None
         self._leftover_chord = None
         self._final_updated = False
+        # id(beat) -> (index, offset) of each beat child. Reset if beats are added, removed or changed.
+        self._beat_positions = None
 
     def _add_chord(self, chord: 'Chord') -> List['Chord']:
         """
@@ -41,19 +44,38 @@ class Voice(MusicTree, QuantizeMixin, FinalizeMixin, XMLWrapper):
         if not self.get_children():
             raise VoiceHasNoBeatsError
 
+        beats = self.get_children()
+        index = self.get_current_beat_index()
         try:
-            current_beat = self.get_children()[self.get_current_beat_index()]
+            current_beat = beats[index]
         except IndexError:
             raise VoiceIsFullError(f'Voice number {self.value_} of Measure number {self.up.up.number} is full.')
 
         if isinstance(chord, GraceChord) and chord.position == 'after':
             return current_beat.add_child(chord)
 
-        if current_beat.is_filled:
-            self._current_beat_index += 1
-            return self._add_chord(chord)
-        else:
-            return current_beat.add_child(chord)
+        while current_beat.is_filled:
+            index += 1
+            self._current_beat_index = index
+            try:
+                current_beat = beats[index]
+            except IndexError:
+                raise VoiceIsFullError(f'Voice number {self.value_} of Measure number {self.up.up.number} is full.')
+        return current_beat.add_child(chord)
+
+    def _get_beat_position(self, beat):
+        if self._beat_positions is None:
+            positions = {}
+            offset = 0
+            for index, child in enumerate(self.get_children()):
+                positions[id(child)] = (index, offset)
+                offset = child.quarter_duration + offset
+            self._beat_positions = positions
+        return self._beat_positions[id(beat)]
+
+    def _reset_iterators(self):
+        self._beat_positions = None
+        super()._reset_iterators()
 
     @property
     def is_filled(self) -> bool:
@@ -130,21 +152,24 @@ class Voice(MusicTree, QuantizeMixin, FinalizeMixin, XMLWrapper):
         if not self.is_filled:
             if not self.get_children():
                 self.update_beats()
-            self._add_chord(Chord(0, sum([b.quarter_duration for b in self.get_beats()]) - sum([ch.quarter_duration for ch in self.get_chords()])))
+            self._add_chord(Chord(0, sum([b.quarter_duration - b.filled_quarter_duration for b in self.get_beats()])))
 
     def get_current_beat(self) -> 'Beat':
         """
         :return: First not completely filled child of type :obj:`~musicscore.beat.Beat`
         :exception: :obj:`~musicscore.exceptions.VoiceIsFullError` is raised if all beats are already filled.
         """
-        try:
-            current_beat = self.get_children()[self.get_current_beat_index()]
-        except IndexError:
-            raise VoiceIsFullError()
-        if current_beat.is_filled:
-            self._current_beat_index += 1
-            return self.get_current_beat()
-        return current_beat
+        beats = self.get_children()
+        index = self.get_current_beat_index()
+        while True:
+            try:
+                current_beat = beats[index]
+            except IndexError:
+                raise VoiceIsFullError()
+            if not current_beat.is_filled:
+                return current_beat
+            index += 1
+            self._current_beat_index = index
 
     def get_current_beat_index(self) -> int:
         """
@@ -1,3 +1,83 @@
+from musicxml.xmlelement.containers import containers
+from musicxml.xmlelement.xmlchildcontainer import XMLChildContainer
+from musicxml.xsd.xsdelement import XSDElement
+from musicxml.xsd.xsdindicator import XSDGroup
+
+# (class, attribute name) -> True if the attribute is set on the instance itself (private attributes, _ATTRIBUTES and
+# _TREE_ATTRIBUTES), False if it is passed on. Filled on first use of each attribute.
+_LOCAL_ATTRIBUTE_ROUTES = {}
+
+# (xml class, attribute name) -> True if the attribute can be found with __getattribute__ of the xml object (class
+# attributes, private attributes and _PROPERTIES), False if only XMLElement.__getattr__ can return it.
+_XML_OBJECT_ATTRIBUTE_ROUTES = {}
+
+
+def _is_local_attribute(cls, key):
+    try:
+        return _LOCAL_ATTRIBUTE_ROUTES[cls, key]
+    except KeyError:
+        local = key[0] == '_' or key in cls._ATTRIBUTES or key in getattr(cls, '_TREE_ATTRIBUTES', ())
+        _LOCAL_ATTRIBUTE_ROUTES[cls, key] = local
+        return local
+
+
+def _is_xml_object_attribute(xml_class, item):
+    try:
+        return _XML_OBJECT_ATTRIBUTE_ROUTES[xml_class, item]
+    except KeyError:
+        found = item[0] == '_' or item in xml_class._PROPERTIES or hasattr(xml_class, item)
+        _XML_OBJECT_ATTRIBUTE_ROUTES[xml_class, item] = found
+        return found
+
+
+def _clone_child_container(template, parent=None):
+    # Same result as copy.copy(template) without deep-copying xsd trees (they are never changed) and without validating
+    # again what is already validated in the template. The private state copied here is the one of the musicxml version
+    # pinned in setup.py and requirements.txt. test_xmlwrapper compares clones with freshly built elements of all xml
+    # classes used in musicscore and must pass again before the pin is changed.
+    template_content = template._content
+    content = template_content.__class__.__new__(template_content.__class__)
+    content.__dict__.update(template_content.__dict__)
+    if content.__class__ is XSDElement:
+        content._xml_elements = []
+    elif isinstance(content, XSDGroup):
+        # like XSDGroup.__copy__()
+        content._sequence = template_content.sequence
+        content.XSD_TREE = template_content.XSD_TREE
+    copied = XMLChildContainer.__new__(XMLChildContainer)
+    copied.__dict__.update(_parent=parent, _children=[], _traversed=None, _is_leaf=True, _iterated_leaves=None,
+                           _reversed_path_to_root=None, _content=content, _chosen_child=None,
+                           _required_element_names=None, _requirements_fulfilled=None,
+                           min_occurrences=template.min_occurrences, max_occurrences=template.max_occurrences,
+                           _force_validate=None, _parent_xml_element=None)
+    content.parent_container = copied
+    if template._children:
+        copied._children = [_clone_child_container(child, copied) for child in template._children]
+        copied._is_leaf = False
+    return copied
+
+
+def _create_xml_element(xml_class, *args, **kwargs):
+    """
+    Creates an xml element like ``xml_class(*args, **kwargs)``. Its child container tree is cloned from musicxml's prepared
+    container of xml_class's type instead of being copied.
+    """
+
+    def _create_child_container_tree():
+        try:
+            if element.TYPE.get_xsd_tree().is_complex_type:
+                element._child_container_tree = _clone_child_container(containers[element.TYPE.__name__])
+                element._child_container_tree._parent_xml_element = element
+        except KeyError:
+            pass
+
+    element = xml_class.__new__(xml_class)
+    element.__dict__['_create_child_container_tree'] = _create_child_container_tree
+    xml_class.__init__(element, *args, **kwargs)
+    del element.__dict__['_create_child_container_tree']
+    return element
+
+
 class XMLWrapper:
     """
     XMLWrapper contains an xml object at its core. It is the place where all the intuitive stuff is translated to attributes and children of
@@ -23,6 +103,18 @@ class XMLWrapper:
         """
         return self._xml_object
 
+    def _create_xml_object(self):
+        # Wrappers which create their xml object on first use (instead of in __init__) return it here.
+        return None
+
+    def _get_xml_object(self):
+        xml_object = self.__dict__.get('_xml_object')
+        if xml_object is None:
+            xml_object = self._create_xml_object()
+            if xml_object is not None:
+                self.__dict__['_xml_object'] = xml_object
+        return xml_object
+
     def to_string(self, *args, **kwargs) -> str:
         """
         :obj:`~musicscore.xmlwrapper.XMLWrapper` method
@@ -37,26 +129,29 @@ class XMLWrapper:
             raise ValueError(f'{self.__class__.__name__} has no xml object.')
 
     def __setattr__(self, key, value):
-        attributes = self._ATTRIBUTES
-        try:
-            if self._TREE_ATTRIBUTES:
-                attributes.union(self._TREE_ATTRIBUTES)
-        except AttributeError:
-            pass
-        if key[0] != '_' and ('_xml_object' in self.__dict__ and key not in attributes and key not in self.__dict__):
-            setattr(self._xml_object, key, value)
-        else:
+        if _is_local_attribute(self.__class__, key):
             super().__setattr__(key, value)
+        else:
+            xml_object = self._get_xml_object() if key not in self.__dict__ else None
+            if xml_object is not None:
+                setattr(xml_object, key, value)
+            else:
+                super().__setattr__(key, value)
 
     def __getattr__(self, item):
         if item == '_TREE_ATTRIBUTES':
             raise AttributeError
         if item == 'xml_object':
             return super().__getattribute__(item)
-        try:
-            return self._xml_object.__getattribute__(item)
-        except AttributeError:
+        xml_object = self._get_xml_object()
+        if item == '_xml_object' or xml_object is None:
+            return super().__getattribute__(item)
+        if _is_xml_object_attribute(xml_object.__class__, item):
             try:
-                return self._xml_object.__getattr__(item)
+                return xml_object.__getattribute__(item)
             except AttributeError:
-                return super().__getattribute__(item)
+                pass
+        try:
+            return xml_object.__getattr__(item)
+        except AttributeError:
+            return super().__getattribute__(item)